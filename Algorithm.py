@@ -2,26 +2,103 @@
 
 import Configuration
 from Schedule import Schedule
+from Chromosome import Chromosome
+from Checkpoint import Checkpoint
+from BatchFitness import BatchFitness
+from ParallelFitness import ParallelFitness
+from FitnessCache import FitnessCache
+from LocalSearch import LocalSearch
+from GraphSeeding import GraphSeeding
+from Profiler import Profiler
+from Telemetry import ConsoleSink, Diversity, OpenFileSink
+from Termination import CancelToken, Deadline, Stagnation, TargetQuality
+from Solver import Solver, SOLVERS, CreateSolver
 from Configuration import Configuration as ConfigurationClass
-import random
+from array import array
+import argparse
+import ast
+import contextlib
 import copy 
 import sys 
+import time
 
-class Algorithm:
+# Stand-in for a profiler phase when profiling is off
+_NOT_PROFILED = contextlib.nullcontext()
 
-    def __init__(self, config):
+class Algorithm(Solver):
+    """Genetic algorithm solver ('ga'): a population of Schedules bred with crossover and mutation."""
+
+    def __init__(self, config, seed=None, params=None, checkpoint=None):
         # --- AGGRESSIVE PARAMETERS (Optimized for Exploration) ---
         self.POP_SIZE = 250              
         self.MAX_GENERATIONS = 500       # Increased for deeper search to find 1.0 Hard Ratio
+        self.GOAL_FITNESS = 4.4
+        self.TIME_LIMIT = None           # Wall-clock budget of Run in seconds
+        self.STAGNATION_LIMIT = None     # Stop after this many generations without a better best fitness
+        self.TARGET_HARD_RATIO = None    # Stop once the best schedule reaches this hard ratio...
+        self.SOFT_TOLERANCE = 0.0        # ...with a soft score within this of the maximum (3.5)
+        self.CANCEL_TOKEN = None         # Anything with is_set() (e.g. threading.Event); stops the run once set
         self.CROSSOVER_POINTS = 2
         self.MUTATION_SIZE = 8           
         self.CROSSOVER_PROB = 0.85
         self.MUTATION_PROB = 0.80        
+        self.UNIFORM_MUTATION_PROB = 0.2 # Otherwise mutation moves clashing classes into free slots
+        self.ADAPTIVE_RATES = False      # Adapt mutation size and mutation/crossover probability every generation
+        self.ADAPTIVE_SUCCESS_RATE = 0.05 # Mutation size grows while more mutated offspring than this beat their parent, else shrinks
+        self.ADAPTIVE_FACTOR = 1.2       # Mutation size is multiplied or divided by this per generation
+        self.ADAPTIVE_MUTATION_SIZE = (2, 32) # Bounds of the adapted mutation size (starts at twice MUTATION_SIZE)
+        self.ADAPTIVE_DIVERSITY_MIN = 0.1 # Below this diversity mutation probability rises and crossover probability falls
+        self.SEEDING = "random"          # Initial population: 'random' or 'dsatur' (constructive: near-feasible, but low soft score)
+        self.DELTA_EVALUATION = False    # Re-score only moved classes (same fitness, less work)
+        self.BATCH_EVALUATION = False    # Score the whole population at once with NumPy
+        self.WORKERS = 0                 # >1: score offspring in a process pool of this size
+        self.FITNESS_CACHE_SIZE = 0      # >0: LRU cache of fitness by chromosome content
+        self.LOCAL_SEARCH = None         # 'elites': also hill-climb the top individuals every generation; 'end': final best only
+        self.LOCAL_SEARCH_ELITES = 5     # Individuals improved per generation in 'elites' mode
+        self.LOCAL_SEARCH_MOVES = 100    # Moves tried per improved individual and generation
+        self.LOCAL_SEARCH_FINAL_MOVES = 5000 # Moves tried on the final best schedule (both modes)
+        self.PROFILE = False             # Time each GA phase (selection, copy, crossover, mutation, fitness, ...)
+        self.PROFILE_FILE = "profile.json" # Where Run writes the phase timings when PROFILE is on (None: not written)
+        self.TELEMETRY_CONSOLE = True    # Print the 'Generation N: Fittest Score' line per record
+        self.TELEMETRY_FILE = None       # .jsonl or .csv file receiving the per-generation records
+        self.TELEMETRY_INTERVAL = 1      # Generations between records (the final generation is always recorded)
+        self.CHECKPOINT_FILE = None      # Run saves its state here (see Checkpoint, Resume); None: no checkpoints
+        self.CHECKPOINT_INTERVAL = 25    # Generations between checkpoints (the final generation is always saved)
         # -----------------------------------------------------------
         
-        self.config = config
+        # Overrides for the parameters above, applied before the population is built
+        self._apply_params(params)
+        
+        if self.LOCAL_SEARCH not in (None, "elites", "end"):
+            raise ValueError(f"Unknown local search mode: {self.LOCAL_SEARCH}")
+        if self.SEEDING not in ("random", "dsatur"):
+            raise ValueError(f"Unknown seeding mode: {self.SEEDING}")
+        
+        # Own RNG per solve (see Solver); evaluation mode does not affect results.
+        # evaluations excludes clean individuals and cache hits.
+        super().__init__(config, seed)
         self.population = []
-        self.bestSchedule = None 
+        self.generation = 0              # Generations evolved so far (Run continues from here)
+        self.elapsed = 0.0               # Seconds spent in Run up to the last checkpoint, across resumes
+        self._batch_fitness = None
+        self._parallel_fitness = None
+        self.fitness_cache = FitnessCache(self.FITNESS_CACHE_SIZE) if self.FITNESS_CACHE_SIZE > 0 else None
+        self.local_search = LocalSearch(self.config, self.rng) if self.LOCAL_SEARCH else None
+        self.profiler = Profiler() if self.PROFILE else None
+        self.telemetry_sinks = []        # Extra sinks added with AddTelemetrySink
+        self._open_sinks = []            # Sinks of the current Run, closed by _finish
+        self.termination_policies = []   # Extra policies added with AddTerminationPolicy
+        
+        # Current operator rates; fixed unless ADAPTIVE_RATES (see _adapt_rates)
+        self.mutation_size = self.MUTATION_SIZE
+        self.mutation_prob = self.MUTATION_PROB
+        self.crossover_prob = self.CROSSOVER_PROB
+        self.success_rate = None         # Share of last generation's mutated offspring that beat their parent
+        self.diversity = None            # Population diversity after the last adaptation
+        self._mutated = []               # (offspring, parent fitness) of this generation
+        if self.ADAPTIVE_RATES:
+            low, high = self.ADAPTIVE_MUTATION_SIZE
+            self.mutation_size = min(high, max(low, 2 * self.MUTATION_SIZE))
         
         # Ensure Schedule class has necessary constants or assume defaults 
         if not hasattr(Schedule, 'DAY_HOURS'):
@@ -33,32 +110,148 @@ class Algorithm:
 
         # self._debug_config_check() was removed to clean up startup output
 
-        self._initialize_population()
+        if checkpoint is not None:
+            self._restore_checkpoint(checkpoint)
+        else:
+            self._initialize_population()
         
     # The _debug_config_check method has been removed.
 
-    def _initialize_population(self):
-        
-        prototype = Schedule(
+    def _make_prototype(self):
+        return Schedule(
             self.CROSSOVER_POINTS, 
             self.MUTATION_SIZE, 
             self.CROSSOVER_PROB, 
-            self.MUTATION_PROB
+            self.MUTATION_PROB,
+            self.DELTA_EVALUATION,
+            self.UNIFORM_MUTATION_PROB,
+            config=self.config,
+            rng=self.rng
         )
 
-        for _ in range(self.POP_SIZE):
-            new_schedule = prototype.MakeNewFromPrototype()
-            self.population.append(new_schedule)
+    def _initialize_population(self):
+        
+        prototype = self._make_prototype()
+
+        with self._phase("initialization"):
+            seeding = GraphSeeding(self.config, prototype.GetFitnessTables()) if self.SEEDING == "dsatur" else None
+
+            for _ in range(self.POP_SIZE):
+                if seeding is not None:
+                    new_schedule = prototype.MakeSeededFromPrototype(seeding)
+                else:
+                    new_schedule = prototype.MakeNewFromPrototype()
+                self.population.append(new_schedule)
 
         self._evaluate_population()
 
     def _evaluate_population(self):
-        for schedule in self.population:
-            schedule.CalculateFitness() 
+        """
+        Scores every individual whose genes changed since its last evaluation (elites and
+        unmodified copies keep their fitness), then updates bestSchedule.
+        """
+        with self._phase("fitness"):
+            pending = [s for s in self.population if s.IsDirty()]
+            if self.fitness_cache is not None:
+                pending = [s for s in pending if not self.fitness_cache.Lookup(s)]
             
+            if pending:
+                if self.BATCH_EVALUATION:
+                    self._get_batch_fitness().Evaluate(pending)
+                elif self.WORKERS > 1:
+                    self._get_parallel_fitness().Evaluate(pending)
+                else:
+                    for schedule in pending:
+                        schedule.CalculateFitness()
+                self.evaluations += len(pending)
+                
+                if self.fitness_cache is not None:
+                    for schedule in pending:
+                        self.fitness_cache.Store(schedule)
+        
+        for schedule in self.population:
             if self.bestSchedule is None or schedule.fitness > self.bestSchedule.fitness:
-                self.bestSchedule = copy.deepcopy(schedule)
+                with self._phase("best_copy"):
+                    self.bestSchedule = copy.deepcopy(schedule)
+
+
+    def _get_batch_fitness(self):
+        tables = self.population[0].GetFitnessTables()
+        if self._batch_fitness is None or self._batch_fitness.tables is not tables:
+            self._batch_fitness = BatchFitness(tables)
+        return self._batch_fitness
+
+    def _get_parallel_fitness(self):
+        tables = self.population[0].GetFitnessTables()
+        pool = self._parallel_fitness
+        if pool is None or pool.tables is not tables or pool.workers != self.WORKERS:
+            if pool is not None:
+                pool.Shutdown()
+            self._parallel_fitness = ParallelFitness(tables, self.WORKERS)
+        return self._parallel_fitness
+
+    def Shutdown(self):
+        """Stops the worker processes of the parallel evaluation mode, if any."""
+        if self._parallel_fitness is not None:
+            self._parallel_fitness.Shutdown()
+            self._parallel_fitness = None
 
+    def _phase(self, name):
+        """Times a block under name when PROFILE is on (see Profiler)."""
+        return self.profiler.Phase(name) if self.profiler is not None else _NOT_PROFILED
+
+    def GetProfile(self):
+        """Phase timings so far (Profiler.GetReport plus evaluations), or None if PROFILE is off."""
+        if self.profiler is None:
+            return None
+        return {"solver": "ga", "evaluations": self.evaluations, **self.profiler.GetReport()}
+
+    def AddTelemetrySink(self, sink):
+        """Also sends the per-generation records of the next Run to sink (closed when Run ends)."""
+        self.telemetry_sinks.append(sink)
+
+    def AddTerminationPolicy(self, policy):
+        """Also lets policy (see Termination.TerminationPolicy) end the next Run early."""
+        self.termination_policies.append(policy)
+
+    def _get_termination_policies(self):
+        """The policies enabled by the parameters, then the added ones."""
+        policies = []
+        if self.TIME_LIMIT is not None:
+            policies.append(Deadline(self.TIME_LIMIT))
+        if self.STAGNATION_LIMIT is not None:
+            policies.append(Stagnation(self.STAGNATION_LIMIT))
+        if self.TARGET_HARD_RATIO is not None:
+            policies.append(TargetQuality(self.TARGET_HARD_RATIO, self.SOFT_TOLERANCE))
+        if self.CANCEL_TOKEN is not None:
+            policies.append(CancelToken(self.CANCEL_TOKEN))
+        return policies + self.termination_policies
+
+    def _telemetry_record(self, generation, elapsed, evals_per_sec):
+        """Per-generation record (see Telemetry.FIELDS); penalties and hard ratio are the best schedule's."""
+        best = self.bestSchedule
+        fitness = [s.fitness for s in self.population]
+        return {
+            "generation": generation,
+            "elapsed": elapsed,
+            "evaluations": self.evaluations,
+            "evals_per_sec": evals_per_sec,
+            "best_fitness": best.fitness,
+            "mean_fitness": sum(fitness) / len(fitness),
+            "worst_fitness": min(fitness),
+            "hard_ratio": best.hard_ratio,
+            "prof_penalty": best.prof_penalty,
+            "gap_penalty": best.gap_penalty,
+            "consecutive_penalty": best.consecutive_penalty,
+            "lunch_penalty": best.lunch_penalty,
+            "late_long_penalty": best.late_long_class_penalty,
+            "same_subject_penalty": best.same_subject_consecutive_penalty,
+            "diversity": self.diversity if self.ADAPTIVE_RATES else Diversity(self.population, best),
+            "mutation_size": round(self.mutation_size),
+            "mutation_prob": self.mutation_prob,
+            "crossover_prob": self.crossover_prob,
+            "success_rate": self.success_rate,
+        }
 
     def Crossover(self, parent1, parent2):
         return parent1.Crossover(parent2)
@@ -66,135 +259,301 @@ class Algorithm:
     def Mutation(self, schedule):
         schedule.Mutation()
 
-    def Run(self):
-        
-        GOAL_FITNESS = 4.4 
+    def NextGeneration(self):
+        """Breeds and scores one generation (used by Run and by the island model)."""
+        with self._phase("sort"):
+            self.population.sort(key=lambda s: s.fitness, reverse=True)
         
-        print("--- Starting Genetic Algorithm ---")
+        # Memetic stage: hill-climb the fittest individuals before they are kept and bred
+        if self.LOCAL_SEARCH == "elites":
+            with self._phase("local_search"):
+                self._improve_elites()
         
+        # Elitism: Keep the top 10%
+        elite_count = int(self.POP_SIZE * 0.1)
+        new_population = self.population[:elite_count] 
 
-        for generation in range(1, self.MAX_GENERATIONS + 1):
-            
-            self.population.sort(key=lambda s: s.fitness, reverse=True)
+        while len(new_population) < self.POP_SIZE:
             
-            # Elitism: Keep the top 10%
-            elite_count = int(self.POP_SIZE * 0.1)
-            new_population = self.population[:elite_count] 
-
-            while len(new_population) < self.POP_SIZE:
+            # Truncation Selection: Select parents from the top 50%
+            selection_pool = self.population[:self.POP_SIZE // 2]
+            if not selection_pool: 
+                break
                 
-                # Truncation Selection: Select parents from the top 50%
-                selection_pool = self.population[:self.POP_SIZE // 2]
-                if not selection_pool: 
-                    break
-                    
-                parent1 = random.choice(selection_pool)
-                parent2 = random.choice(selection_pool)
+            with self._phase("selection"):
+                parent1 = self.rng.choice(selection_pool)
+                parent2 = self.rng.choice(selection_pool)
 
+            with self._phase("copy"):
                 offspring = parent1.copy() 
-                if random.random() < self.CROSSOVER_PROB:
+            parent_fitness = parent1.fitness
+            if self.rng.random() < self.crossover_prob:
+                with self._phase("crossover"):
                     offspring = self.Crossover(parent1, parent2)
-                
-                if random.random() < self.MUTATION_PROB:
+                parent_fitness = max(parent_fitness, parent2.fitness)
+            
+            if self.rng.random() < self.mutation_prob:
+                with self._phase("mutation"):
+                    if self.ADAPTIVE_RATES:
+                        offspring.mutation_size = round(self.mutation_size)
+                        self._mutated.append((offspring, parent_fitness))
                     self.Mutation(offspring)
-                        
-                offspring.CalculateFitness() 
-                new_population.append(offspring)
+                    
+            # Offspring are scored together in _evaluate_population
+            new_population.append(offspring)
 
-            self.population = new_population
-            self._evaluate_population() 
-            
-            # Print generation status
-            print(f"Generation {generation}: Fittest Score = {self.bestSchedule.fitness:.4f}")
+        self.population = new_population
+        self._evaluate_population() 
+        if self.ADAPTIVE_RATES:
+            with self._phase("adaptation"):
+                self._adapt_rates()
 
-            if self.bestSchedule.fitness >= GOAL_FITNESS: 
-                     print("\n--- Goal Schedule Found! ---")
-                     self._print_best_schedule()
-                     return copy.deepcopy(self.bestSchedule)
+    def _adapt_rates(self):
+        """
+        Improvement rate drives the step size: mutation size grows by ADAPTIVE_FACTOR while more than
+        ADAPTIVE_SUCCESS_RATE of the mutated offspring beat their (better) parent and shrinks otherwise,
+        so the search takes large steps early and fine ones near convergence. Diversity drives the
+        probabilities: below ADAPTIVE_DIVERSITY_MIN mutation rises towards 1.0 and crossover (of
+        near-identical parents) falls towards 0.5; otherwise both return to the configured values.
+        """
+        if self._mutated:
+            improved = sum(1 for offspring, parent_fitness in self._mutated if offspring.fitness > parent_fitness)
+            self.success_rate = improved / len(self._mutated)
+            factor = self.ADAPTIVE_FACTOR if self.success_rate > self.ADAPTIVE_SUCCESS_RATE else 1 / self.ADAPTIVE_FACTOR
+            low, high = self.ADAPTIVE_MUTATION_SIZE
+            self.mutation_size = min(high, max(low, self.mutation_size * factor))
+        self._mutated = []
 
+        self.diversity = Diversity(self.population, self.bestSchedule)
+        if self.diversity < self.ADAPTIVE_DIVERSITY_MIN:
+            self.mutation_prob = min(1.0, self.mutation_prob + 0.05)
+            self.crossover_prob = max(0.5, self.crossover_prob - 0.05)
+        else:
+            self.mutation_prob = max(self.MUTATION_PROB, self.mutation_prob - 0.05)
+            self.crossover_prob = min(self.CROSSOVER_PROB, self.crossover_prob + 0.05)
 
-        print("\n--- Algorithm Finished (Max Generations Reached) ---")
-        self.bestSchedule.CalculateFitness() 
-        self._print_best_schedule()
+    def _improve_elites(self):
+        for i in range(min(self.LOCAL_SEARCH_ELITES, len(self.population))):
+            improved = self.local_search.Improve(self.population[i], self.LOCAL_SEARCH_MOVES)
+            self.population[i] = improved
+            if improved.fitness > self.bestSchedule.fitness:
+                self.bestSchedule = copy.deepcopy(improved)
+
+    def Immigrate(self, schedules):
+        """
+        Replaces the weakest individuals with copies of the given (scored) schedules. The copies
+        draw from this run's rng, so a seeded run stays reproducible.
+        """
+        if not schedules:
+            return
+        self.population.sort(key=lambda s: s.fitness, reverse=True)
+        count = min(len(schedules), len(self.population))
+        self.population[-count:] = [s.copy() for s in schedules[:count]]
         
-        return copy.deepcopy(self.bestSchedule)
+        for schedule in self.population[-count:]:
+            schedule.rng = self.rng
+            if self.bestSchedule is None or schedule.fitness > self.bestSchedule.fitness:
+                self.bestSchedule = copy.deepcopy(schedule)
 
+    def GetIterationLimit(self):
+        return self.MAX_GENERATIONS
 
-    def _print_best_schedule(self):
-        if self.bestSchedule is None:
-            print("No schedule found.")
-            return
+    def GetCheckpoint(self):
+        """
+        Everything needed to continue this run exactly: parameters, generation, evaluations, RNG
+        state, population genes (one block per individual) with their fitness records, the best
+        schedule and the fitness cache. CANCEL_TOKEN and added sinks/policies are not saved.
+        """
+        genes = array('i')
+        for schedule in self.population:
+            genes.extend(schedule.classes.genes)
+        return {
+            "solver": "ga",
+            "class_ids": list(self.config.GetClassIndex()[0]),
+            "params": {name: value for name, value in vars(self).items() if name.isupper() and name != "CANCEL_TOKEN"},
+            "generation": self.generation,
+            "elapsed": self.elapsed,
+            "evaluations": self.evaluations,
+            "rng_state": self.rng.getstate(),
+            "genes": genes,
+            "fitness_records": [s.GetFitnessRecord() for s in self.population],
+            "best_genes": self.bestSchedule.classes.genes,
+            "best_record": self.bestSchedule.GetFitnessRecord(),
+            "rates": (self.mutation_size, self.mutation_prob, self.crossover_prob, self.success_rate, self.diversity),
+            "fitness_cache": self.fitness_cache.GetState() if self.fitness_cache is not None else None,
+        }
 
-        # Ensure fitness calculation (and thus hard_ratio storage) is done once
-        self.bestSchedule.CalculateFitness() 
-        
-        print(f"\n--- Final Best Timetable (Fitness: {self.bestSchedule.fitness:.4f}) ---")
-        
-        # PRINT THE FINAL HARD CONSTRAINT SCORE
-        print(f"Hard Constraint Score (Ratio): {self.bestSchedule.hard_ratio:.4f} ({self.bestSchedule.total_hard_score:.1f}/{self.bestSchedule.max_hard_score:.1f})")
-        print("------------------------------------------------------------------")
-        
-        rooms = list(self.config.GetRooms().values()) 
-        num_rooms = self.config.GetNumberOfRooms()
-        
-        DAY_HOURS = Schedule.DAY_HOURS
-        START_HOUR = Schedule.START_CLOCK_HOUR 
-        DAYS_PER_WEEK = Schedule.DAYS_PER_WEEK
+    @classmethod
+    def Resume(cls, config, filename, params=None):
+        """Solver continuing the run saved in a checkpoint file; params override the saved parameters."""
+        checkpoint = Checkpoint.Read(filename)
+        if checkpoint.get("solver") != "ga":
+            raise ValueError(f"Not a genetic algorithm checkpoint: {filename}")
+        return cls(config, params={**checkpoint["params"], **(params or {})}, checkpoint=checkpoint)
+
+    def _restore_checkpoint(self, checkpoint):
+        """Rebuilds population and best schedule from their genes and fitness records (no re-evaluation)."""
+        class_ids, class_index = self.config.GetClassIndex()
+        if list(class_ids) != checkpoint["class_ids"]:
+            raise ValueError("Checkpoint was written for a different configuration")
+
+        prototype = self._make_prototype()
+        size = len(class_ids)
+        genes = checkpoint["genes"]
+
+        def rebuild(positions, record):
+            schedule = prototype.copy()
+            schedule.classes = Chromosome(class_ids, class_index, positions)
+            schedule.SetFitnessRecord(record)
+            return schedule
+
+        self.population = [rebuild(genes[i * size:(i + 1) * size], record)
+                           for i, record in enumerate(checkpoint["fitness_records"])]
+        self.bestSchedule = rebuild(array('i', checkpoint["best_genes"]), checkpoint["best_record"])
+        self.generation = checkpoint["generation"]
+        self.elapsed = checkpoint["elapsed"]
+        self.evaluations = checkpoint["evaluations"]
+        self.rng.setstate(checkpoint["rng_state"])
+        (self.mutation_size, self.mutation_prob, self.crossover_prob,
+         self.success_rate, self.diversity) = checkpoint["rates"]
+        if self.fitness_cache is not None and checkpoint.get("fitness_cache") is not None:
+            self.fitness_cache.SetState(checkpoint["fitness_cache"])
+
+    def Run(self, progress=None):
+        """
+        Evolves until GOAL_FITNESS, MAX_GENERATIONS, RequestStop() or a termination policy (TIME_LIMIT,
+        STAGNATION_LIMIT, TARGET_HARD_RATIO, CANCEL_TOKEN, AddTerminationPolicy) stops it. If given,
+        progress(generation, bestSchedule) is called after every generation, from the thread running the algorithm.
+        A resumed solver (Resume) continues after the saved generation, appending to TELEMETRY_FILE
+        (records after that generation are replaced) with elapsed times counted on; policies start afresh.
+        """
         
-        daySize = num_rooms * DAY_HOURS
+        print("--- Starting Genetic Algorithm ---")
         
-        if num_rooms == 0 or daySize == 0:
-            print("Cannot print schedule: No rooms or time slots available.")
-            return
-            
-        sorted_classes = sorted(self.bestSchedule.classes.items(), key=lambda item: item[1])
+        # Per-generation records go to the console line, the telemetry file and any added sinks
+        sinks = ([ConsoleSink()] if self.TELEMETRY_CONSOLE else []) + self.telemetry_sinks
+        if self.TELEMETRY_FILE:
+            sinks.append(OpenFileSink(self.TELEMETRY_FILE, resume_after=self.generation or None))
+        self._open_sinks = sinks
+        last_time = time.perf_counter()
+        start_time = last_time - self.elapsed
+        last_evaluations = self.evaluations
         
-        for class_id, pos in sorted_classes:
-            cc = self.config.GetCourseClasses().get(class_id)
-            if not cc: continue
-            
-            day = pos // daySize
-            time_room = pos % daySize
-            
-            if DAY_HOURS == 0: continue
-            room_index = time_room // DAY_HOURS
-            time = time_room % DAY_HOURS
-            
-            if room_index < len(rooms):
-                room = rooms[room_index]
-            else:
-                continue 
+        policies = self._get_termination_policies()
+        for policy in policies:
+            policy.Start()
+
+        for generation in range(self.generation + 1, self.MAX_GENERATIONS + 1):
             
-            day_name = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][day % DAYS_PER_WEEK]
-            start_clock_hour = START_HOUR + time
+            self.NextGeneration()
+            self.generation = generation
             
-            if start_clock_hour >= 12 and start_clock_hour < 13:
-                time_display = "12:00 PM"
-            elif start_clock_hour >= 13:
-                time_display = f"{start_clock_hour - 12}:00 PM"
-            else:
-                time_display = f"{start_clock_hour}:00 AM"
-
-            class_type = " (Lab)" if cc.IsLabRequired() else " (Theory)"
+            reason = None
+            for policy in policies:
+                reason = policy.Check(generation, self.bestSchedule)
+                if reason is not None:
+                    break
             
-            print(f"[{day_name}, {time_display}] R:{room.GetName()} | {cc.GetCourse().GetName()}{class_type} for {cc.GetGroup().GetName()} (Prof: {cc.GetProfessor().GetName()}, Duration: {cc.GetDuration()})")
+            last = (generation == self.MAX_GENERATIONS or self._stop_requested or reason is not None
+                    or self.bestSchedule.fitness >= self.GOAL_FITNESS)
+            if sinks and (generation % self.TELEMETRY_INTERVAL == 0 or last):
+                with self._phase("telemetry"):
+                    now = time.perf_counter()
+                    evals_per_sec = (self.evaluations - last_evaluations) / (now - last_time) if now > last_time else 0.0
+                    record = self._telemetry_record(generation, now - start_time, evals_per_sec)
+                    last_time, last_evaluations = now, self.evaluations
+                    for sink in sinks:
+                        sink.Write(record)
+            if self.CHECKPOINT_FILE and (generation % self.CHECKPOINT_INTERVAL == 0 or last):
+                with self._phase("checkpoint"):
+                    self.elapsed = time.perf_counter() - start_time
+                    Checkpoint.Write(self.GetCheckpoint(), self.CHECKPOINT_FILE)
+            if progress is not None:
+                progress(generation, self.bestSchedule)
+
+            if self.bestSchedule.fitness >= self.GOAL_FITNESS: 
+                     print("\n--- Goal Schedule Found! ---")
+                     return self._finish()
+
+            if self._stop_requested:
+                     self._stop_requested = False
+                     print("\n--- Algorithm Stopped (Stop Requested) ---")
+                     return self._finish()
+
+            if reason is not None:
+                     print(f"\n--- Algorithm Stopped ({reason}) ---")
+                     return self._finish()
+
+
+        print("\n--- Algorithm Finished (Max Generations Reached) ---")
+        return self._finish()
+
+    def _finish(self):
+        """Polishes the best schedule (local search on, goal not reached), prints it and returns a copy."""
+        self.Shutdown()
+        for sink in self._open_sinks:
+            sink.Close()
+        self._open_sinks = []
+        if self.local_search is not None and self.bestSchedule.fitness < self.GOAL_FITNESS:
+            with self._phase("local_search"):
+                self.bestSchedule = self.local_search.Improve(self.bestSchedule, self.LOCAL_SEARCH_FINAL_MOVES)
+        if self.profiler is not None and self.PROFILE_FILE:
+            Profiler.Write(self.GetProfile(), self.PROFILE_FILE)
+        return super()._finish()
+
+    def _print_statistics(self):
+        super()._print_statistics()
+        if self.local_search is not None:
+            print(f"Local Search: {self.local_search.moves_accepted} of {self.local_search.moves_evaluated} moves accepted")
+        if self.fitness_cache is not None:
+            stats = self.fitness_cache.Stats()
+            print(f"Fitness Cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.1%} hit rate)")
+        if self.profiler is not None:
+            for line in Profiler.FormatReport(self.profiler.GetReport()):
+                print(line)
+            if self.PROFILE_FILE:
+                print(f"Profile written to {self.PROFILE_FILE}")
 
 
 # --- Main Execution Block ---
 
+def _parse_param(text):
+    """'NAME=VALUE' -> (NAME, value); VALUE is a Python literal, or a plain string (e.g. dsatur)."""
+    name, _, value = text.partition('=')
+    try:
+        return name, ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return name, value
+
 if __name__ == "__main__":
     
+    parser = argparse.ArgumentParser(description="Generate a timetable for a configuration file.")
+    parser.add_argument('config', nargs='?', default='input.cfg', help="configuration file (default: input.cfg)")
+    parser.add_argument('--solver', choices=sorted(SOLVERS), default='ga',
+                        help="search engine: " + ", ".join(f"{k} = {v}" for k, v in SOLVERS.items()))
+    parser.add_argument('--seed', type=int, default=None, help="random seed for a reproducible run")
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUE',
+                        help="solver parameter override, e.g. --param MAX_GENERATIONS=100 (repeatable)")
+    parser.add_argument('--resume', default=None, metavar='CHECKPOINT',
+                        help="continue a genetic algorithm run from its checkpoint file (see CHECKPOINT_FILE)")
+    args = parser.parse_args()
+    if args.resume and args.solver != 'ga':
+        parser.error("--resume is only supported by the genetic algorithm (--solver ga)")
+    
     try:
-        filename = 'input.cfg'
+        filename = args.config
         # Instantiate ConfigurationClass. 
         config = ConfigurationClass(filename) 
+        config.ReadConfiguration(filename)
         
-        # We assume the constructor handles reading the file.
-        
-        ga = Algorithm(config)
-        ga.Run() 
+        params = dict(_parse_param(p) for p in args.param)
+        if args.resume:
+            solver = Algorithm.Resume(config, args.resume, params)
+        else:
+            solver = CreateSolver(args.solver, config, seed=args.seed, params=params)
+        solver.Run() 
         
     except FileNotFoundError:
         print(f"Error: {filename} not found. Make sure it's in the correct directory.")
     except Exception as e:
-        print(f"\nCRITICAL CRASH ERROR: The genetic algorithm failed. Details: {e}")
+        print(f"\nCRITICAL CRASH ERROR: The {SOLVERS[args.solver]} failed. Details: {e}")
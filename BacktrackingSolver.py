@@ -0,0 +1,483 @@
+# BacktrackingSolver.py
+
+from Schedule import Schedule
+from Solver import Solver
+import random
+import sys
+import time
+
+
+class _SearchStopped(Exception):
+    """Unwinds the search on the node or time limit, or on RequestStop()."""
+
+
+class BacktrackingSolver(Solver):
+    """
+    Complete search for a timetable meeting every hard constraint (solver 'exact').
+
+    Variables are classes; values are their legal positions (placement domain on every day),
+    so HC1-HC3 hold by construction. HC4 is kept by forward checking on per-day busy-hour
+    bitmasks of rooms, professors and groups: placing a class removes the values of the unplaced
+    classes that would share one of its hours, i.e. of its conflict-graph neighbours (same
+    professor or group, any room that day) and of the classes that can use its room. Domains
+    are never enumerated; only the number of values left per class is kept. The next class is
+    the one with the fewest values left (ties: highest degree in the conflict graph), and a
+    dead end backjumps to the latest placement involved in it (conflict-directed backjumping)
+    instead of the previous one.
+
+    Before searching, resource counting rejects over-booked instances outright: a professor,
+    group or set of rooms needing more hours than the week offers it. During the search,
+    interchangeable classes (same professor, group, duration and legal positions) are placed in
+    increasing time order, and of several interchangeable rooms that are still empty only one
+    is tried, so symmetric copies of a dead end are not searched again.
+
+    Run() returns a Schedule with hard ratio 1.0. If the counting check fails or the whole search
+    space is exhausted there is no such timetable: infeasible is set (infeasible_reason names the
+    over-booked resource, if any) and the deepest partial assignment is returned.
+    """
+
+    def __init__(self, config, seed=None, params=None):
+        self.MAX_NODES = 1000000         # Placements tried before giving up (None: no limit)
+        self.TIME_LIMIT = None           # Wall-clock budget in seconds
+        self.SHUFFLE_VALUES = True       # Per-seed order of days and rooms; False: ascending positions
+        self.SYMMETRY_BREAKING = True    # Skip timetables that only swap interchangeable classes or rooms
+        self.REPORT_INTERVAL = 10000     # Placements between status lines / progress callbacks
+
+        self._apply_params(params)
+
+        super().__init__(config, seed)
+        self.nodes = 0
+        self.backjumps = 0
+        self.infeasible = False
+        self.infeasible_reason = None
+        self._prototype = Schedule(0, 1, 0.0, 0.0, config=self.config, rng=self.rng)
+        self._build_domains()
+        self._build_symmetries()
+
+    def _build_domains(self):
+        """
+        Per class: compatible rooms, legal start hours (as a bitmask), the hours those starts can
+        cover and domain size; per room: the classes that can use it. Classes with the same room
+        list share one member list, so memory stays linear in the number of classes.
+        """
+        t = self._prototype.GetFitnessTables()
+        graph = self.config.GetConflictGraph()
+
+        self.tables = t
+        self.num_classes = n = len(t.class_ids)
+        self.neighbours = graph.neighbours
+        self.degree = [graph.GetDegree(j) for j in range(n)]
+        self.rooms = []                                      # [class] -> compatible room indices
+        self.start_mask = []                                 # [class] -> bit s set: may start at hour s
+        self.cover = []                                      # [class] -> bit h set: some start uses hour h
+        self.domain_size = []                                # [class] -> legal positions over the week
+        self.room_sets = members = {}                        # room indices -> classes using exactly those
+
+        for j, class_id in enumerate(t.class_ids):
+            room_indices, start_hours = self.config.GetPlacementDomain(
+                class_id, self._prototype.DAY_HOURS, self._prototype.START_CLOCK_HOUR
+            )
+            room_indices = tuple(room_indices)
+            mask = 0
+            cover = 0
+            for start_time in start_hours:
+                mask |= 1 << start_time
+                cover |= ((1 << t.duration[j]) - 1) << start_time
+            self.rooms.append(room_indices)
+            self.start_mask.append(mask)
+            self.cover.append(cover)
+            self.domain_size.append(t.days * len(room_indices) * len(start_hours))
+            members.setdefault(room_indices, []).append(j)
+
+        self.room_users = [[] for _ in range(t.num_rooms)]  # [room] -> member lists of classes that can use it
+        for room_indices, classes in members.items():
+            for room_index in room_indices:
+                self.room_users[room_index].append(classes)
+
+    def _build_symmetries(self):
+        """
+        Chains of interchangeable classes (same professor, group, duration, rooms and start hours),
+        and a kind per room: rooms usable by the same classes share a kind. Such classes share a
+        group, so they never start at the same day and hour; ordering them by that keeps one of
+        every permutation, and swapping two rooms of a kind in a timetable does not change it.
+        """
+        t = self.tables
+        n = self.num_classes
+        self.chain = [None] * n                              # [class] -> its chain, None if alone
+        self.chain_index = [0] * n                           # [class] -> index in the chain
+        if self.SYMMETRY_BREAKING:
+            chains = {}
+            for j in range(n):
+                key = (t.prof[j], t.group[j], t.duration[j], self.rooms[j], self.start_mask[j])
+                chains.setdefault(key, []).append(j)
+            for members in chains.values():
+                if len(members) > 1:
+                    members = tuple(members)
+                    for index, j in enumerate(members):
+                        self.chain[j] = members
+                        self.chain_index[j] = index
+
+        users = [[] for _ in range(t.num_rooms)]
+        for room_indices in self.room_sets:
+            for room_index in room_indices:
+                users[room_index].append(room_indices)
+        kinds = {}
+        self.room_kind = [kinds.setdefault(tuple(room_sets), len(kinds)) for room_sets in users]
+
+    def _check_resources(self):
+        """
+        Necessary conditions for a timetable: every class has a legal position, and no professor,
+        group or set of rooms (with the classes that can only use those rooms) is booked for more
+        hours than the week offers in the hours its classes can cover. Returns the first
+        violation as a message, or None. Runs in time linear in the number of classes.
+        """
+        t = self.tables
+        course_classes = self.config.GetCourseClasses()
+        for j in range(self.num_classes):
+            if not self.domain_size[j]:
+                return f"class {t.class_ids[j]} has no legal position"
+
+        for label, entity, get_name in (("professor", t.prof, lambda cc: cc.GetProfessor().GetName()),
+                                        ("group", t.group, lambda cc: cc.GetGroup().GetName())):
+            demand = {}
+            cover = {}
+            first = {}
+            for j in range(self.num_classes):
+                e = entity[j]
+                demand[e] = demand.get(e, 0) + t.duration[j]
+                cover[e] = cover.get(e, 0) | self.cover[j]
+                first.setdefault(e, j)
+            for e, hours in demand.items():
+                available = t.days * bin(cover[e]).count("1")
+                if hours > available:
+                    name = get_name(course_classes[t.class_ids[first[e]]])
+                    return f"{label} {name} needs {hours} hours a week, its classes fit in {available}"
+
+        room_names = [room.GetName() for room in self.config.GetRooms().values()]
+        for room_indices in self.room_sets:
+            rooms = set(room_indices)
+            hours = 0
+            cover = 0
+            for other, classes in self.room_sets.items():
+                if rooms.issuperset(other):
+                    for j in classes:
+                        hours += t.duration[j]
+                        cover |= self.cover[j]
+            available = t.days * len(rooms) * bin(cover).count("1")
+            if hours > available:
+                names = ", ".join(room_names[room_index] for room_index in room_indices)
+                return f"rooms {names} are needed for {hours} hours a week, they offer {available}"
+        return None
+
+    def GetIterationLimit(self):
+        return self.MAX_NODES or 0
+
+    def Run(self, progress=None):
+        """
+        Searches until a feasible timetable is found, the search space is exhausted, or the
+        node/time limit or RequestStop() ends it. If given, progress(nodes, bestSchedule) is
+        called every REPORT_INTERVAL placements with the deepest partial assignment so far.
+        """
+        print("--- Starting Exact Search ---")
+        n = self.num_classes
+        t = self.tables
+        self._progress = progress
+        self._start_time = time.time()
+        self._value = [-1] * n                                     # Position per class, -1 if unplaced
+        self._live = list(self.domain_size)                        # Values left per class
+        self._past_fc = [[] for _ in range(n)]                      # Depths that removed values of the class
+        self._order_seed = [self.rng.getrandbits(32) for _ in range(n)]
+        self._room_busy = [0] * (t.num_rooms * t.days)              # Busy-hour bitmasks, [entity * days + day]
+        self._prof_busy = [0] * (t.num_profs * t.days)
+        self._group_busy = [0] * (t.num_groups * t.days)
+        self._room_load = [0] * t.num_rooms                         # Hours booked per room over the week
+        self._depth = [-1] * n                                      # Depth at which each class was placed
+        self._unplaced = set(range(n))
+        self._deepest = (-1, None)
+
+        # One stack frame per placed class
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 2 * n + 100))
+        try:
+            self.infeasible_reason = self._check_resources()
+            result = self._search(0) if self.infeasible_reason is None else set()
+        except _SearchStopped as stop:
+            print(f"\n--- Exact Search Stopped ({stop}) ---")
+        else:
+            if result is None:
+                print("\n--- Feasible Timetable Found! ---")
+                self._deepest = (n, list(self._value))
+            else:
+                self.infeasible = True
+                print(f"\n--- No Feasible Timetable Exists ({self.infeasible_reason or 'Search Space Exhausted'}) ---")
+
+        self.bestSchedule = self._make_schedule(self._deepest[1])
+        return self._finish()
+
+    def _values(self, j, after, before):
+        """
+        Free positions of class j in the order they are tried, earliest start hour first: packing
+        classes from the start of the day leaves contiguous free hours for long classes (random
+        start hours fragment the days and make dense instances thrash). Days and rooms are visited
+        in a per-seed order (days ascending for chained classes, which are placed in time order).
+        Only times (day * day_hours + start hour) strictly between after and
+        before are used, and of the empty rooms of one kind only the first. Lazy: the state below
+        is restored between the positions it yields.
+        """
+        t = self.tables
+        days = list(range(t.days))
+        rooms = list(self.rooms[j])
+        if self.SHUFFLE_VALUES:
+            order_rng = random.Random(self._order_seed[j])
+            if self.chain[j] is None:
+                order_rng.shuffle(days)
+            order_rng.shuffle(rooms)
+
+        duration = t.duration[j]
+        prof_base = t.prof[j] * t.days
+        group_base = t.group[j] * t.days
+        for day in days:
+            # Start hours inside the (after, before) time window on this day
+            window = self.start_mask[j]
+            first_time = day * t.day_hours
+            if after >= first_time:
+                window &= ~((1 << (after - first_time + 1)) - 1)
+            if before < first_time + t.day_hours:
+                window &= (1 << max(0, before - first_time)) - 1
+            if not window:
+                continue
+
+            busy = self._prof_busy[prof_base + day] | self._group_busy[group_base + day]
+            empty_kinds = set()
+            for room_index in rooms:
+                if not self._room_load[room_index] and self.SYMMETRY_BREAKING:
+                    kind = self.room_kind[room_index]
+                    if kind in empty_kinds:
+                        continue
+                    empty_kinds.add(kind)
+                free = window & ~self._blocked_starts(busy | self._room_busy[room_index * t.days + day], duration)
+                while free:
+                    start_time = (free & -free).bit_length() - 1
+                    free &= free - 1
+                    yield day * t.day_slots + room_index * t.day_hours + start_time
+
+    def _chain_bounds(self, j):
+        """
+        (after, before, bounding classes): the times class j must lie strictly between to keep its
+        chain in order, and the placed chain members that set them.
+        """
+        chain = self.chain[j]
+        after, before, bounding = -1, self.tables.days * self.tables.day_hours, []
+        if chain is None:
+            return after, before, bounding
+        index = self.chain_index[j]
+        for k in reversed(chain[:index]):
+            if self._value[k] >= 0:
+                after = self._time(self._value[k])
+                bounding.append(k)
+                break
+        for k in chain[index + 1:]:
+            if self._value[k] >= 0:
+                before = self._time(self._value[k])
+                bounding.append(k)
+                break
+        return after, before, bounding
+
+    def _time(self, pos):
+        """Day * day_hours + start hour of a position (its room left out)."""
+        t = self.tables
+        day, time_room = divmod(pos, t.day_slots)
+        return day * t.day_hours + time_room % t.day_hours
+
+    @staticmethod
+    def _blocked_starts(busy, duration):
+        """Bitmask of the start hours at which a class of duration would use a busy hour."""
+        blocked = busy
+        for shift in range(1, duration):
+            blocked |= busy >> shift
+        return blocked
+
+    def _search(self, depth):
+        """
+        Places the remaining classes. Returns None once every class is placed, otherwise the
+        conflict set: depths whose placements caused the dead end (empty: infeasible).
+        """
+        if depth > self._deepest[0]:
+            self._deepest = (depth, list(self._value))
+        if not self._unplaced:
+            return None
+
+        live = self._live
+        degree = self.degree
+        i = min(self._unplaced, key=lambda k: (live[k], -degree[k]))
+        self._unplaced.remove(i)
+        self._depth[i] = depth
+        after, before, bounding = self._chain_bounds(i)
+        conflict = set(self._depth[k] for k in bounding)
+
+        for pos in self._values(i, after, before):
+            self._tick()
+            wiped = self._forward_check(i, pos, depth)
+            if wiped is not None:
+                conflict.update(self._past_fc[wiped])
+                conflict.discard(depth)
+                self._restore(i, pos, depth, wiped)
+                continue
+
+            self._place(i, pos)
+            result = self._search(depth + 1)
+            if result is None:
+                return None
+            self._unplace(i, pos)
+            self._restore(i, pos, depth)
+            if result and max(result) == depth:
+                conflict.update(result)
+                conflict.discard(depth)
+                continue
+
+            # Backjump: this placement is not involved in the dead end below
+            self._value[i] = -1
+            self._unplaced.add(i)
+            return result
+
+        self._value[i] = -1
+        self._unplaced.add(i)
+        conflict.update(self._past_fc[i])
+        if max(conflict, default=-1) < depth - 1:
+            self.backjumps += 1
+        return conflict
+
+    def _forward_check(self, i, pos, depth):
+        """
+        Removes the values of unplaced classes that placing class i at pos rules out from their
+        live counts. Returns the class whose domain emptied (checking stops there), or None.
+        """
+        live = self._live
+        for k, count in self._removals(i, pos):
+            live[k] -= count
+            past_fc = self._past_fc[k]
+            if not past_fc or past_fc[-1] != depth:
+                past_fc.append(depth)
+            if live[k] == 0:
+                return k
+        return None
+
+    def _restore(self, i, pos, depth, wiped=None):
+        """
+        Undoes _forward_check(i, pos, depth) (once class i is unplaced again). The removals are
+        recomputed rather than stored: a stored list per frame would hold up to one entry per
+        class at every depth.
+        """
+        live = self._live
+        for k, count in self._removals(i, pos):
+            live[k] += count
+            past_fc = self._past_fc[k]
+            if past_fc and past_fc[-1] == depth:
+                past_fc.pop()
+            if k == wiped:
+                break
+
+    def _removals(self, i, pos):
+        """
+        Yields (class, values removed) for the unplaced classes that lose values if class i is
+        placed at pos, computed from the busy masks without that placement.
+        """
+        t = self.tables
+        D = t.days
+        day, time_room = divmod(pos, t.day_slots)
+        room_index, start_time = divmod(time_room, t.day_hours)
+        hours = ((1 << t.duration[i]) - 1) << start_time
+        room_busy, prof_busy, group_busy = self._room_busy, self._prof_busy, self._group_busy
+        unplaced = self._unplaced
+
+        # Same professor or group: the hours are lost in every room of the day
+        neighbours = self.neighbours[i]
+        for k in neighbours:
+            if k not in unplaced:
+                continue
+            duration = t.duration[k]
+            busy = prof_busy[t.prof[k] * D + day] | group_busy[t.group[k] * D + day]
+            newly = self.start_mask[k] & self._blocked_starts(hours, duration) & ~self._blocked_starts(busy, duration)
+            if not newly:
+                continue
+            count = 0
+            for room in self.rooms[k]:
+                count += bin(newly & ~self._blocked_starts(room_busy[room * D + day], duration)).count("1")
+            if count:
+                yield k, count
+
+        # Any other class that can use the room: the hours are lost in that room only
+        room_hours = room_busy[room_index * D + day]
+        neighbours = set(neighbours)
+        for classes in self.room_users[room_index]:
+            for k in classes:
+                if k not in unplaced or k == i or k in neighbours:
+                    continue
+                duration = t.duration[k]
+                busy = room_hours | prof_busy[t.prof[k] * D + day] | group_busy[t.group[k] * D + day]
+                newly = self.start_mask[k] & self._blocked_starts(hours, duration) & ~self._blocked_starts(busy, duration)
+                if newly:
+                    yield k, bin(newly).count("1")
+
+    def _place(self, i, pos):
+        """Assigns class i and marks its hours busy (after a successful _forward_check)."""
+        t = self.tables
+        D = t.days
+        day, time_room = divmod(pos, t.day_slots)
+        room_index, start_time = divmod(time_room, t.day_hours)
+        hours = ((1 << t.duration[i]) - 1) << start_time
+        self._value[i] = pos
+        self._room_load[room_index] += t.duration[i]
+        self._room_busy[room_index * D + day] |= hours
+        self._prof_busy[t.prof[i] * D + day] |= hours
+        self._group_busy[t.group[i] * D + day] |= hours
+
+    def _unplace(self, i, pos):
+        t = self.tables
+        D = t.days
+        day, time_room = divmod(pos, t.day_slots)
+        room_index, start_time = divmod(time_room, t.day_hours)
+        hours = ((1 << t.duration[i]) - 1) << start_time
+        self._value[i] = -1
+        self._room_load[room_index] -= t.duration[i]
+        self._room_busy[room_index * D + day] &= ~hours
+        self._prof_busy[t.prof[i] * D + day] &= ~hours
+        self._group_busy[t.group[i] * D + day] &= ~hours
+
+    def _tick(self):
+        """Counts a placement; reports progress and enforces the limits."""
+        self.nodes += 1
+        if self.MAX_NODES is not None and self.nodes > self.MAX_NODES:
+            raise _SearchStopped("Node Limit Reached")
+        if self._stop_requested:
+            self._stop_requested = False
+            raise _SearchStopped("Stop Requested")
+        # A placement costs O(classes): on large instances REPORT_INTERVAL placements can take minutes
+        if self.TIME_LIMIT is not None and self.nodes % 100 == 0 and time.time() - self._start_time >= self.TIME_LIMIT:
+            raise _SearchStopped("Time Limit Reached")
+        if self.nodes % self.REPORT_INTERVAL == 0:
+            print(f"Node {self.nodes}: Deepest = {self._deepest[0]}/{self.num_classes} classes placed")
+            if self._progress is not None:
+                self.bestSchedule = self._make_schedule(self._deepest[1])
+                self._progress(self.nodes, self.bestSchedule)
+
+    def _make_schedule(self, values):
+        """Scored Schedule for an assignment; unplaced classes go to their first legal position."""
+        schedule = self._prototype.MakeNewFromPrototype()
+        genes = schedule.classes.genes
+        t = self.tables
+        for j in range(self.num_classes):
+            if values is not None and values[j] >= 0:
+                genes[j] = values[j]
+            elif self.domain_size[j]:
+                first_start = (self.start_mask[j] & -self.start_mask[j]).bit_length() - 1
+                genes[j] = self.rooms[j][0] * t.day_hours + first_start
+        schedule.MarkDirty()
+        schedule.CalculateFitness()
+        self.evaluations += 1
+        return schedule
+
+    def _print_statistics(self):
+        super()._print_statistics()
+        print(f"Exact Search: {self.nodes} placements, {self.backjumps} backjumps"
+              + (", proven infeasible" if self.infeasible else "")
+              + (f" ({self.infeasible_reason})" if self.infeasible_reason else ""))
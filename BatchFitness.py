@@ -0,0 +1,156 @@
+# BatchFitness.py
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional dependency: only needed for batch (whole-population) evaluation
+
+
+class BatchFitness:
+    """
+    Scores a whole population at once with NumPy. The population is encoded as a
+    (POP_SIZE x num_classes) matrix of positions; day, room and hour are decoded with
+    array arithmetic and the greedy booking loop runs once per class for all
+    individuals together. Results are identical to Schedule.CalculateFitness.
+    """
+
+    def __init__(self, tables):
+        if np is None:
+            raise ImportError("Batch fitness evaluation requires NumPy (pip install numpy).")
+
+        t = tables
+        self.tables = t
+        self.duration = np.array(t.duration, dtype=np.int64)
+        self.lab = np.array(t.lab, dtype=bool)
+        self.prof = np.array(t.prof, dtype=np.int64)
+        self.group = np.array(t.group, dtype=np.int64)
+        self.pair = np.array(t.pair, dtype=np.int64)
+        self.group_size = np.array(t.group_size, dtype=np.int64)
+        self.window_start = np.array(t.window_start, dtype=np.int64)
+        self.window_end = np.array(t.window_end, dtype=np.int64)
+        self.room_size = np.array(t.room_size, dtype=np.int64)
+        self.room_lab = np.array(t.room_lab, dtype=bool)
+
+    def Encode(self, schedules):
+        """Returns the (len(schedules) x num_classes) position matrix."""
+        buffer = b''.join(s.classes.genes.tobytes() for s in schedules)
+        return np.frombuffer(buffer, dtype=np.int32).reshape(len(schedules), -1).astype(np.int64)
+
+    def Evaluate(self, schedules):
+        """Scores every schedule in the list and stores the results on them."""
+        if not schedules:
+            return
+        records = self.EvaluateMatrix(self.Encode(schedules))
+        for schedule, record in zip(schedules, records):
+            schedule.SetFitnessRecord(record)
+
+    def EvaluateMatrix(self, positions):
+        """
+        Scores a position matrix. Returns one fitness record per row:
+        (total_hard_score, prof, gap, consecutive, lunch, late_long, same_subject, conflicts).
+        """
+        t = self.tables
+        H, D, R = t.day_hours, t.days, t.num_rooms
+        NP, NG, NK = t.num_profs, t.num_groups, t.num_pairs
+        pop_size, num_classes = positions.shape
+        rows_all = np.arange(pop_size)
+
+        day = positions // t.day_slots
+        time_room = positions % t.day_slots
+        room = time_room // H
+        start = time_room % H
+        end = start + self.duration
+
+        # HC1 / HC3 / HC2 (static, per gene)
+        valid_room = room < R
+        safe_room = np.where(valid_room, room, 0)
+        static_ok = (
+            valid_room
+            & (self.group_size <= self.room_size[safe_room])
+            & (self.lab == self.room_lab[safe_room])
+            & (end <= H)
+            & (start >= self.window_start)
+            & (end <= self.window_end)
+        )
+
+        cells = D * H
+        room_occ = np.zeros((pop_size, cells * R), dtype=bool)
+        prof_occ = np.zeros((pop_size, cells * NP), dtype=bool)
+        group_occ = np.zeros((pop_size, cells * NG), dtype=bool)
+        pair_occ = np.zeros((pop_size, cells * max(NK, 1)), dtype=bool)
+
+        ok = static_ok.copy()
+        first_booked = np.zeros((pop_size, num_classes), dtype=bool)
+
+        # HC4: greedy booking in configuration order, vectorized across individuals
+        for j in range(num_classes):
+            rows = rows_all[static_ok[:, j] & (day[:, j] < D)]
+            p, g, k = self.prof[j], self.group[j], self.pair[j]
+            for i in range(int(self.duration[j])):
+                if rows.size == 0:
+                    break
+                cell = day[rows, j] * H + start[rows, j] + i
+                room_slot = cell * R + room[rows, j]
+                prof_slot = cell * NP + p
+                group_slot = cell * NG + g
+
+                clash = room_occ[rows, room_slot] | prof_occ[rows, prof_slot] | group_occ[rows, group_slot]
+                ok[rows[clash], j] = False
+
+                keep = ~clash
+                rows = rows[keep]
+                room_occ[rows, room_slot[keep]] = True
+                prof_occ[rows, prof_slot[keep]] = True
+                group_occ[rows, group_slot[keep]] = True
+                if k >= 0:
+                    pair_occ[rows, cell[keep] * NK + k] = True
+                if i == 0:
+                    first_booked[rows, j] = True
+
+        total_hard = ok.sum(axis=1)
+
+        # --- Soft constraints from the occupancy planes ---
+        prof_hours = prof_occ.reshape(pop_size, D, H, NP)
+        group_hours = group_occ.reshape(pop_size, D, H, NG)
+
+        # SC1: professor hours above 5 per day
+        prof_count = prof_hours.sum(axis=2)
+        prof_penalty = np.maximum(prof_count - 5, 0).sum(axis=(1, 2))
+
+        # SC2: empty hours between a group's first and last class of the day
+        group_count = group_hours.sum(axis=2)
+        first = np.argmax(group_hours, axis=2)
+        last = H - 1 - np.argmax(group_hours[:, :, ::-1, :], axis=2)
+        gaps = np.where(group_count > 1, (last - first) - (group_count - 1), 0)
+        gap_penalty = gaps.sum(axis=(1, 2))
+
+        # SC3: professor hours beyond 3 in a row
+        if H > 3:
+            runs = prof_hours[:, :, 3:, :] & prof_hours[:, :, 2:-1, :] & prof_hours[:, :, 1:-2, :] & prof_hours[:, :, :-3, :]
+            consecutive_penalty = runs.sum(axis=(1, 2, 3))
+        else:
+            consecutive_penalty = np.zeros(pop_size, dtype=np.int64)
+
+        # SC4: booked hours in the lunch slot
+        if 0 <= t.lunch_slot < H:
+            lunch_penalty = room_occ.reshape(pop_size, D, H, R)[:, :, t.lunch_slot, :].sum(axis=(1, 2))
+        else:
+            lunch_penalty = np.zeros(pop_size, dtype=np.int64)
+
+        # SC5: long classes starting late
+        late_long = first_booked & (start >= t.late_start) & (self.duration > 1)
+        late_long_penalty = late_long.sum(axis=1)
+
+        # SC6: back-to-back 1-hour theory sessions of the same group and course
+        if NK:
+            pair_hours = pair_occ.reshape(pop_size, D, H, NK)
+            same_subject_penalty = (pair_hours[:, :, 1:, :] & pair_hours[:, :, :-1, :]).sum(axis=(1, 2, 3))
+        else:
+            same_subject_penalty = np.zeros(pop_size, dtype=np.int64)
+
+        return [
+            (int(total_hard[r]) * 5.0, int(prof_penalty[r]), int(gap_penalty[r]), int(consecutive_penalty[r]),
+             int(lunch_penalty[r]), int(late_long_penalty[r]), int(same_subject_penalty[r]),
+             tuple(np.flatnonzero(~ok[r]).tolist()))
+            for r in range(pop_size)
+        ]
@@ -0,0 +1,244 @@
+# Benchmark.py
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from Configuration import Configuration as ConfigurationClass
+from InstanceGenerator import InstanceGenerator
+from Parameters import ApplyParams
+from Schedule import Schedule
+from Solver import SOLVERS, CreateSolver
+
+
+class Benchmark:
+    """
+    Scaling benchmark on synthetic instances (InstanceGenerator) of SIZES classes. Per size it
+    measures:
+      - full and delta (one moved class) fitness evaluations per second,
+      - time until the solver's best schedule reaches hard ratio 1.0 (sizes up to SOLVE_MAX_CLASSES),
+      - peak Python heap while loading the instance and building the solver (tracemalloc; larger
+        sizes only load the instance).
+    Results are plain dicts, written as JSON so a later run can be compared against a baseline.
+    """
+
+    # Metrics compared against a baseline: name -> True if higher is better
+    TRACKED_METRICS = {
+        "evals_per_sec": True,
+        "delta_evals_per_sec": True,
+        "time_to_feasible": False,
+        "peak_memory_mb": False,
+    }
+
+    def __init__(self, params=None):
+        self.SIZES = [20, 200, 2000, 20000]
+        self.SEED = 1
+        self.SOLVER = "ga"
+        self.SOLVER_PARAMS = {}          # Overrides for the solver, e.g. {"POP_SIZE": 100}
+        self.GENERATOR_PARAMS = {}       # Overrides for InstanceGenerator, e.g. {"TIGHTNESS": 0.8}
+        self.MEASURE_SECONDS = 1.0       # Wall time spent per evaluation-speed measurement
+        self.SOLVE_MAX_CLASSES = 2000    # Larger instances skip the time-to-feasible run and building the solver
+        self.TIME_LIMIT = 120            # Per-size solve budget in seconds
+        self.TOLERANCE = 0.2             # Relative change reported as a regression by Compare
+
+        ApplyParams(self, params)
+
+        if self.SOLVER not in SOLVERS:
+            raise ValueError(f"Unknown solver: {self.SOLVER}")
+
+    # --- Measurements ---
+
+    @staticmethod
+    def _load(filename):
+        # Silence the loader's progress lines
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                config = ConfigurationClass(filename)
+                config.ReadConfiguration(filename)
+            finally:
+                sys.stdout = stdout
+        return config
+
+    def _evaluation_speed(self, config, delta):
+        """Fitness evaluations per second: full re-scores of random schedules, or single-class delta moves."""
+        prototype = Schedule(0, 1, 0.0, 1.0, delta, 1.0, config=config)
+        schedule = prototype.MakeNewFromPrototype()
+        schedule.CalculateFitness()
+
+        count = 0
+        start = time.perf_counter()
+        while True:
+            if delta:
+                schedule.Mutation()
+            else:
+                schedule.MarkDirty()
+            schedule.CalculateFitness()
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.MEASURE_SECONDS:
+                return count / elapsed
+
+    def _peak_memory(self, filename, build_solver):
+        """Peak Python heap (MB) for loading the instance and, if build_solver, building the solver."""
+        tracemalloc.start()
+        try:
+            config = self._load(filename)
+            if build_solver:
+                CreateSolver(self.SOLVER, config, seed=self.SEED, params=self.SOLVER_PARAMS)
+            return tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+
+    def _time_to_feasible(self, config):
+        """Seconds until the best schedule first has hard ratio 1.0 (None if not within TIME_LIMIT)."""
+        reached = []
+        start = time.perf_counter()
+        solver = None
+
+        def progress(iteration, best):
+            if best.hard_ratio >= 1.0 and not reached:
+                reached.append(time.perf_counter() - start)
+            if reached or time.perf_counter() - start >= self.TIME_LIMIT:
+                solver.RequestStop()
+
+        with open(os.devnull, "w") as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                solver = CreateSolver(self.SOLVER, config, seed=self.SEED, params=self.SOLVER_PARAMS)
+                best = solver.Run(progress=progress)
+            finally:
+                sys.stdout = stdout
+        elapsed = time.perf_counter() - start
+
+        if reached:
+            return reached[0], solver.evaluations
+        if best is not None and best.hard_ratio >= 1.0 and elapsed <= self.TIME_LIMIT:
+            return elapsed, solver.evaluations
+        return None, solver.evaluations
+
+    def RunSize(self, size, directory):
+        generator = InstanceGenerator(self.SEED, {**self.GENERATOR_PARAMS, "CLASSES": size})
+        filename = os.path.join(directory, f"synthetic_{size}.cfg")
+        generator.Write(filename)
+
+        solve = size <= self.SOLVE_MAX_CLASSES
+        start = time.perf_counter()
+        config = self._load(filename)
+        result = {
+            "classes": size,
+            "rooms": config.GetNumberOfRooms(),
+            "professors": len(config.GetProfessors()),
+            "groups": len(config.GetGroups()),
+            "load_seconds": time.perf_counter() - start,
+            "evals_per_sec": self._evaluation_speed(config, delta=False),
+            "delta_evals_per_sec": self._evaluation_speed(config, delta=True),
+            "peak_memory_mb": self._peak_memory(filename, build_solver=solve),
+            "peak_memory_includes_solver": solve,
+            "time_to_feasible": None,
+            "solve_evaluations": None,
+        }
+        if solve:
+            result["time_to_feasible"], result["solve_evaluations"] = self._time_to_feasible(config)
+        return result
+
+    def Run(self):
+        """Benchmarks every size and returns the results document."""
+        results = []
+        with tempfile.TemporaryDirectory() as directory:
+            # Build the solver once first, so one-time costs (lazy imports) are not charged to the first size
+            warmup = os.path.join(directory, "warmup.cfg")
+            InstanceGenerator(self.SEED, {**self.GENERATOR_PARAMS, "CLASSES": min(self.SIZES)}).Write(warmup)
+            CreateSolver(self.SOLVER, self._load(warmup), seed=self.SEED, params=self.SOLVER_PARAMS)
+
+            for size in self.SIZES:
+                result = self.RunSize(size, directory)
+                results.append(result)
+                feasible = result["time_to_feasible"]
+                print(f"{size:>6} classes: {result['evals_per_sec']:10.1f} evals/s, "
+                      f"{result['delta_evals_per_sec']:10.1f} delta evals/s, "
+                      f"peak {result['peak_memory_mb']:8.1f} MB, "
+                      f"hard ratio 1.0 after {'-' if feasible is None else f'{feasible:.2f} s'}")
+
+        return {
+            "solver": self.SOLVER,
+            "solver_params": self.SOLVER_PARAMS,
+            "generator_params": self.GENERATOR_PARAMS,
+            "seed": self.SEED,
+            "time_limit": self.TIME_LIMIT,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "results": results,
+        }
+
+    # --- Baseline files ---
+
+    @staticmethod
+    def Write(document, filename):
+        with open(filename, "w") as f:
+            json.dump(document, f, indent=2)
+
+    @staticmethod
+    def Read(filename):
+        with open(filename) as f:
+            return json.load(f)
+
+    def Compare(self, baseline, document):
+        """
+        Prints each tracked metric against the baseline (same class counts) and returns the
+        regressions: (classes, metric, baseline value, new value) beyond TOLERANCE.
+        """
+        previous = {r["classes"]: r for r in baseline.get("results", [])}
+        regressions = []
+        for result in document["results"]:
+            old = previous.get(result["classes"])
+            if old is None:
+                continue
+            for metric, higher_is_better in self.TRACKED_METRICS.items():
+                before, after = old.get(metric), result.get(metric)
+                if before is None and after is None:
+                    continue
+                if before is None or after is None:
+                    # Reaching hard ratio 1.0 (or no longer reaching it) is always reported
+                    lost = after is None
+                    print(f"{result['classes']:>6} classes: {metric} {before} -> {after}{' (REGRESSION)' if lost else ''}")
+                    if lost:
+                        regressions.append((result["classes"], metric, before, after))
+                    continue
+
+                change = (after - before) / before if before else 0.0
+                worse = -change if higher_is_better else change
+                flag = " (REGRESSION)" if worse > self.TOLERANCE else ""
+                print(f"{result['classes']:>6} classes: {metric} {before:.4g} -> {after:.4g} ({change:+.1%}){flag}")
+                if flag:
+                    regressions.append((result["classes"], metric, before, after))
+        return regressions
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Scaling benchmark on synthetic instances.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[20, 200, 2000, 20000], help="class counts")
+    parser.add_argument('--solver', choices=sorted(SOLVERS), default='ga')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--time-limit', type=float, default=120, help="per-size solve budget in seconds")
+    parser.add_argument('--output', default='benchmark.json', help="results file (default: benchmark.json)")
+    parser.add_argument('--baseline', default=None, help="earlier results to compare against")
+    args = parser.parse_args()
+
+    benchmark = Benchmark({"SIZES": args.sizes, "SOLVER": args.solver, "SEED": args.seed, "TIME_LIMIT": args.time_limit})
+    document = benchmark.Run()
+    Benchmark.Write(document, args.output)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = benchmark.Compare(Benchmark.Read(args.baseline), document)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {benchmark.TOLERANCE:.0%}")
+            sys.exit(1)
@@ -0,0 +1,38 @@
+# Checkpoint.py
+
+import os
+import pickle
+import zlib
+
+
+class Checkpoint:
+    """
+    Solver state saved to a compact binary file: a magic header and format version, then a
+    zlib-compressed pickle of the state dict. Writes are atomic (a temporary file in the same
+    directory replaces the old one), so a process killed mid-write leaves the previous checkpoint
+    intact. Unpickling can run code from the file: only load checkpoints you wrote yourself.
+    """
+
+    MAGIC = b"DAACKPT"
+    VERSION = 1
+
+    @staticmethod
+    def Write(state, filename):
+        data = Checkpoint.MAGIC + bytes([Checkpoint.VERSION]) + zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+        temporary = f"{filename}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, filename)
+
+    @staticmethod
+    def Read(filename):
+        with open(filename, "rb") as f:
+            data = f.read()
+        header = len(Checkpoint.MAGIC)
+        if len(data) <= header or data[:header] != Checkpoint.MAGIC:
+            raise ValueError(f"Not a checkpoint file: {filename}")
+        if data[header] != Checkpoint.VERSION:
+            raise ValueError(f"Unsupported checkpoint version {data[header]}: {filename}")
+        return pickle.loads(zlib.decompress(data[header + 1:]))
@@ -0,0 +1,73 @@
+# Chromosome.py
+
+from array import array
+
+
+class Chromosome:
+    """
+    Dense gene vector of a Schedule: the start position of every CourseClass, stored in an
+    array('i') indexed by the class's stable index (configuration order). It behaves like
+    the old {class_id: pos} dict (items/keys/values/[]/in/len), and copy() is a single buffer copy.
+    """
+
+    __slots__ = ('class_ids', 'class_index', 'genes')
+
+    def __init__(self, class_ids, class_index, genes=None):
+        self.class_ids = class_ids        # Shared: index -> class id
+        self.class_index = class_index    # Shared: class id -> index
+        self.genes = genes if genes is not None else array('i', bytes(4 * len(class_ids)))
+
+    @staticmethod
+    def ForConfig(config, positions=None):
+        """Builds a chromosome for the config, optionally from a {class_id: pos} mapping."""
+        class_ids, class_index = config.GetClassIndex()
+        chromosome = Chromosome(class_ids, class_index)
+        if positions is not None:
+            for class_id, pos in positions.items():
+                chromosome[class_id] = pos
+        return chromosome
+
+    def copy(self):
+        return Chromosome(self.class_ids, self.class_index, self.genes[:])
+
+    def GetKey(self):
+        """Compact hashable form of the genes (used by the fitness cache)."""
+        return self.genes.tobytes()
+
+    # --- Mapping interface (class id -> position) ---
+
+    def __getitem__(self, class_id):
+        return self.genes[self.class_index[class_id]]
+
+    def __setitem__(self, class_id, pos):
+        self.genes[self.class_index[class_id]] = pos
+
+    def __contains__(self, class_id):
+        return class_id in self.class_index
+
+    def __len__(self):
+        return len(self.genes)
+
+    def __iter__(self):
+        return iter(self.class_ids)
+
+    def __eq__(self, other):
+        if isinstance(other, Chromosome):
+            return self.genes == other.genes
+        return NotImplemented
+
+    def keys(self):
+        return list(self.class_ids)
+
+    def values(self):
+        return list(self.genes)
+
+    def items(self):
+        return list(zip(self.class_ids, self.genes))
+
+    def get(self, class_id, default=None):
+        j = self.class_index.get(class_id)
+        return default if j is None else self.genes[j]
+
+    def __repr__(self):
+        return f"Chromosome({dict(self.items())})"
@@ -1,6 +1,10 @@
 # Configuration.py
 
 import copy
+import hashlib
+import os
+import pickle
+import sys
 
 # --- Helper Classes (Standard Timetabling Models) ---
 
@@ -22,9 +26,11 @@ class Group:
     # Assuming start and end are hour integers (e.g., 8 to 18)
     _next_id = 1 
 
-    def __init__(self, name, size, start_hour, end_hour):
-        self._id = Group._next_id
-        Group._next_id += 1
+    def __init__(self, name, size, start_hour, end_hour, group_id=None):
+        if group_id is None:
+            group_id = Group._next_id
+            Group._next_id += 1
+        self._id = group_id
         self._name = name
         self._size = size
         self._start_hour = start_hour
@@ -78,22 +84,73 @@ class CourseClass:
     def __repr__(self):
         return f"Class(ID:{self._id}, {self._course.GetName()} for {self._group.GetName()}, {self._duration}h, Lab: {self._is_lab})"
 
-# --- Configuration Singleton ---
+class ConflictGraph:
+    """
+    Class conflict graph in class index order (see Configuration.GetClassIndex). Professors and
+    groups are numbered with small integers in order of first use; neighbours[j] lists, in
+    ascending order, the classes sharing a professor or a group with class j, which can never
+    overlap it in time.
+    """
+    def __init__(self, course_classes, class_ids):
+        prof_index = {}
+        group_index = {}
+        self.prof = []
+        self.group = []
+        by_prof = {}
+        by_group = {}
+        
+        for j, class_id in enumerate(class_ids):
+            cc = course_classes[class_id]
+            p = prof_index.setdefault(cc.GetProfessor().GetId(), len(prof_index))
+            g = group_index.setdefault(cc.GetGroup().GetId(), len(group_index))
+            self.prof.append(p)
+            self.group.append(g)
+            by_prof.setdefault(p, []).append(j)
+            by_group.setdefault(g, []).append(j)
+        
+        self.num_profs = len(prof_index)
+        self.num_groups = len(group_index)
+        self.neighbours = []
+        for j in range(len(class_ids)):
+            adjacent = set(by_prof[self.prof[j]]) | set(by_group[self.group[j]])
+            adjacent.discard(j)
+            self.neighbours.append(tuple(sorted(adjacent)))
+    
+    def GetDegree(self, j): return len(self.neighbours[j])
+
+class ConfigurationError(Exception):
+    """Raised for malformed configuration files; the message includes file name and line number."""
+    def __init__(self, message, filename=None, line=None):
+        self.filename = filename
+        self.line = line
+        location = f"{filename}:{line}: " if filename is not None and line is not None else ""
+        super().__init__(f"{location}{message}")
+
+# --- Configuration ---
 class Configuration:
+    """
+    One loaded timetabling problem. Several instances can coexist (one per solve); pass the
+    instance explicitly to Algorithm and Schedule. The first instance created is also kept as
+    the process-wide default returned by getInstance(), for older single-config callers.
+    """
     
     __instance = None
     
     @staticmethod
     def getInstance():
+        """Returns the default configuration (the first one created, unless replaced with setInstance)."""
         if Configuration.__instance == None:
             raise Exception("Configuration not initialized. Call Configuration('file.cfg') first.")
         return Configuration.__instance
 
+    @staticmethod
+    def setInstance(instance):
+        """Makes an existing configuration the process-wide default."""
+        Configuration.__instance = instance
+
     def __init__(self, filename):
-        if Configuration.__instance != None:
-            raise Exception("Configuration is a Singleton. Use getInstance() to retrieve it.")
-        
-        Configuration.__instance = self
+        if Configuration.__instance == None:
+            Configuration.__instance = self
         
         # Initialize internal storage maps
         self._rooms = {} 
@@ -102,6 +159,14 @@ class Configuration:
         self._courses = {}
         self._professors = {}
         
+        # Precomputed per-class placement domains, keyed by (day_hours, start_clock_hour)
+        self._placement_index = {}
+        self._class_index = None
+        self._conflict_graph = None
+        
+        # Other tables derived from the loaded data (e.g. fitness tables); cleared on every load
+        self._derived = {}
+        
     # Public Accessors (needed by Algorithm.py and Schedule.py)
     def GetRooms(self): return self._rooms
     def GetNumberOfRooms(self): return len(self._rooms)
@@ -110,92 +175,328 @@ class Configuration:
     def GetCourses(self): return self._courses
     def GetProfessors(self): return self._professors
 
+    def GetDerived(self, key, build):
+        """Returns the per-load cached value for key, calling build() the first time."""
+        value = self._derived.get(key)
+        if value is None:
+            value = build()
+            self._derived[key] = value
+        return value
+
+    def GetClassIndex(self):
+        """
+        Returns (class_ids, {class_id: index}): the stable dense index of every CourseClass
+        (configuration order) used by array-backed chromosomes and the fitness evaluators.
+        """
+        if self._class_index is None:
+            class_ids = tuple(self._course_classes.keys())
+            self._class_index = (class_ids, {class_id: j for j, class_id in enumerate(class_ids)})
+        return self._class_index
+
+    def GetConflictGraph(self):
+        """Returns the ConflictGraph of the loaded classes (professor/group indices, adjacency), built once per load."""
+        if self._conflict_graph is None:
+            self._conflict_graph = ConflictGraph(self._course_classes, self.GetClassIndex()[0])
+        return self._conflict_graph
 
-    def ReadConfiguration(self, filename): 
+    def GetPlacementIndex(self, day_hours, start_clock_hour):
         """
-        Loads all configuration data (Rooms, Classes, etc.) from the specified file.
-        NOTE: This version uses the hardcoded placeholder data provided.
+        Returns {class_id: (room_indices, start_hours)} for the given time grid, built once per load.
+        room_indices are the indices (in GetRooms() order) of rooms matching the class's lab/theory
+        type and capacity; start_hours are the hour indices where the class fits inside the day
+        and inside its group's time window.
         """
-        print(f"Loading configuration from {filename} (using internal placeholder data)...")
+        key = (day_hours, start_clock_hour)
+        index = self._placement_index.get(key)
+        if index is None:
+            index = {}
+            rooms = list(self._rooms.values())
+            for class_id, cc in self._course_classes.items():
+                group = cc.GetGroup()
+                duration = cc.GetDuration()
+                
+                room_indices = tuple(
+                    i for i, room in enumerate(rooms)
+                    if cc.IsLabRequired() == room.IsLab() and group.GetSize() <= room.GetSize()
+                )
+                first_hour = max(0, group.GetAvailableStartTime() - start_clock_hour)
+                last_end = min(day_hours, group.GetAvailableEndTime() - start_clock_hour)
+                start_hours = tuple(range(first_hour, last_end - duration + 1))
+                
+                index[class_id] = (room_indices, start_hours)
+            self._placement_index[key] = index
+        return index
+
+    def GetPlacementDomain(self, class_id, day_hours, start_clock_hour):
+        """(room_indices, start_hours) where the class can legally be placed."""
+        return self.GetPlacementIndex(day_hours, start_clock_hour)[class_id]
+
+
+    # --- Configuration File Parsing ---
+
+    # Field parsers per block type: key -> (converter, required, default)
+    BLOCK_FIELDS = {
+        'prof': {'id': (int, True, None), 'name': (str, True, None)},
+        'course': {'id': (int, True, None), 'name': (str, True, None)},
+        'room': {'id': (int, False, None), 'name': (str, True, None), 'lab': ('bool', False, False), 'size': (int, True, None)},
+        'group': {'id': (int, False, None), 'name': (str, True, None), 'size': (int, True, None),
+                  'start': (int, False, 8), 'end': (int, False, 18)},
+        'class': {'id': (int, False, None), 'professor': (int, True, None), 'course': (int, True, None),
+                  'duration': (int, True, None), 'group': (int, True, None), 'lab': ('bool', False, False)},
+    }
+
+    @staticmethod
+    def _parse_value(converter, text):
+        if converter == 'bool':
+            value = text.lower()
+            if value in ('true', 'yes', '1'):
+                return True
+            if value in ('false', 'no', '0'):
+                return False
+            raise ValueError(f"expected true/false, got '{text}'")
+        if converter is int:
+            return int(text)
+        return text
+
+    def _iterate_blocks(self, filename):
+        """
+        Streams the file one line at a time and yields (block_type, fields, start_line) per
+        '#type ... #end' block. Lines starting with '# ' are comments. Raises ConfigurationError
+        with the offending line number for any malformed input.
+        """
+        block_type = None
+        fields = None
+        start_line = 0
         
-        try:
-            # --- Placeholder Data Initialization (All Requirements Applied) ---
-            
-            # Reset ID counters for consistency if needed (important for Group/Course/Professor)
-            Group._next_id = 1 
-
-            # Rooms (ID: 0, 1, 2, 3)
-            self._rooms = {
-                0: Room("R48", 24, False), 1: Room("R51", 60, False), 
-                2: Room("R52", 60, False), 3: Room("R54", 60, False),
-                4: Room("R53", 60, True), 5: Room("R50", 60, True),
-                6: Room("R13", 60, True),
-            }
-            
-            # Helper objects (Groups use auto-incrementing IDs starting from 1)
-            g1 = Group('TY/1', 19, 8, 18) # Group ID 1
-            g2 = Group('TY/2', 19, 8, 18) # Group ID 2
-            g3 = Group('SY/3', 19, 8, 18) # Group ID 3
-            g4 = Group('SY/4', 19, 8, 18) # Group ID 4
-            
-            # Courses (Use IDs 1-11 from config for consistency)
-            c_dsa = Course(1, "DSA"); c_os = Course(2, "OS"); c_daa = Course(3, "DAA"); 
-            c_mam = Course(4, "MAM"); c_cc = Course(5, "CC"); c_dbms = Course(6, "DBMS"); 
-            c_oops = Course(7, "OOPS"); c_sp = Course(8, "SP"); c_sdam = Course(9, "SDAM"); 
-            c_cn = Course(10, "CN"); c_dt = Course(11, "DT")
-
-            # Professors (Use IDs 1-13 from config for consistency)
-            p_bailke = Professor(1, "Bailke"); p_kunekar = Professor(2, "Kunekar"); 
-            p_joglekar = Professor(3, "Joglekar"); p_cholke = Professor(4, "Cholke"); 
-            p_amune = Professor(5, "Amune"); p_vayadande = Professor(6, "Vayadande"); 
-            p_sawant = Professor(7, "Sawant"); p_dange = Professor(8, "Dange"); 
-            p_deshpande = Professor(9, "Deshpande"); p_joshi = Professor(10, "Joshi"); 
-            p_jadhav = Professor(11, "Jadhav"); p_sultanpure = Professor(12, "Sultanpure"); 
-            p_ghdadekar = Professor(13, "Ghdadekar")
-            
-            self._groups = {g.GetId(): g for g in [g1, g2, g3, g4]}
-            self._courses = {c.GetId(): c for c in [c_dsa, c_os, c_daa, c_mam, c_cc, c_dbms, c_oops, c_sp, c_sdam, c_cn, c_dt]}
-            self._professors = {p.GetId(): p for p in [p_bailke, p_kunekar, p_joglekar, p_cholke, p_amune, p_vayadande, p_sawant, p_dange, p_deshpande, p_joshi, p_jadhav, p_sultanpure, p_ghdadekar]}
-
-            # Course Classes: Total of 20 classes/sessions after correction
-            self._course_classes = {
-                # TY/1 
-                1: CourseClass(1, g1, c_dbms, p_cholke, 2, True), # DBMS Lab (2h)
-                2: CourseClass(2, g1, c_cc, p_joglekar, 1, False), # CC Theory (1h)
-                3: CourseClass(3, g1, c_cc, p_joglekar, 1, False), # CC Theory (1h)
-                4: CourseClass(4, g1, c_dbms, p_cholke, 1, False), # DBMS Theory (1h)
-                5: CourseClass(5, g1, c_dbms, p_cholke, 1, False), # DBMS Theory (1h)
+        with open(filename, 'r', encoding='utf-8') as f:
+            for line_number, raw_line in enumerate(f, 1):
+                line = raw_line.strip()
+                if not line:
+                    continue
                 
-                # TY/2 
-                6: CourseClass(6, g2, c_mam, p_cholke, 2, True), # MAM Lab (2h)
-                7: CourseClass(7, g2, c_os, p_joglekar, 1, False), # OS Theory (1h)
-                8: CourseClass(8, g2, c_sp, p_joshi, 1, False),  # SP Theory (1h)
-                9: CourseClass(9, g2, c_sp, p_joshi, 2, True), # SP Lab (2h)
+                if line.startswith('#'):
+                    tag = line[1:]
+                    if not tag or tag[0].isspace() or tag[0] == '#':
+                        continue # Comment line
+                    
+                    tag = tag.split()[0].lower()
+                    if tag == 'end':
+                        if block_type is None:
+                            raise ConfigurationError("'#end' without an open block", filename, line_number)
+                        
+                        schema = self.BLOCK_FIELDS[block_type]
+                        for key, (converter, required, default) in schema.items():
+                            if key not in fields:
+                                if required:
+                                    raise ConfigurationError(f"#{block_type} block is missing '{key}'", filename, start_line)
+                                fields[key] = default
+                        
+                        yield block_type, fields, start_line
+                        block_type = None
+                        continue
+                    
+                    if tag not in self.BLOCK_FIELDS:
+                        raise ConfigurationError(f"unknown block type '#{tag}'", filename, line_number)
+                    if block_type is not None:
+                        raise ConfigurationError(f"'#{tag}' opened before '#end' of #{block_type} (line {start_line})", filename, line_number)
+                    
+                    block_type = tag
+                    fields = {}
+                    start_line = line_number
+                    continue
                 
-                # SY/3 
-                10: CourseClass(10, g3, c_daa, p_joglekar, 1, False), # DAA Theory (1h)
-                11: CourseClass(11, g3, c_daa, p_joglekar, 1, False), # DAA Theory (1h)
-                12: CourseClass(12, g3, c_sdam, p_sawant, 1, False), # SDAM Theory (1h)
-                13: CourseClass(13, g3, c_sdam, p_sawant, 1, False), # SDAM Theory (1h)
-                14: CourseClass(14, g3, c_oops, p_amune, 2, True), # OOPS Lab (2h)
+                if block_type is None:
+                    raise ConfigurationError(f"'{line}' is outside of a block", filename, line_number)
                 
-                # SY/4 
-                15: CourseClass(15, g4, c_dsa, p_kunekar, 1, False), # DSA Theory (1h)
-                16: CourseClass(16, g4, c_dsa, p_kunekar, 2, True), # DSA Lab (2h)
+                key, sep, value = line.partition('=')
+                key = key.strip().lower()
+                value = value.strip()
+                if not sep or not key:
+                    raise ConfigurationError(f"expected 'key = value', got '{line}'", filename, line_number)
                 
-                # *** FIX: CN Theory split into two 1-hour sessions ***
-                17: CourseClass(17, g4, c_cn, p_deshpande, 1, False),# CN Theory (1h - Session 1)
-                20: CourseClass(20, g4, c_cn, p_deshpande, 1, False),# CN Theory (1h - Session 2)
+                schema = self.BLOCK_FIELDS[block_type]
+                if key not in schema:
+                    raise ConfigurationError(f"unknown field '{key}' in #{block_type} block", filename, line_number)
+                if key in fields:
+                    raise ConfigurationError(f"duplicate field '{key}' in #{block_type} block", filename, line_number)
+                
+                try:
+                    fields[key] = self._parse_value(schema[key][0], value)
+                except ValueError as e:
+                    raise ConfigurationError(f"invalid value for '{key}': {e}", filename, line_number)
+        
+        if block_type is not None:
+            raise ConfigurationError(f"#{block_type} block is not closed with '#end'", filename, start_line)
+
+    # --- Compiled Snapshots ---
+
+    SNAPSHOT_VERSION = 2
+    SNAPSHOT_SUFFIX = '.snap'
+
+    @staticmethod
+    def GetSnapshotPath(filename):
+        return filename + Configuration.SNAPSHOT_SUFFIX
+
+    @staticmethod
+    def _hash_file(filename):
+        digest = hashlib.sha256()
+        with open(filename, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def WriteSnapshot(self, filename):
+        """
+        Compiles the loaded configuration into a versioned binary snapshot next to the source
+        file ('<filename>.snap'): the object tables plus the class index, the conflict graph and
+        every placement index built so far. The snapshot is tied to the SHA-256 of the source file.
+        """
+        path = self.GetSnapshotPath(filename)
+        header = (self.SNAPSHOT_VERSION, self._hash_file(filename))
+        data = {
+            'rooms': self._rooms,
+            'groups': self._groups,
+            'courses': self._courses,
+            'professors': self._professors,
+            'course_classes': self._course_classes,
+            'class_index': self.GetClassIndex(),
+            'conflict_graph': self.GetConflictGraph(),
+            'placement_index': self._placement_index,
+        }
+        
+        # Write to a temporary file first so readers never see a partial snapshot
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        return path
+
+    def _read_snapshot(self, filename):
+        """
+        Loads '<filename>.snap' if it exists, has the current version and matches the source
+        file's hash. Returns False (and leaves the configuration untouched) otherwise.
+        Snapshots are pickles: only load ones you compiled yourself.
+        """
+        path = self.GetSnapshotPath(filename)
+        if not os.path.exists(path):
+            return False
+        
+        try:
+            with open(path, 'rb') as f:
+                version, source_hash = pickle.load(f)
+                if version != self.SNAPSHOT_VERSION or source_hash != self._hash_file(filename):
+                    return False
+                data = pickle.load(f)
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+            return False
+        
+        self._rooms = data['rooms']
+        self._groups = data['groups']
+        self._courses = data['courses']
+        self._professors = data['professors']
+        self._course_classes = data['course_classes']
+        self._class_index = data['class_index']
+        self._conflict_graph = data['conflict_graph']
+        self._placement_index = data['placement_index']
+        self._derived = {}
+        return True
+
+    def ReadConfiguration(self, filename, use_snapshot=True): 
+        """
+        Loads all configuration data (Rooms, Groups, Courses, Professors, Classes) from a
+        '#prof / #course / #room / #group / #class ... #end' file in a single streaming pass.
+        Classes may reference objects defined later in the file; references are validated at
+        the end. On any error a ConfigurationError (with line number) is raised and the
+        previously loaded data is kept.
+        
+        If an up-to-date compiled snapshot exists next to the file (see WriteSnapshot), it is
+        loaded instead of parsing the source.
+        """
+        if use_snapshot and self._read_snapshot(filename):
+            print(f"Configuration loaded from compiled snapshot {self.GetSnapshotPath(filename)}: "
+                  f"{len(self._course_classes)} classes.")
+            return
+        
+        print(f"Loading configuration from {filename}...")
+        
+        rooms = {}
+        groups = {}
+        courses = {}
+        professors = {}
+        class_blocks = [] # (fields, line) resolved once every object is known
+        
+        try:
+            for block_type, fields, line in self._iterate_blocks(filename):
                 
-                18: CourseClass(18, g4, c_dt, p_sawant, 1, False), # DT Theory (1h)
-                19: CourseClass(19, g4, c_dt, p_sawant, 1, False) # DT Theory (1h)
-            }
+                if block_type == 'prof':
+                    if fields['id'] in professors:
+                        raise ConfigurationError(f"duplicate professor id {fields['id']}", filename, line)
+                    professors[fields['id']] = Professor(fields['id'], fields['name'])
+                    
+                elif block_type == 'course':
+                    if fields['id'] in courses:
+                        raise ConfigurationError(f"duplicate course id {fields['id']}", filename, line)
+                    courses[fields['id']] = Course(fields['id'], fields['name'])
+                    
+                elif block_type == 'room':
+                    room_id = fields['id'] if fields['id'] is not None else len(rooms)
+                    if room_id in rooms:
+                        raise ConfigurationError(f"duplicate room id {room_id}", filename, line)
+                    if fields['size'] <= 0:
+                        raise ConfigurationError("room size must be positive", filename, line)
+                    rooms[room_id] = Room(fields['name'], fields['size'], fields['lab'])
+                    
+                elif block_type == 'group':
+                    group_id = fields['id'] if fields['id'] is not None else len(groups) + 1
+                    if group_id in groups:
+                        raise ConfigurationError(f"duplicate group id {group_id}", filename, line)
+                    if fields['start'] >= fields['end']:
+                        raise ConfigurationError("group time window start must be before end", filename, line)
+                    groups[group_id] = Group(fields['name'], fields['size'], fields['start'], fields['end'], group_id)
+                    
+                elif block_type == 'class':
+                    if fields['duration'] <= 0:
+                        raise ConfigurationError("class duration must be positive", filename, line)
+                    class_blocks.append((fields, line))
             
-            print("Configuration loaded successfully. The configuration is now using a hardcoded, clean data set.")
+            # --- Cross-reference validation ---
+            course_classes = {}
+            next_class_id = 1
+            for fields, line in class_blocks:
+                professor = professors.get(fields['professor'])
+                course = courses.get(fields['course'])
+                group = groups.get(fields['group'])
+                if professor is None:
+                    raise ConfigurationError(f"class references unknown professor {fields['professor']}", filename, line)
+                if course is None:
+                    raise ConfigurationError(f"class references unknown course {fields['course']}", filename, line)
+                if group is None:
+                    raise ConfigurationError(f"class references unknown group {fields['group']}", filename, line)
+                
+                class_id = fields['id'] if fields['id'] is not None else next_class_id
+                if class_id in course_classes:
+                    raise ConfigurationError(f"duplicate class id {class_id}", filename, line)
+                next_class_id = max(next_class_id, class_id) + 1
+                
+                course_classes[class_id] = CourseClass(class_id, group, course, professor, fields['duration'], fields['lab'])
             
-        except Exception as e:
-            print(f"Error during configuration loading. Check your helper class definitions: {e}")
+        except (ConfigurationError, OSError) as e:
+            print(f"Error during configuration loading: {e}")
             raise # Re-raise the exception to stop execution
+        
+        self._rooms = rooms
+        self._groups = groups
+        self._courses = courses
+        self._professors = professors
+        self._course_classes = course_classes
+        self._placement_index = {}
+        self._class_index = None
+        self._conflict_graph = None
+        self._derived = {}
+        
+        print(f"Configuration loaded successfully: {len(professors)} professors, {len(courses)} courses, "
+              f"{len(rooms)} rooms, {len(groups)} groups, {len(course_classes)} classes.")
 
     # The GenerateCourseRequirementsTable method remains correct for tallying the provided data.
     def GenerateCourseRequirementsTable(self):
@@ -246,3 +547,23 @@ class Configuration:
 
         table_data = list(aggregated_requirements.values())
         return table_data
+
+
+# --- Compile Step ---
+
+if __name__ == "__main__":
+    # Usage: python Configuration.py file.cfg [more.cfg ...]
+    # Parses each file and writes its compiled snapshot ('file.cfg.snap') for fast startup.
+    # Use the importable module's classes so the pickled objects are not bound to __main__
+    from Configuration import Configuration as CompilerConfiguration
+    from Schedule import Schedule
+    
+    if len(sys.argv) < 2:
+        print("Usage: python Configuration.py file.cfg [more.cfg ...]")
+        sys.exit(2)
+    
+    config = CompilerConfiguration(sys.argv[1])
+    for cfg_file in sys.argv[1:]:
+        config.ReadConfiguration(cfg_file, use_snapshot=False)
+        config.GetPlacementIndex(Schedule.DAY_HOURS, Schedule.START_CLOCK_HOUR)
+        print(f"Compiled snapshot written to {config.WriteSnapshot(cfg_file)}")
@@ -0,0 +1,64 @@
+# FitnessCache.py
+
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache of fitness records keyed on chromosome content, so offspring
+    that recreate an already seen chromosome skip CalculateFitness. Keys are the raw bytes of the gene array,
+    whose class order is the same for every Schedule built from one configuration.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._records = OrderedDict()
+
+    @staticmethod
+    def Key(schedule):
+        return schedule.classes.GetKey()
+
+    def Lookup(self, schedule):
+        """Applies the cached result to the schedule. Returns False on a miss."""
+        key = self.Key(schedule)
+        record = self._records.get(key)
+        if record is None:
+            self.misses += 1
+            return False
+
+        self._records.move_to_end(key)
+        self.hits += 1
+        schedule.SetFitnessRecord(record)
+        return True
+
+    def Store(self, schedule):
+        """Remembers the result of a schedule that has just been evaluated."""
+        key = self.Key(schedule)
+        self._records[key] = schedule.GetFitnessRecord()
+        self._records.move_to_end(key)
+        if len(self._records) > self.max_size:
+            self._records.popitem(last=False)
+
+    def GetState(self):
+        """Entries (oldest first) and hit/miss counters, for checkpoints."""
+        return {'records': list(self._records.items()), 'hits': self.hits, 'misses': self.misses}
+
+    def SetState(self, state):
+        """Restores GetState() output; only the newest max_size entries are kept."""
+        self._records = OrderedDict(state['records'][-self.max_size:])
+        self.hits = state['hits']
+        self.misses = state['misses']
+
+    def Clear(self):
+        self._records.clear()
+
+    def Stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._records),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,435 @@
+# FitnessState.py
+
+import heapq
+
+
+class FitnessTables:
+    """
+    Dense, read-only per-configuration tables used by FitnessState.
+    Classes, rooms, professors and groups are mapped to small integer indices
+    so the occupancy planes can be flat lists instead of nested dicts.
+    """
+
+    def __init__(self, config, day_hours, days_per_week, start_clock_hour, lunch_slot, late_start):
+        self.day_hours = day_hours
+        self.days = days_per_week
+        self.lunch_slot = lunch_slot
+        self.late_start = late_start
+
+        # Rooms are addressed by their INDEX in the rooms map (same as Mutation)
+        rooms = list(config.GetRooms().values())
+        self.num_rooms = len(rooms)
+        self.room_size = [room.GetSize() for room in rooms]
+        self.room_lab = [room.IsLab() for room in rooms]
+        self.day_slots = self.num_rooms * day_hours
+
+        pair_index = {}
+
+        # Class order matches Schedule.classes (configuration order); professor and
+        # group indices come from the configuration's conflict graph
+        self.class_ids, self.class_index = config.GetClassIndex()
+        graph = config.GetConflictGraph()
+        self.prof = graph.prof
+        self.group = graph.group
+        self.num_profs = graph.num_profs
+        self.num_groups = graph.num_groups
+        self.duration = []
+        self.lab = []
+        self.group_size = []
+        self.window_start = []
+        self.window_end = []
+        self.pair = []  # (group, course) index for 1-hour theory classes, else -1
+
+        for j, class_id in enumerate(self.class_ids):
+            cc = config.GetCourseClasses()[class_id]
+            group = cc.GetGroup()
+
+            self.duration.append(cc.GetDuration())
+            self.lab.append(cc.IsLabRequired())
+            self.group_size.append(group.GetSize())
+            self.window_start.append(group.GetAvailableStartTime() - start_clock_hour)
+            self.window_end.append(group.GetAvailableEndTime() - start_clock_hour)
+
+            if not cc.IsLabRequired() and cc.GetDuration() == 1:
+                key = (self.group[j], cc.GetCourse().GetId())
+                self.pair.append(pair_index.setdefault(key, len(pair_index)))
+            else:
+                self.pair.append(-1)
+
+        self.num_pairs = len(pair_index)
+
+        # Per-day bitmask penalty tables (bit t set = hour index t is booked)
+        size = 1 << day_hours
+        self.overload = [0] * size      # SC1: hours above 5
+        self.gaps = [0] * size          # SC2: empty hours between classes
+        self.long_runs = [0] * size     # SC3: hours beyond 3 in a row
+        self.adjacent = [0] * size      # SC6: back-to-back booked hours
+        for mask in range(size):
+            count = bin(mask).count("1")
+            self.overload[mask] = max(0, count - 5)
+            if count > 1:
+                first = (mask & -mask).bit_length() - 1
+                last = mask.bit_length() - 1
+                self.gaps[mask] = (last - first) - (count - 1)
+            run = 0
+            for t in range(day_hours):
+                if mask >> t & 1:
+                    run += 1
+                    if run > 3:
+                        self.long_runs[mask] += 1
+                else:
+                    run = 0
+            self.adjacent[mask] = bin(mask & (mask >> 1)).count("1")
+
+    @classmethod
+    def ForConfig(cls, config, day_hours, days_per_week, start_clock_hour, lunch_slot, late_start):
+        """Returns the tables for the config, built once per load and time grid."""
+        key = ('fitness_tables', day_hours, days_per_week, start_clock_hour, lunch_slot, late_start)
+        return config.GetDerived(
+            key, lambda: cls(config, day_hours, days_per_week, start_clock_hour, lunch_slot, late_start)
+        )
+
+    # --- Slot occupancy (used by conflict-directed mutation) ---
+
+    def GetOccupancy(self, genes, skip=()):
+        """
+        Busy-hour bitmasks of every class except the indices in skip, as three lists
+        (rooms, professors, groups) indexed [entity * days + day].
+        """
+        occupancy = ([0] * (self.num_rooms * self.days), [0] * (self.num_profs * self.days),
+                     [0] * (self.num_groups * self.days))
+        for j in range(len(genes)):
+            if j not in skip:
+                self.Occupy(occupancy, j, genes[j])
+        return occupancy
+
+    def Occupy(self, occupancy, j, pos):
+        """Marks the hours class j uses at pos, unless the placement is never booked (HC1-HC3 or off the week)."""
+        H = self.day_hours
+        day, time_room = divmod(pos, self.day_slots)
+        room_index, start_time = divmod(time_room, H)
+        duration = self.duration[j]
+
+        if (day >= self.days or room_index >= self.num_rooms
+                or self.group_size[j] > self.room_size[room_index] or self.lab[j] != self.room_lab[room_index]
+                or start_time + duration > H or start_time < self.window_start[j]
+                or start_time + duration > self.window_end[j]):
+            return
+
+        hours = ((1 << duration) - 1) << start_time
+        room_busy, prof_busy, group_busy = occupancy
+        room_busy[room_index * self.days + day] |= hours
+        prof_busy[self.prof[j] * self.days + day] |= hours
+        group_busy[self.group[j] * self.days + day] |= hours
+
+    def GetFreePositions(self, j, occupancy, room_indices, start_hours):
+        """
+        Positions (over every day) in the given rooms and start hours where class j's room,
+        professor and group are free for its whole duration.
+        """
+        D = self.days
+        room_busy, prof_busy, group_busy = occupancy
+        prof_base = self.prof[j] * D
+        group_base = self.group[j] * D
+        span = (1 << self.duration[j]) - 1
+
+        free = []
+        for day in range(D):
+            busy = prof_busy[prof_base + day] | group_busy[group_base + day]
+            for start_time in start_hours:
+                hours = span << start_time
+                if busy & hours:
+                    continue
+                for room_index in room_indices:
+                    if not room_busy[room_index * D + day] & hours:
+                        free.append(day * self.day_slots + room_index * self.day_hours + start_time)
+        return free
+
+
+class FitnessState:
+    """
+    Occupancy and penalty state of one Schedule. Rebuild() scores every class from
+    scratch; in delta mode the state is kept between evaluations and Update()
+    re-scores only the classes whose outcome can change.
+
+    Classes are booked greedily in configuration order: a class that clashes with
+    an earlier booked class fails, and its hours before the clash stay booked.
+    """
+
+    def __init__(self, tables):
+        self.tables = tables
+        t = tables
+        cells = t.days * t.day_hours
+        n = len(t.class_ids)
+
+        # Occupancy planes: [cell * N + index] -> class order index or -1
+        self.room_occ = [-1] * (cells * t.num_rooms)
+        self.prof_occ = [-1] * (cells * t.num_profs)
+        self.group_occ = [-1] * (cells * t.num_groups)
+
+        # Per class: evaluated position, hours booked, hard constraint result
+        self.positions = [-1] * n
+        self.booked = [0] * n
+        self.ok = [False] * n
+        self.failing = set(range(n))  # Indices j with ok[j] False, kept as ok flips
+        self.blocked = {}     # class index -> earlier class it clashed with (HC4)
+        self.blocked_by = {}  # class index -> frozenset of later classes it blocks; re-scored when it moves
+
+        # Booked-hour bitmasks: [entity * days + day] (rooms for GetOccupancy, the others also for soft constraints)
+        self.room_mask = [0] * (t.num_rooms * t.days)
+        self.prof_mask = [0] * (t.num_profs * t.days)
+        self.group_mask = [0] * (t.num_groups * t.days)
+        self.pair_mask = [0] * (t.num_pairs * t.days)
+
+        self.prof_penalty = 0
+        self.gap_penalty = 0
+        self.consecutive_penalty = 0
+        self.lunch_penalty = 0
+        self.late_long_class_penalty = 0
+        self.same_subject_consecutive_penalty = 0
+
+        self._queue = []
+        self._queued = set()
+
+    def copy(self):
+        new_state = FitnessState.__new__(FitnessState)
+        new_state.tables = self.tables
+        new_state.room_occ = self.room_occ[:]
+        new_state.prof_occ = self.prof_occ[:]
+        new_state.group_occ = self.group_occ[:]
+        new_state.positions = self.positions[:]
+        new_state.booked = self.booked[:]
+        new_state.ok = self.ok[:]
+        new_state.failing = self.failing.copy()
+        new_state.blocked = self.blocked.copy()
+        new_state.blocked_by = self.blocked_by.copy() # Values are replaced, never mutated
+        new_state.room_mask = self.room_mask[:]
+        new_state.prof_mask = self.prof_mask[:]
+        new_state.group_mask = self.group_mask[:]
+        new_state.pair_mask = self.pair_mask[:]
+        new_state.prof_penalty = self.prof_penalty
+        new_state.gap_penalty = self.gap_penalty
+        new_state.consecutive_penalty = self.consecutive_penalty
+        new_state.lunch_penalty = self.lunch_penalty
+        new_state.late_long_class_penalty = self.late_long_class_penalty
+        new_state.same_subject_consecutive_penalty = self.same_subject_consecutive_penalty
+        new_state._queue = []
+        new_state._queued = set()
+        return new_state
+
+    # --- Public API ---
+
+    def Rebuild(self, genes):
+        """Evaluates every class from an empty timetable (state must be fresh). genes is in class order."""
+        for j in range(len(genes)):
+            self._evaluate(j, genes[j])
+
+    def Update(self, genes, changed_class_ids):
+        """Re-scores the changed classes and every later class affected by them."""
+        class_index = self.tables.class_index
+        for class_id in changed_class_ids:
+            j = class_index[class_id]
+            if self.positions[j] != genes[j]:
+                self._push(j)
+
+        queue = self._queue
+        while queue:
+            j = heapq.heappop(queue)
+            self._queued.discard(j)
+            self._unbook(j)
+            self._evaluate(j, genes[j])
+
+    def GetTotalHardScore(self):
+        return (len(self.ok) - len(self.failing)) * 5.0
+
+    def GetOccupancy(self, genes, changed_class_ids, skip=()):
+        """
+        Same busy-hour bitmasks as FitnessTables.GetOccupancy(genes, skip), derived from the
+        booked-hour masks: only the classes failing at the last evaluation, moved since then
+        (changed_class_ids) or skipped are looked at, instead of every class.
+        """
+        t = self.tables
+        H = t.day_hours
+        D = t.days
+        class_index = t.class_index
+
+        recount = set(skip)
+        recount.update(self.failing)
+        for class_id in changed_class_ids:
+            j = class_index[class_id]
+            if self.positions[j] != genes[j]:
+                recount.add(j)
+
+        occupancy = (self.room_mask[:], self.prof_mask[:], self.group_mask[:])
+        room_busy, prof_busy, group_busy = occupancy
+        for j in recount:
+            # Hours booked at the last evaluation (cells have one owner, so clearing the bits is exact)
+            if self.booked[j]:
+                day, time_room = divmod(self.positions[j], t.day_slots)
+                room_index, start_time = divmod(time_room, H)
+                hours = ~(((1 << self.booked[j]) - 1) << start_time)
+                room_busy[room_index * D + day] &= hours
+                prof_busy[t.prof[j] * D + day] &= hours
+                group_busy[t.group[j] * D + day] &= hours
+        for j in recount:
+            if j not in skip:
+                t.Occupy(occupancy, j, genes[j])
+        return occupancy
+
+    def GetConflicts(self):
+        """Class order indices of the classes failing HC1-HC4, as an ascending tuple."""
+        return tuple(sorted(self.failing))
+
+    # --- Internals ---
+
+    def _push(self, j):
+        if j not in self._queued:
+            self._queued.add(j)
+            heapq.heappush(self._queue, j)
+
+    def _evaluate(self, j, pos):
+        t = self.tables
+        H = t.day_hours
+
+        self.positions[j] = pos
+        blocker = self.blocked.pop(j, None)
+        if blocker is not None:
+            waiting = self.blocked_by[blocker] - {j}
+            if waiting:
+                self.blocked_by[blocker] = waiting
+            else:
+                del self.blocked_by[blocker]
+        if self.ok[j]:
+            self.ok[j] = False
+            self.failing.add(j)
+
+        day, time_room = divmod(pos, t.day_slots)
+        room_index, start_time = divmod(time_room, H)
+        duration = t.duration[j]
+
+        # HC1 / HC3: room capacity and lab/theory type
+        if room_index >= t.num_rooms or t.group_size[j] > t.room_size[room_index] or t.lab[j] != t.room_lab[room_index]:
+            return
+        # HC2: end of day and group time window
+        if start_time + duration > H or start_time < t.window_start[j] or start_time + duration > t.window_end[j]:
+            return
+
+        if day < t.days:
+            R, NP, NG = t.num_rooms, t.num_profs, t.num_groups
+            p, g = t.prof[j], t.group[j]
+            room_occ, prof_occ, group_occ = self.room_occ, self.prof_occ, self.group_occ
+
+            for i in range(duration):
+                cell = day * H + start_time + i
+                a = room_occ[cell * R + room_index]
+                b = prof_occ[cell * NP + p]
+                c = group_occ[cell * NG + g]
+
+                # HC4: an earlier booked class already uses this room, professor or group
+                for blocker in (a, b, c):
+                    if -1 < blocker < j:
+                        self.blocked[j] = blocker
+                        self.blocked_by[blocker] = self.blocked_by.get(blocker, frozenset()) | {j}
+                        return
+
+                # Later classes booked here lose the slot and are re-scored
+                for other in (a, b, c):
+                    if other > j and self.booked[other]:
+                        self._unbook(other)
+                        self._push(other)
+
+                self._book(j, day, start_time + i, room_index, i == 0 and start_time >= t.late_start and duration > 1)
+
+        self.ok[j] = True
+        self.failing.discard(j)
+
+    def _book(self, j, day, time_index, room_index, late_long):
+        t = self.tables
+        cell = day * t.day_hours + time_index
+        bit = 1 << time_index
+
+        self.room_occ[cell * t.num_rooms + room_index] = j
+        self.prof_occ[cell * t.num_profs + t.prof[j]] = j
+        self.group_occ[cell * t.num_groups + t.group[j]] = j
+        self.room_mask[room_index * t.days + day] |= bit
+        self.booked[j] += 1
+
+        k = t.prof[j] * t.days + day
+        old = self.prof_mask[k]
+        new = old | bit
+        self.prof_mask[k] = new
+        self.prof_penalty += t.overload[new] - t.overload[old]
+        self.consecutive_penalty += t.long_runs[new] - t.long_runs[old]
+
+        k = t.group[j] * t.days + day
+        old = self.group_mask[k]
+        new = old | bit
+        self.group_mask[k] = new
+        self.gap_penalty += t.gaps[new] - t.gaps[old]
+
+        if t.pair[j] >= 0:
+            k = t.pair[j] * t.days + day
+            old = self.pair_mask[k]
+            new = old | bit
+            self.pair_mask[k] = new
+            self.same_subject_consecutive_penalty += t.adjacent[new] - t.adjacent[old]
+
+        if time_index == t.lunch_slot:
+            self.lunch_penalty += 1
+        if late_long:
+            self.late_long_class_penalty += 1
+
+    def _unbook(self, j):
+        """Removes every hour booked by class j and queues the later classes it blocked."""
+        hours = self.booked[j]
+        if not hours:
+            return
+
+        t = self.tables
+        H = t.day_hours
+        day, time_room = divmod(self.positions[j], t.day_slots)
+        room_index, start_time = divmod(time_room, H)
+
+        for i in range(hours):
+            time_index = start_time + i
+            cell = day * H + time_index
+            bit = 1 << time_index
+
+            self.room_occ[cell * t.num_rooms + room_index] = -1
+            self.prof_occ[cell * t.num_profs + t.prof[j]] = -1
+            self.group_occ[cell * t.num_groups + t.group[j]] = -1
+            self.room_mask[room_index * t.days + day] &= ~bit
+
+            k = t.prof[j] * t.days + day
+            old = self.prof_mask[k]
+            new = old & ~bit
+            self.prof_mask[k] = new
+            self.prof_penalty += t.overload[new] - t.overload[old]
+            self.consecutive_penalty += t.long_runs[new] - t.long_runs[old]
+
+            k = t.group[j] * t.days + day
+            old = self.group_mask[k]
+            new = old & ~bit
+            self.group_mask[k] = new
+            self.gap_penalty += t.gaps[new] - t.gaps[old]
+
+            if t.pair[j] >= 0:
+                k = t.pair[j] * t.days + day
+                old = self.pair_mask[k]
+                new = old & ~bit
+                self.pair_mask[k] = new
+                self.same_subject_consecutive_penalty += t.adjacent[new] - t.adjacent[old]
+
+            if time_index == t.lunch_slot:
+                self.lunch_penalty -= 1
+            if i == 0 and start_time >= t.late_start and t.duration[j] > 1:
+                self.late_long_class_penalty -= 1
+
+        self.booked[j] = 0
+        if self.ok[j]:
+            self.ok[j] = False
+            self.failing.add(j)
+
+        for other in self.blocked_by.pop(j, ()):
+            del self.blocked[other]
+            self._push(other)
@@ -0,0 +1,130 @@
+# GraphSeeding.py
+
+import heapq
+
+
+class GraphSeeding:
+    """
+    Constructive seeding for the initial population (DSatur-style graph colouring).
+    Classes sharing a professor or a group are adjacent in the conflict graph. Classes are
+    placed one at a time, most constrained first: highest saturation (distinct hours already
+    taken by placed neighbours), then highest degree, ties broken by a per-individual shuffle.
+    Each class goes to a random position where its room, professor and group are free, among
+    those adding the least soft penalty (SC1-SC5) given the classes placed so far.
+
+    Trade-off: seeds are (nearly) free of hard conflicts, but the greedy packing leaves a poor
+    soft score on dense instances, often lower in total fitness than random individuals
+    (150 generated classes: 1.6 vs 2.4, hard ratio 1.0 vs 0.55). The soft-cost tie-break only
+    chooses among free positions and does not close that gap.
+    """
+
+    def __init__(self, config, tables):
+        self.tables = tables
+        self.graph = config.GetConflictGraph()
+        self.degree = [self.graph.GetDegree(j) for j in range(len(tables.class_ids))]
+
+    def Construct(self, schedule):
+        """
+        Returns a position per class (class order) for a new individual of the schedule's
+        configuration, using the schedule's RNG. None marks a class with no free position.
+        """
+        t = self.tables
+        rng = schedule.rng
+        n = len(t.class_ids)
+        H = t.day_hours
+
+        positions = [None] * n
+        placed = [False] * n
+        saturation = [set() for _ in range(n)]  # (day, hour) cells used by placed neighbours
+        degree = self.degree
+        occupancy = t.GetOccupancy(())
+
+        # Max-heap on (saturation, degree), ties by position in a per-individual shuffle. A class
+        # gets a new entry whenever its saturation grows; entries of placed classes or with an
+        # outdated saturation are skipped when popped.
+        order = list(range(n))
+        rng.shuffle(order)
+        rank = [0] * n
+        for position, j in enumerate(order):
+            rank[j] = position
+        heap = [(0, -degree[j], rank[j], j) for j in range(n)]
+        heapq.heapify(heap)
+
+        while heap:
+            negative_saturation, _, _, j = heapq.heappop(heap)
+            if placed[j] or -negative_saturation != len(saturation[j]):
+                continue
+            placed[j] = True
+
+            room_indices, start_hours = schedule.config.GetPlacementDomain(
+                t.class_ids[j], schedule.DAY_HOURS, schedule.START_CLOCK_HOUR
+            )
+            candidates = self._cheapest_free_positions(j, occupancy, room_indices, start_hours)
+            if not candidates:
+                continue
+
+            pos = rng.choice(candidates)
+            positions[j] = pos
+            t.Occupy(occupancy, j, pos)
+
+            day, time_room = divmod(pos, t.day_slots)
+            start_time = time_room % H
+            cells = [day * H + start_time + i for i in range(t.duration[j])]
+            for other in self.graph.neighbours[j]:
+                if not placed[other]:
+                    before = len(saturation[other])
+                    saturation[other].update(cells)
+                    if len(saturation[other]) != before:
+                        heapq.heappush(heap, (-len(saturation[other]), -degree[other], rank[other], other))
+
+        return positions
+
+    def _cheapest_free_positions(self, j, occupancy, room_indices, start_hours):
+        """
+        The free positions of class j (FitnessTables.GetFreePositions, same order) with the lowest
+        soft cost. The cost depends on the day and start hour only, so it is computed once per
+        (day, start hour), and free rooms are only listed where it does not exceed the lowest so far.
+        """
+        t = self.tables
+        D = t.days
+        room_busy, prof_busy, group_busy = occupancy
+        span = (1 << t.duration[j]) - 1
+
+        lowest = None
+        candidates = []
+        for day in range(D):
+            busy = prof_busy[t.prof[j] * D + day] | group_busy[t.group[j] * D + day]
+            for start_time in start_hours:
+                hours = span << start_time
+                if busy & hours:
+                    continue
+                cost = self._soft_cost(j, day, start_time, occupancy)
+                if lowest is not None and cost > lowest:
+                    continue
+                base = day * t.day_slots + start_time
+                free = [base + room_index * t.day_hours for room_index in room_indices
+                        if not room_busy[room_index * D + day] & hours]
+                if not free:
+                    continue
+                if lowest is None or cost < lowest:
+                    lowest = cost
+                    candidates = []
+                candidates.extend(free)
+        return candidates
+
+    def _soft_cost(self, j, day, start_time, occupancy):
+        """Soft penalty added by placing class j on day at start_time: professor overload and long runs, group gaps, lunch, late long class."""
+        t = self.tables
+        _, prof_busy, group_busy = occupancy
+        duration = t.duration[j]
+        hours = ((1 << duration) - 1) << start_time
+
+        old = prof_busy[t.prof[j] * t.days + day]
+        cost = t.overload[old | hours] - t.overload[old] + t.long_runs[old | hours] - t.long_runs[old]
+        old = group_busy[t.group[j] * t.days + day]
+        cost += t.gaps[old | hours] - t.gaps[old]
+        if hours >> t.lunch_slot & 1:
+            cost += 1
+        if start_time >= t.late_start and duration > 1:
+            cost += 1
+        return cost
@@ -0,0 +1,134 @@
+# InstanceGenerator.py
+
+import argparse
+import math
+import random
+
+from Parameters import ApplyParams
+
+
+class InstanceGenerator:
+    """
+    Reproducible synthetic timetabling instances in the input.cfg format.
+
+    CLASSES sessions are spread round-robin over the groups; LAB_RATIO of them are labs of
+    LAB_DURATION hours, the rest 1-hour theory sessions. Each (group, course) pair is taught
+    by one professor, the least loaded one when the pair first appears. Unless given
+    explicitly, the numbers of groups, professors and theory/lab rooms are derived from
+    TIGHTNESS: the share of each resource's weekly hours (days x group window) that is booked.
+    """
+
+    DAYS_PER_WEEK = 5
+
+    def __init__(self, seed=None, params=None):
+        self.CLASSES = 200               # Sessions to schedule
+        self.GROUPS = None               # None: derived from TIGHTNESS
+        self.PROFESSORS = None           # None: derived from TIGHTNESS
+        self.ROOMS = None                # Theory rooms; None: derived from TIGHTNESS
+        self.LAB_ROOMS = None            # None: derived from TIGHTNESS
+        self.COURSES = 11
+        self.LAB_RATIO = 0.2             # Share of sessions that are labs
+        self.LAB_DURATION = 2            # Hours per lab session
+        self.TIGHTNESS = 0.6             # Booked share of weekly hours per group, professor and room
+        self.GROUP_SIZE = (15, 60)       # Students per group, sampled uniformly
+        self.ROOM_SIZE = 60              # Seats per room (fits every group)
+        self.DAY_START = 8               # Group window, clock hours
+        self.DAY_END = 18
+
+        ApplyParams(self, params)
+
+        if not 0.0 < self.TIGHTNESS <= 1.0:
+            raise ValueError(f"TIGHTNESS must be in (0, 1], got {self.TIGHTNESS}")
+        if not 0.0 <= self.LAB_RATIO <= 1.0:
+            raise ValueError(f"LAB_RATIO must be in [0, 1], got {self.LAB_RATIO}")
+
+        self.seed = seed
+
+    def _count(self, explicit, hours):
+        """Resources needed so that `hours` fill TIGHTNESS of their weekly hours."""
+        if explicit is not None:
+            return explicit
+        weekly = self.DAYS_PER_WEEK * (self.DAY_END - self.DAY_START) * self.TIGHTNESS
+        return max(1, math.ceil(hours / weekly))
+
+    def Generate(self):
+        """Returns the instance as configuration file text."""
+        rng = random.Random(self.seed)
+
+        labs = [rng.random() < self.LAB_RATIO for _ in range(self.CLASSES)]
+        lab_hours = sum(labs) * self.LAB_DURATION
+        theory_hours = self.CLASSES - sum(labs)
+        total_hours = lab_hours + theory_hours
+
+        num_groups = self._count(self.GROUPS, total_hours)
+        num_profs = self._count(self.PROFESSORS, total_hours)
+        num_rooms = self._count(self.ROOMS, theory_hours)
+        num_lab_rooms = self._count(self.LAB_ROOMS, lab_hours) if lab_hours else 0
+
+        lines = [f"# Synthetic instance: {self.CLASSES} classes, lab ratio {self.LAB_RATIO}, "
+                 f"tightness {self.TIGHTNESS}, seed {self.seed}", ""]
+
+        lines.append(f"# Professors (IDs 1-{num_profs})")
+        for p in range(1, num_profs + 1):
+            lines += ["#prof", f"    id = {p}", f"    name = P{p}", "#end", ""]
+
+        lines.append(f"# Courses (IDs 1-{self.COURSES})")
+        for c in range(1, self.COURSES + 1):
+            lines += ["#course", f"    id = {c}", f"    name = C{c}", "#end", ""]
+
+        lines.append("# Rooms")
+        for r in range(1, num_rooms + num_lab_rooms + 1):
+            lab = r > num_rooms
+            lines += ["#room", f"    id = {r}", f"    name = {'L' if lab else 'R'}{r}",
+                      f"    lab = {'true' if lab else 'false'}", f"    size = {self.ROOM_SIZE}", "#end", ""]
+
+        lines.append(f"# Student Groups (IDs 1-{num_groups})")
+        for g in range(1, num_groups + 1):
+            lines += ["#group", f"    id = {g}", f"    name = G{g}", f"    size = {rng.randint(*self.GROUP_SIZE)}",
+                      f"    start = {self.DAY_START}", f"    end = {self.DAY_END}", "#end", ""]
+
+        lines.append(f"# Course Classes (Total {self.CLASSES} classes)")
+        prof_load = [0] * num_profs
+        teacher = {}  # (group, course) -> professor index
+        for i, lab in enumerate(labs):
+            group = i % num_groups
+            course = rng.randrange(self.COURSES)
+            duration = self.LAB_DURATION if lab else 1
+            if (group, course) not in teacher:
+                lowest = min(prof_load)
+                teacher[(group, course)] = rng.choice([p for p, load in enumerate(prof_load) if load == lowest])
+            prof = teacher[(group, course)]
+            prof_load[prof] += duration
+
+            lines += ["#class", f"    professor = {prof + 1}", f"    course = {course + 1}",
+                      f"    duration = {duration}", f"    group = {group + 1}"]
+            if lab:
+                lines.append("    lab = true")
+            lines += ["#end", ""]
+
+        return "\n".join(lines)
+
+    def Write(self, filename):
+        with open(filename, "w") as f:
+            f.write(self.Generate())
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Write a synthetic timetabling instance (input.cfg format).")
+    parser.add_argument('output', help="configuration file to write")
+    parser.add_argument('--classes', type=int, default=200)
+    parser.add_argument('--groups', type=int, default=None)
+    parser.add_argument('--professors', type=int, default=None)
+    parser.add_argument('--rooms', type=int, default=None, help="theory rooms")
+    parser.add_argument('--lab-rooms', type=int, default=None)
+    parser.add_argument('--lab-ratio', type=float, default=0.2)
+    parser.add_argument('--tightness', type=float, default=0.6)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    InstanceGenerator(args.seed, {
+        "CLASSES": args.classes, "GROUPS": args.groups, "PROFESSORS": args.professors, "ROOMS": args.rooms,
+        "LAB_ROOMS": args.lab_rooms, "LAB_RATIO": args.lab_ratio, "TIGHTNESS": args.tightness,
+    }).Write(args.output)
+    print(f"Wrote {args.output}")
@@ -0,0 +1,180 @@
+# IslandModel.py
+
+import multiprocessing
+import time
+
+from Schedule import Schedule
+from Solver import Solver
+
+
+def _island_main(conn, config, seed, params):
+    """
+    Worker process: owns one Algorithm population and answers commands from the
+    IslandModel over a pipe. Chromosomes travel as plain {class_id: pos} dicts.
+    """
+    from Algorithm import Algorithm
+
+    algorithm = Algorithm(config, seed=seed, params=params)
+    conn.send(_schedule_settings(algorithm))
+
+    while True:
+        command, arg = conn.recv()
+
+        if command == "evolve":
+            generations, immigrants = arg
+            algorithm.Immigrate([_make_schedule(algorithm, genes) for genes in immigrants])
+            for _ in range(generations):
+                if algorithm.bestSchedule.fitness >= algorithm.GOAL_FITNESS:
+                    break
+                algorithm.NextGeneration()
+            best = algorithm.bestSchedule
+            conn.send((best.fitness, dict(best.classes), best.fitness >= algorithm.GOAL_FITNESS, algorithm.evaluations))
+
+        elif command == "elites":
+            algorithm.population.sort(key=lambda s: s.fitness, reverse=True)
+            conn.send([dict(s.classes) for s in algorithm.population[:arg]])
+
+        elif command == "stop":
+            algorithm.Shutdown()
+            conn.send(None)
+            break
+
+
+def _schedule_settings(algorithm):
+    """Schedule constructor arguments matching the island's Algorithm parameters."""
+    return (algorithm.CROSSOVER_POINTS, algorithm.MUTATION_SIZE, algorithm.CROSSOVER_PROB,
+            algorithm.MUTATION_PROB, algorithm.DELTA_EVALUATION, algorithm.UNIFORM_MUTATION_PROB)
+
+
+def _make_schedule(algorithm, genes):
+    return _build_schedule(_schedule_settings(algorithm), genes, algorithm.config, algorithm.rng)
+
+
+def _build_schedule(settings, genes, config, rng=None):
+    schedule = Schedule(*settings, config=config, rng=rng)
+    schedule.classes = dict(genes)
+    schedule.CalculateFitness()
+    return schedule
+
+
+class IslandModel(Solver):
+    """
+    Island-model GA (solver 'islands'): ISLANDS independent Algorithm populations run in
+    separate processes and exchange their top MIGRANTS individuals every MIGRATION_INTERVAL
+    generations, along a 'ring' or 'full' (fully connected) topology. Island i is seeded
+    with seed + i.
+    """
+
+    def __init__(self, config, seed=None, params=None):
+        self.ISLANDS = max(1, multiprocessing.cpu_count() // 2)
+        self.MIGRATION_INTERVAL = 20     # Generations between migrations
+        self.MIGRANTS = 5                # Top-k elites sent by each island
+        self.TOPOLOGY = "ring"           # 'ring' or 'full'
+        self.MAX_GENERATIONS = 500       # Per island
+        self.TIME_LIMIT = None           # Wall-clock budget in seconds (checked between epochs)
+        self.ISLAND_PARAMS = {}          # Algorithm parameters for every island (e.g. POP_SIZE)
+
+        self._apply_params(params)
+
+        if self.TOPOLOGY not in ("ring", "full"):
+            raise ValueError(f"Unknown migration topology: {self.TOPOLOGY}")
+
+        super().__init__(config, seed)
+        self.seed = seed
+
+    def _migrants_for(self, island, elites):
+        """Chromosomes island `island` receives from its neighbours."""
+        if self.ISLANDS < 2:
+            return []
+        if self.TOPOLOGY == "ring":
+            return elites[(island - 1) % self.ISLANDS]
+
+        incoming = []
+        for other, other_elites in enumerate(elites):
+            if other != island:
+                incoming.extend(other_elites)
+        return incoming
+
+    def GetIterationLimit(self):
+        return self.MAX_GENERATIONS
+
+    def Run(self, progress=None):
+        """
+        Evolves the islands epoch by epoch (MIGRATION_INTERVAL generations, then migration) until an
+        island reaches its GOAL_FITNESS, MAX_GENERATIONS, TIME_LIMIT or RequestStop(). If given,
+        progress(generation, bestSchedule) is called after every epoch.
+        """
+        print(f"--- Starting Island Model ({self.ISLANDS} islands, {self.TOPOLOGY} topology) ---")
+        start_time = time.time()
+
+        connections = []
+        processes = []
+        for island in range(self.ISLANDS):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            island_seed = None if self.seed is None else self.seed + island
+            process = multiprocessing.Process(
+                target=_island_main, args=(child_conn, self.config, island_seed, self.ISLAND_PARAMS), daemon=True
+            )
+            process.start()
+            connections.append(parent_conn)
+            processes.append(process)
+
+        try:
+            settings = [conn.recv() for conn in connections][0]
+            reached_goal = False
+            best_fitness = None
+            best_genes = None
+            immigrants = [[] for _ in range(self.ISLANDS)]
+            generation = 0
+
+            while generation < self.MAX_GENERATIONS:
+                step = min(self.MIGRATION_INTERVAL, self.MAX_GENERATIONS - generation)
+                for island, conn in enumerate(connections):
+                    conn.send(("evolve", (step, immigrants[island])))
+                results = [conn.recv() for conn in connections]
+                generation += step
+
+                improved = False
+                for fitness, genes, goal, evaluations in results:
+                    reached_goal = reached_goal or goal
+                    if best_fitness is None or fitness > best_fitness:
+                        best_fitness, best_genes = fitness, genes
+                        improved = True
+                self.evaluations = sum(result[3] for result in results)
+
+                print(f"Generation {generation}: Fittest Score = {best_fitness:.4f}")
+                if improved:
+                    self.bestSchedule = _build_schedule(settings, best_genes, self.config)
+                if progress is not None:
+                    progress(generation, self.bestSchedule)
+
+                if reached_goal:
+                    print("\n--- Goal Schedule Found! ---")
+                    break
+                if self._stop_requested:
+                    self._stop_requested = False
+                    print("\n--- Island Model Stopped (Stop Requested) ---")
+                    break
+                if self.TIME_LIMIT is not None and time.time() - start_time >= self.TIME_LIMIT:
+                    print("\n--- Island Model Stopped (Time Limit Reached) ---")
+                    break
+
+                # Migration: collect every island's elites, then route them by topology
+                for conn in connections:
+                    conn.send(("elites", self.MIGRANTS))
+                elites = [conn.recv() for conn in connections]
+                immigrants = [self._migrants_for(island, elites) for island in range(self.ISLANDS)]
+
+        finally:
+            for conn in connections:
+                try:
+                    conn.send(("stop", None))
+                    conn.recv()
+                except (EOFError, OSError, BrokenPipeError):
+                    pass
+            for process in processes:
+                process.join(timeout=5)
+
+        if generation >= self.MAX_GENERATIONS and not reached_goal:
+            print("\n--- Island Model Finished (Max Generations Reached) ---")
+        return self._finish()
@@ -0,0 +1,100 @@
+# LocalSearch.py
+
+import copy
+
+
+class LocalSearch:
+    """
+    Stochastic first-improvement hill climbing on one Schedule (the memetic stage of the GA).
+    Each step tries a random neighbour: one class re-placed inside its placement domain
+    (compatible room, any day, legal start hour), or two classes swapping positions when
+    each position is legal for the other. A move is kept if it raises the fitness without
+    lowering the hard ratio.
+
+    Moves are scored incrementally: the working copy runs in delta evaluation mode, so a
+    move re-scores only the classes it can affect, and a rejected move is undone the same way.
+    """
+
+    SWAP_PROB = 0.5  # Share of steps that try a swap instead of a single-class move
+
+    def __init__(self, config, rng):
+        self.config = config
+        self.rng = rng
+        self.moves_evaluated = 0
+        self.moves_accepted = 0
+
+    def Improve(self, schedule, max_moves):
+        """Returns an improved copy of the (scored) schedule after up to max_moves steps; the input is unchanged."""
+        work = schedule.copy()
+        delta_evaluation = work.delta_evaluation
+        work.delta_evaluation = True
+        work.CalculateFitness() # Builds the incremental state
+
+        class_ids = list(work.classes.keys())
+        if not class_ids:
+            work.delta_evaluation = delta_evaluation
+            return work
+
+        domains = {
+            class_id: self.config.GetPlacementDomain(class_id, work.DAY_HOURS, work.START_CLOCK_HOUR)
+            for class_id in class_ids
+        }
+        day_slots = self.config.GetNumberOfRooms() * work.DAY_HOURS
+
+        for _ in range(max_moves):
+            class_id = self.rng.choice(class_ids)
+            if self.rng.random() < self.SWAP_PROB:
+                other_id = self.rng.choice(class_ids)
+                changes = self._swap(work, domains, day_slots, class_id, other_id)
+            else:
+                changes = self._move(work, domains, day_slots, class_id)
+
+            if changes:
+                self._try(work, changes)
+
+        # Drop the incremental state unless the GA itself runs in delta mode
+        work.delta_evaluation = delta_evaluation
+        return work if delta_evaluation else copy.deepcopy(work)
+
+    def _move(self, work, domains, day_slots, class_id):
+        room_indices, start_hours = domains[class_id]
+        if not room_indices or not start_hours:
+            return None
+        pos = (self.rng.randrange(work.DAYS_PER_WEEK) * day_slots
+               + self.rng.choice(room_indices) * work.DAY_HOURS + self.rng.choice(start_hours))
+        if pos == work.classes[class_id]:
+            return None
+        return [(class_id, pos)]
+
+    def _swap(self, work, domains, day_slots, class_id, other_id):
+        pos = work.classes[class_id]
+        other_pos = work.classes[other_id]
+        if pos == other_pos or not (self._fits(work, domains[class_id], day_slots, other_pos)
+                                    and self._fits(work, domains[other_id], day_slots, pos)):
+            return None
+        return [(class_id, other_pos), (other_id, pos)]
+
+    @staticmethod
+    def _fits(work, domain, day_slots, pos):
+        room_indices, start_hours = domain
+        room_index, start_time = divmod(pos % day_slots, work.DAY_HOURS)
+        return room_index in room_indices and start_time in start_hours
+
+    def _try(self, work, changes):
+        """Applies the changes and keeps them if they improve the schedule, otherwise undoes them."""
+        fitness, hard_ratio = work.fitness, work.hard_ratio
+        previous = [(class_id, work.classes[class_id]) for class_id, _ in changes]
+
+        for class_id, pos in changes:
+            work.MoveClass(class_id, pos)
+        work.CalculateFitness()
+        self.moves_evaluated += 1
+
+        if work.hard_ratio >= hard_ratio and work.fitness > fitness + 1e-9:
+            self.moves_accepted += 1
+            return True
+
+        for class_id, pos in previous:
+            work.MoveClass(class_id, pos)
+        work.CalculateFitness()
+        return False
@@ -0,0 +1,61 @@
+# ParallelFitness.py
+
+from concurrent.futures import ProcessPoolExecutor
+
+from FitnessState import FitnessState
+
+# --- Worker-side state (set once per worker process by _init_worker) ---
+_worker_tables = None
+
+
+def _init_worker(tables):
+    """Receives the dense configuration tables once, when the worker starts."""
+    global _worker_tables
+    _worker_tables = tables
+
+
+def _evaluate_chunk(chunk):
+    """Scores a list of chromosomes (position arrays in class order) and returns their fitness records."""
+    records = []
+    for genes in chunk:
+        state = FitnessState(_worker_tables)
+        state.Rebuild(genes)
+        records.append((
+            state.GetTotalHardScore(), state.prof_penalty, state.gap_penalty, state.consecutive_penalty,
+            state.lunch_penalty, state.late_long_class_penalty, state.same_subject_consecutive_penalty,
+            state.GetConflicts()
+        ))
+    return records
+
+
+class ParallelFitness:
+    """
+    Farms fitness evaluation out to a process pool. Workers hold the configuration
+    tables; only compact chromosome arrays go out and fitness records come back,
+    so the results are identical to serial evaluation.
+    """
+
+    def __init__(self, tables, workers):
+        self.tables = tables
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,))
+
+    def Evaluate(self, schedules):
+        """Scores every schedule in the list and stores the results on them."""
+        if not schedules:
+            return
+
+        genes = [s.classes.genes for s in schedules]
+
+        # A few chunks per worker keeps the pool busy without per-individual IPC
+        chunk_size = max(1, len(genes) // (self.workers * 4))
+        chunks = [genes[i:i + chunk_size] for i in range(0, len(genes), chunk_size)]
+
+        index = 0
+        for records in self._executor.map(_evaluate_chunk, chunks):
+            for record in records:
+                schedules[index].SetFitnessRecord(record)
+                index += 1
+
+    def Shutdown(self):
+        self._executor.shutdown()
@@ -0,0 +1,12 @@
+# Parameters.py
+
+
+def ApplyParams(target, params):
+    """
+    Overrides target's UPPERCASE parameters (attributes defined before the call) from a
+    {NAME: value} mapping; unknown or lowercase names raise AttributeError.
+    """
+    for name, value in (params or {}).items():
+        if not name.isupper() or not hasattr(target, name):
+            raise AttributeError(f"Unknown {type(target).__name__} parameter: {name}")
+        setattr(target, name, value)
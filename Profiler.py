@@ -0,0 +1,78 @@
+# Profiler.py
+
+import json
+import time
+
+
+class _PhaseTimer:
+    """Context manager adding one timed call to a phase (reused: one instance per phase name)."""
+
+    __slots__ = ('totals', 'start')
+
+    def __init__(self, totals):
+        self.totals = totals  # [calls, seconds], shared with the Profiler
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.totals[1] += time.perf_counter() - self.start
+        self.totals[0] += 1
+        return False
+
+
+class Profiler:
+    """
+    Cumulative wall time and call counts per named phase of a solve. A timed call costs one
+    perf_counter pair; phases must not nest within themselves, and nested phases of different
+    names are both charged (keep them disjoint so the shares add up).
+    """
+
+    def __init__(self):
+        self._phases = {}   # name -> [calls, seconds]
+        self._timers = {}
+        self.started = time.perf_counter()
+
+    def Phase(self, name):
+        """`with profiler.Phase('crossover'):` times the block under name."""
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _PhaseTimer(self._phases.setdefault(name, [0, 0.0]))
+        return timer
+
+    def GetReport(self):
+        """
+        {'total_seconds', 'other_seconds', 'phases': {name: {'calls', 'seconds', 'share', 'mean_us'}}},
+        phases by descending time. 'other' is wall time since creation not covered by any phase.
+        """
+        total = time.perf_counter() - self.started
+        phases = {}
+        for name, (calls, seconds) in sorted(self._phases.items(), key=lambda item: -item[1][1]):
+            phases[name] = {
+                "calls": calls,
+                "seconds": seconds,
+                "share": seconds / total if total else 0.0,
+                "mean_us": seconds / calls * 1e6 if calls else 0.0,
+            }
+        return {
+            "total_seconds": total,
+            "other_seconds": max(0.0, total - sum(seconds for _, seconds in self._phases.values())),
+            "phases": phases,
+        }
+
+    @staticmethod
+    def Write(report, filename):
+        with open(filename, "w") as f:
+            json.dump(report, f, indent=2)
+
+    @staticmethod
+    def FormatReport(report):
+        """Printable lines, one per phase."""
+        lines = [f"Profile: {report['total_seconds']:.3f} s total"]
+        for name, phase in report["phases"].items():
+            lines.append(f"  {name:<16} {phase['seconds']:9.3f} s {phase['share']:6.1%} "
+                         f"{phase['calls']:>9} calls {phase['mean_us']:10.1f} us/call")
+        lines.append(f"  {'other':<16} {report['other_seconds']:9.3f} s")
+        return lines
@@ -3,11 +3,22 @@
 import random
 from Configuration import Configuration as ConfigurationClass
 import copy 
-from collections import defaultdict
 import sys 
+from FitnessState import FitnessState, FitnessTables
+from Chromosome import Chromosome
 
 class Schedule:
     
+    # Fixed attribute layout keeps per-individual memory small in large populations
+    __slots__ = (
+        'config', 'rng', 'crossover_points', 'mutation_size', 'crossover_prob', 'mutation_prob',
+        'uniform_mutation_prob', 'delta_evaluation', '_fitness_state', '_changed', '_classes', '_dirty',
+        'conflicts', 'fitness',
+        'hard_ratio', 'total_hard_score', 'max_hard_score',
+        'prof_penalty', 'gap_penalty', 'consecutive_penalty', 'lunch_penalty',
+        'late_long_class_penalty', 'same_subject_consecutive_penalty',
+    )
+    
     # Constants required by Algorithm.py
     DAY_HOURS = 10  # 8:00 AM to 6:00 PM (10 slots)
     START_CLOCK_HOUR = 8  # Start time 8 AM
@@ -21,22 +32,42 @@ class Schedule:
     LATE_LONG_CLASS_WEIGHT = 0.5
     SAME_SUBJECT_CONSECUTIVE_WEIGHT = 1.0 
     
+    # Soft Constraint Time Slots (hour indices from START_CLOCK_HOUR)
+    LUNCH_SLOT_INDEX = 4 
+    LATE_START_HOUR_INDEX = 7 
+    
     # --- Class Initialization ---
-    def __init__(self, crossover_points, mutation_size, crossover_prob, mutation_prob):
+    def __init__(self, crossover_points, mutation_size, crossover_prob, mutation_prob, delta_evaluation=False,
+                 uniform_mutation_prob=1.0, config=None, rng=None):
+        
+        # The configuration is the per-solve context; fall back to the default instance
+        if config is None:
+            try:
+                config = ConfigurationClass.getInstance()
+            except Exception:
+                print("CRITICAL: Configuration is not initialized before Schedule.")
+                sys.exit(1)
+        self.config = config
         
-        try:
-            self.config = ConfigurationClass.getInstance()
-        except Exception:
-            print("CRITICAL: Configuration is not initialized before Schedule.")
-            sys.exit(1)
+        # Random source for initialization, crossover and mutation (the module RNG unless a solve provides one)
+        self.rng = rng if rng is not None else random
             
         self.crossover_points = crossover_points
         self.mutation_size = mutation_size
         self.crossover_prob = crossover_prob
         self.mutation_prob = mutation_prob
+        # Share of mutations that move random classes even when some classes fail hard constraints
+        self.uniform_mutation_prob = uniform_mutation_prob
+        
+        # Delta evaluation: keep occupancy/penalty state and re-score only moved classes
+        self.delta_evaluation = delta_evaluation
+        self._fitness_state = None
+        self._changed = set()
         
         # 'classes' maps CourseClass ID to its starting position (pos) in the timetable array
-        self.classes = {}
+        self._classes = Chromosome.ForConfig(self.config)
+        self._dirty = True # Genes changed since the last evaluation (fitness is stale)
+        self.conflicts = () # Class order indices failing HC1-HC4 at the last evaluation
         self.fitness = 0.0
         
         # Hard Constraint Metrics
@@ -52,79 +83,155 @@ class Schedule:
         self.late_long_class_penalty = 0
         self.same_subject_consecutive_penalty = 0
 
+    @property
+    def classes(self):
+        return self._classes
+
+    @classes.setter
+    def classes(self, positions):
+        """Accepts a Chromosome or any {class_id: pos} mapping."""
+        if not isinstance(positions, Chromosome):
+            positions = Chromosome.ForConfig(self.config, positions)
+        self._classes = positions
+        self._fitness_state = None
+        self._changed = set()
+        self._dirty = True
+
+    def IsDirty(self):
+        """True if the genes changed since the last evaluation, i.e. the fitness fields are stale."""
+        return self._dirty
+
+    def MarkDirty(self):
+        """For code that edits genes in place through classes[...] outside Crossover/Mutation."""
+        self._dirty = True
+
+    def GetPendingMoves(self):
+        """
+        (class_id, position at the last evaluation) of every class moved since that evaluation, so
+        the moves can be undone with MoveClass. Needs delta evaluation: the kept fitness state
+        remembers the evaluated positions. Costs O(classes moved), not O(classes).
+        """
+        state = self._fitness_state
+        if state is None:
+            raise ValueError("GetPendingMoves needs an evaluated schedule in delta evaluation mode")
+        genes = self._classes.genes
+        class_index = state.tables.class_index
+        moves = []
+        for class_id in self._changed:
+            j = class_index[class_id]
+            if genes[j] != state.positions[j]:
+                moves.append((class_id, state.positions[j]))
+        return moves
+
+    def MoveClass(self, class_id, pos):
+        """Places one class at pos; in delta mode the next CalculateFitness re-scores only what it affects."""
+        self._classes[class_id] = pos
+        self._changed.add(class_id)
+        self._dirty = True
+
     # --- Core GA Methods ---
 
-    def copy(self):
-        """Creates a shallow copy of the Schedule."""
-        new_schedule = Schedule(self.crossover_points, self.mutation_size, self.crossover_prob, self.mutation_prob)
-        new_schedule.classes = self.classes.copy() 
+    def _clone(self):
+        """Copies settings and scores; the gene buffer is copied once, without a throwaway __init__."""
+        new_schedule = Schedule.__new__(Schedule)
+        new_schedule.config = self.config
+        new_schedule.rng = self.rng
+        new_schedule.crossover_points = self.crossover_points
+        new_schedule.mutation_size = self.mutation_size
+        new_schedule.crossover_prob = self.crossover_prob
+        new_schedule.mutation_prob = self.mutation_prob
+        new_schedule.uniform_mutation_prob = self.uniform_mutation_prob
+        new_schedule.delta_evaluation = self.delta_evaluation
+        new_schedule._fitness_state = None
+        new_schedule._changed = set()
+        new_schedule._classes = self._classes.copy()
+        new_schedule._dirty = self._dirty
+        new_schedule.conflicts = self.conflicts
         new_schedule.fitness = self.fitness
         new_schedule.hard_ratio = self.hard_ratio
         new_schedule.total_hard_score = self.total_hard_score
         new_schedule.max_hard_score = self.max_hard_score
+        new_schedule.prof_penalty = self.prof_penalty
+        new_schedule.gap_penalty = self.gap_penalty
+        new_schedule.consecutive_penalty = self.consecutive_penalty
+        new_schedule.lunch_penalty = self.lunch_penalty
+        new_schedule.late_long_class_penalty = self.late_long_class_penalty
+        new_schedule.same_subject_consecutive_penalty = self.same_subject_consecutive_penalty
+        return new_schedule
+
+    def copy(self):
+        """Creates a shallow copy of the Schedule."""
+        new_schedule = self._clone()
+        if self._fitness_state is not None:
+            new_schedule._fitness_state = self._fitness_state.copy()
+            new_schedule._changed = self._changed.copy()
         return new_schedule
         
     def __deepcopy__(self, memo):
         """Creates a deep copy for use with copy.deepcopy"""
-        new_schedule = Schedule(self.crossover_points, self.mutation_size, self.crossover_prob, self.mutation_prob)
-        new_schedule.classes = self.classes.copy()
-        new_schedule.fitness = self.fitness
-        new_schedule.hard_ratio = self.hard_ratio
-        new_schedule.total_hard_score = self.total_hard_score
-        new_schedule.max_hard_score = self.max_hard_score
-        return new_schedule
+        return self._clone()
+        
+    def _random_position(self, class_id, duration):
+        """
+        Samples a position from the class's precomputed placement domain (HC1/HC3 room fit,
+        HC2 day boundary and group window). Returns None if no room is compatible.
+        """
+        num_hours = self.DAY_HOURS
+        room_indices, start_hours = self.config.GetPlacementDomain(class_id, num_hours, self.START_CLOCK_HOUR)
+        
+        if not room_indices:
+            return None
+        
+        # 1. Select a random compatible room index (0 to N-1 among ALL rooms)
+        room_index = self.rng.choice(room_indices)
+        
+        # 2. Choose a random day (0 to DAYS_PER_WEEK-1)
+        random_day = self.rng.randrange(self.DAYS_PER_WEEK)
+        
+        # 3. Choose a legal start time; if none exists, any start and let HC2 penalize it
+        if start_hours:
+            random_time = self.rng.choice(start_hours)
+        else:
+            random_time = self.rng.randrange(max(0, num_hours - duration) + 1)
+        
+        # Total slots per day (Num_Rooms * Num_Hours)
+        day_slots = self.config.GetNumberOfRooms() * num_hours
         
-    def _get_compatible_rooms(self, cc):
-        """Helper to filter rooms based on Lab/Theory requirement and capacity."""
-        compatible_rooms = []
-        for room_id, room in self.config.GetRooms().items():
-            # HC3 Check: Lab required matches room type, AND HC1 Check: Capacity is sufficient
-            if cc.IsLabRequired() == room.IsLab() and cc.GetGroup().GetSize() <= room.GetSize():
-                compatible_rooms.append(room_id)
-        return compatible_rooms
+        # Calculate the final position: (Day * Slots_Per_Day) + (Room_Index * Num_Hours) + Time_Index
+        return (random_day * day_slots) + (room_index * num_hours) + random_time
 
 
     def MakeNewFromPrototype(self):
-        """Initializes a new schedule with a random valid placement for all classes, respecting HC3 and HC1."""
-        new_schedule = self.copy() # Start with an empty copy
-        
-        num_hours = self.DAY_HOURS
-        num_days = self.DAYS_PER_WEEK
-        new_schedule.classes = {} 
+        """Initializes a new schedule with a random valid placement for all classes, respecting HC1-HC3."""
+        new_schedule = self._clone() # Every gene changes, so the next evaluation is a full one
+        new_schedule._dirty = True
 
         for class_id, cc in self.config.GetCourseClasses().items():
-            duration = cc.GetDuration()
-            
-            # --- NEW LOGIC: Filter compatible rooms first ---
-            compatible_room_ids = self._get_compatible_rooms(cc)
+            random_pos = self._random_position(class_id, cc.GetDuration())
             
-            if not compatible_room_ids:
+            if random_pos is None:
                  # If no room is compatible (e.g., all too small), assign 0 and let HC1 or HC3 penalize it
-                 new_schedule.classes[class_id] = 0
-                 continue
+                 random_pos = 0
             
-            # 1. Select a random compatible room index
-            room_id = random.choice(compatible_room_ids)
-            # This is the INDEX of the selected room among ALL rooms (0 to N-1)
-            room_index = list(self.config.GetRooms().keys()).index(room_id) 
+            new_schedule.classes[class_id] = random_pos
 
-            # 2. Determine max possible time index a class can *start* at
-            max_start_time_index = num_hours - duration
-            if max_start_time_index < 0:
-                 # Class is too long for the day, let HC2 penalize it, but assign a default pos
-                 max_start_time_index = 0
+        return new_schedule
 
-            # 3. Choose a random day (0 to DAYS_PER_WEEK-1) and start time (0 to max_start_time_index)
-            random_day = random.randrange(num_days)
-            random_time = random.randrange(max_start_time_index + 1)
-            
-            # Total slots per day (Num_Rooms * Num_Hours)
-            day_slots = self.config.GetNumberOfRooms() * num_hours
-            
-            # Calculate the final position: (Day * Slots_Per_Day) + (Room_Index * Num_Hours) + Time_Index
-            random_pos = (random_day * day_slots) + (room_index * num_hours) + random_time
-            
-            new_schedule.classes[class_id] = random_pos
+    def MakeSeededFromPrototype(self, seeding):
+        """
+        Like MakeNewFromPrototype, but positions come from a constructive seeding (GraphSeeding).
+        Classes the seeding could not place get a random valid placement instead.
+        """
+        new_schedule = self._clone()
+        new_schedule._dirty = True
+        
+        course_classes = self.config.GetCourseClasses()
+        for class_id, pos in zip(new_schedule.classes.keys(), seeding.Construct(self)):
+            if pos is None:
+                pos = self._random_position(class_id, course_classes[class_id].GetDuration())
+                if pos is None:
+                    pos = 0
+            new_schedule.classes[class_id] = pos
 
         return new_schedule
 
@@ -134,9 +241,9 @@ class Schedule:
         child = self.copy()
         
         class_ids = list(child.classes.keys())
-        random.shuffle(class_ids)
+        self.rng.shuffle(class_ids)
         
-        split_points = sorted(random.sample(range(len(class_ids)), self.crossover_points))
+        split_points = sorted(self.rng.sample(range(len(class_ids)), self.crossover_points))
         
         use_parent2 = False
         for i, class_id in enumerate(class_ids):
@@ -144,240 +251,131 @@ class Schedule:
                 use_parent2 = not use_parent2
             
             if use_parent2:
-                if class_id in parent2.classes:
+                if class_id in parent2.classes and child.classes[class_id] != parent2.classes[class_id]:
                     child.classes[class_id] = parent2.classes[class_id]
+                    child._changed.add(class_id)
+                    child._dirty = True
         
         return child
 
     def Mutation(self):
-        """Performs simple random class reassignment mutation, respecting HC3 and HC1."""
-        num_hours = self.DAY_HOURS
-        num_days = self.DAYS_PER_WEEK
-        day_slots = self.config.GetNumberOfRooms() * num_hours
-        
+        """
+        Moves classes that failed hard constraints into free slots (conflict-directed), or with
+        probability uniform_mutation_prob, and whenever there are no conflicts, random classes anywhere.
+        """
+        if self.conflicts and self.rng.random() >= self.uniform_mutation_prob:
+            self._conflict_mutation()
+        else:
+            self._uniform_mutation()
+
+    def _uniform_mutation(self):
+        """Performs simple random class reassignment mutation, respecting HC1-HC3."""
         class_ids = list(self.classes.keys())
         if not class_ids: return
 
-        for class_id in random.sample(class_ids, min(self.mutation_size, len(class_ids))):
-            cc = self.config.GetCourseClasses()[class_id]
-            duration = cc.GetDuration()
-            
-            # --- NEW LOGIC: Filter compatible rooms first ---
-            compatible_room_ids = self._get_compatible_rooms(cc)
+        course_classes = self.config.GetCourseClasses()
+        for class_id in self.rng.sample(class_ids, min(self.mutation_size, len(class_ids))):
+            random_pos = self._random_position(class_id, course_classes[class_id].GetDuration())
             
-            if not compatible_room_ids:
-                 # Cannot place this class anywhere valid due to capacity/type. Leave it to be penalized.
+            if random_pos is None or random_pos == self.classes[class_id]:
+                 # Cannot place this class anywhere valid due to capacity/type (leave it to be penalized),
+                 # or it was drawn back onto its current position
                  continue
-
-            # 1. Select a random compatible room index
-            room_id = random.choice(compatible_room_ids)
-            room_index = list(self.config.GetRooms().keys()).index(room_id) 
-
-            # 2. Determine max possible time index
-            max_start_time_index = num_hours - duration
-            if max_start_time_index < 0:
-                 max_start_time_index = 0
-
-            # 3. Choose a random day and start time
-            random_day = random.randrange(num_days)
-            random_time = random.randrange(max_start_time_index + 1)
-            
-            # Calculate the final position
-            random_pos = (random_day * day_slots) + (room_index * num_hours) + random_time
             
             self.classes[class_id] = random_pos
+            self._changed.add(class_id)
+            self._dirty = True
+
+    def _conflict_mutation(self):
+        """
+        Re-places up to mutation_size of the classes recorded in self.conflicts (for fresh offspring,
+        those of the parent's last evaluation) at random positions where their room, professor and
+        group are free in the current genes. A class without a free position gets a uniform move.
+        """
+        tables = self.GetFitnessTables()
+        genes = self._classes.genes
+        targets = self.conflicts
+        if len(targets) > self.mutation_size:
+            targets = self.rng.sample(targets, self.mutation_size)
+        
+        # Delta mode: correct the kept state's booked hours instead of re-marking every class
+        state = self._fitness_state
+        if state is not None and state.tables is tables:
+            occupancy = state.GetOccupancy(genes, self._changed, skip=set(targets))
+        else:
+            occupancy = tables.GetOccupancy(genes, skip=set(targets))
+        course_classes = self.config.GetCourseClasses()
+        for j in targets:
+            class_id = tables.class_ids[j]
+            room_indices, start_hours = self.config.GetPlacementDomain(class_id, self.DAY_HOURS, self.START_CLOCK_HOUR)
+            free = tables.GetFreePositions(j, occupancy, room_indices, start_hours)
+            if free:
+                pos = self.rng.choice(free)
+            else:
+                pos = self._random_position(class_id, course_classes[class_id].GetDuration())
+            
+            if pos is not None and pos != genes[j]:
+                genes[j] = pos
+                self._changed.add(class_id)
+                self._dirty = True
+            tables.Occupy(occupancy, j, genes[j])
 
 
     # --- Fitness Calculation ---
     def CalculateFitness(self):
-        config = self.config
-        
-        # Constants
-        num_rooms = config.GetNumberOfRooms()
-        num_days = self.DAYS_PER_WEEK
-        num_hours = self.DAY_HOURS 
-        day_slots = num_rooms * num_hours
-        cloned_classes = config.GetCourseClasses()
+        """
+        Scores the schedule. Classes are booked greedily in configuration order on flat
+        (day, hour) occupancy planes for rooms, professors and groups; a class fails if it
+        breaks HC1-HC4 against an earlier booked class. Soft penalties come from the booked hours.
+        """
+        tables = self.GetFitnessTables()
+        state = self._fitness_state
         
-        slot_map = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: None)))
+        if self.delta_evaluation and state is not None and state.tables is tables:
+            # Delta mode: only re-score classes moved since the last call
+            state.Update(self._classes.genes, self._changed)
+        else:
+            state = FitnessState(tables)
+            state.Rebuild(self._classes.genes)
+            self._fitness_state = state if self.delta_evaluation else None
+        self._changed = set()
+        self._dirty = False
+        self.conflicts = state.GetConflicts()
         
-        # Trackers for Soft Constraints
-        prof_day_hours = defaultdict(lambda: defaultdict(int))
-        group_day_slots = defaultdict(lambda: defaultdict(list)) 
-        prof_consecutive_tracker = defaultdict(lambda: defaultdict(list)) 
+        self.prof_penalty = state.prof_penalty
+        self.gap_penalty = state.gap_penalty
+        self.consecutive_penalty = state.consecutive_penalty
+        self.lunch_penalty = state.lunch_penalty
+        self.late_long_class_penalty = state.late_long_class_penalty
+        self.same_subject_consecutive_penalty = state.same_subject_consecutive_penalty
         
-        # Penalties reset
-        self.prof_penalty = 0
-        self.gap_penalty = 0
-        self.consecutive_penalty = 0
-        self.lunch_penalty = 0 
-        self.late_long_class_penalty = 0
-        self.same_subject_consecutive_penalty = 0
+        self._apply_scores(state.GetTotalHardScore())
 
-        total_hard_score = 0
-        LUNCH_SLOT_INDEX = 4 
-        LATE_START_HOUR_INDEX = 7 
-        
-        
-        # --- HARD CONSTRAINT CHECKING AND SOFT CONSTRAINT TRACKING LOOP ---
-        for class_id, start_pos in self.classes.items():
-            cc = cloned_classes[class_id]
-            duration = cc.GetDuration()
-            current_class_score = 5.0
-            
-            day = start_pos // day_slots
-            time_room = start_pos % day_slots
-            room_index = time_room // num_hours
-            start_time = time_room % num_hours
-            
-            room_id = room_index
-            room = config.GetRooms().get(room_id)
-            group = cc.GetGroup()
-            
-            failure_reason = ""
-            
-            # HC1: Room Check - ensures room exists and capacity
-            if room is None or group.GetSize() > room.GetSize():
-                 current_class_score = 0.0
-                 failure_reason = "HC1: Room/Capacity Mismatch"
-                 # DEBUG REMOVED: if self.hard_ratio < 1.0 and failure_reason: print(...)
-                 continue
-                 
-            # HC3: Lab Check - only lab classes in lab rooms, only theory in theory rooms
-            if cc.IsLabRequired() != room.IsLab():
-                 current_class_score = 0.0
-                 failure_reason = "HC3: Lab/Theory Mismatch"
-                 # DEBUG REMOVED: if self.hard_ratio < 1.0 and failure_reason: print(...)
-                 continue
-                 
-            # --- HC2 & HC4: Time Overlap/Boundary Check (Pre-check) ---
-            is_valid_placement = True 
-            
-            # HC2 Time Boundary Check (Class runs off the end of the day)
-            if start_time + duration > num_hours:
-                is_valid_placement = False
-                failure_reason = "HC2: Time Boundary (End of Day)"
-                
-            # HC2 Time Window Check (outside the group's availability)
-            window_start_index = group.GetAvailableStartTime() - self.START_CLOCK_HOUR
-            window_end_index = group.GetAvailableEndTime() - self.START_CLOCK_HOUR 
-            if start_time < window_start_index or start_time + duration > window_end_index:
-                is_valid_placement = False
-                failure_reason = "HC2: Group Time Window"
-                
-            if not is_valid_placement:
-                current_class_score = 0.0 
-                # DEBUG REMOVED: if self.hard_ratio < 1.0 and failure_reason: print(...)
-                continue
+    def GetFitnessTables(self):
+        """Dense per-configuration tables shared by the fitness evaluators."""
+        return FitnessTables.ForConfig(
+            self.config, self.DAY_HOURS, self.DAYS_PER_WEEK, self.START_CLOCK_HOUR,
+            self.LUNCH_SLOT_INDEX, self.LATE_START_HOUR_INDEX
+        )
 
+    def GetFitnessRecord(self):
+        """Compact result of the last evaluation: (total_hard_score, six soft penalties, conflicts)."""
+        return (self.total_hard_score, self.prof_penalty, self.gap_penalty, self.consecutive_penalty,
+                self.lunch_penalty, self.late_long_class_penalty, self.same_subject_consecutive_penalty,
+                self.conflicts)
 
-            # Check overlaps for all slots in the duration
-            for i in range(duration):
-                current_time = start_time + i
-                
-                # Check Overlap (Room, Professor, Group)
-                if day < num_days and current_time < num_hours:
-                    
-                    # 1. Room Overlap Check
-                    if slot_map[day][current_time][room_id] is not None:
-                         current_class_score = 0.0
-                         failure_reason = "HC4: Room Overlap"
-                         break 
-                        
-                    # 2. Professor and Group Overlap Check
-                    for other_room_id, other_cc in slot_map[day][current_time].items():
-                         if other_cc is None: continue
-                         
-                         if cc.GetProfessor().GetId() == other_cc.GetProfessor().GetId():
-                              current_class_score = 0.0
-                              failure_reason = "HC4: Professor Overlap"
-                              break 
-                         
-                         if cc.GetGroup().GetId() == other_cc.GetGroup().GetId():
-                              current_class_score = 0.0
-                              failure_reason = "HC4: Group Overlap"
-                              break 
-                            
-                    if current_class_score == 0.0: break 
-                    
-                    # If valid, book the slot for soft constraint tracking
-                    slot_map[day][current_time][room_id] = cc
-                    
-                    # Soft Constraint Tracking (Only for valid slots)
-                    prof_day_hours[cc.GetProfessor().GetId()][day] += 1
-                    group_day_slots[group.GetId()][day].append(current_time)
-                    prof_consecutive_tracker[cc.GetProfessor().GetId()][day].append(current_time)
-                    
-                    # SC4: Lunch Break Penalty
-                    if current_time == LUNCH_SLOT_INDEX:
-                         self.lunch_penalty += 1 
-                        
-                    # SC5: Late Long Class Penalty (Applied only to the START of the class)
-                    if i == 0 and start_time >= LATE_START_HOUR_INDEX and duration > 1:
-                         self.late_long_class_penalty += 1
-                
-            # If the class passed all hard checks for its entire duration:
-            if current_class_score > 0.0:
-                 total_hard_score += 5.0
-            else:
-                 total_hard_score += 0.0 
-                 # DEBUG REMOVED: if self.hard_ratio < 1.0 and failure_reason: print(...)
+    def SetFitnessRecord(self, record):
+        """Applies a result computed elsewhere (batch evaluator, worker process, cache)."""
+        (total_hard_score, self.prof_penalty, self.gap_penalty, self.consecutive_penalty,
+         self.lunch_penalty, self.late_long_class_penalty, self.same_subject_consecutive_penalty,
+         self.conflicts) = record
+        self._dirty = False
+        self._apply_scores(total_hard_score)
 
-        # --- SOFT CONSTRAINT CALCULATIONS (Post-processing) ---
-        
-        # SC1: Penalize Professor Overload (> 5 hours/day)
-        for prof_id, days in prof_day_hours.items():
-            for day, hours in days.items():
-                if hours > 5:
-                    self.prof_penalty += (hours - 5)
-                    
-        # SC2: Penalize Group Gaps (Large gaps between classes)
-        for group_id, days in group_day_slots.items():
-            for day, slots in days.items():
-                if len(slots) > 1:
-                    slots.sort()
-                    for i in range(len(slots) - 1):
-                        gap = slots[i+1] - slots[i]
-                        if gap > 1:
-                            self.gap_penalty += (gap - 1)
-                            
-        # SC3: Penalize Professor Consecutive Classes (More than 3 consecutive)
-        for prof_id, days in prof_consecutive_tracker.items():
-            for day, slots in days.items():
-                slots.sort()
-                consecutive_count = 0
-                if slots:
-                    consecutive_count = 1
-                    for i in range(len(slots) - 1):
-                        if slots[i+1] == slots[i] + 1:
-                            consecutive_count += 1
-                        else:
-                            consecutive_count = 1
-                            
-                        if consecutive_count > 3:
-                            self.consecutive_penalty += 1
+    def _apply_scores(self, total_hard_score):
+        """Combines the hard score and the stored soft penalties into the final fitness."""
+        config = self.config
         
-        # SC6: Penalize same-subject/group consecutive THEORY classes (1-hour sessions only)
-        for day in range(num_days):
-             for time_index in range(num_hours - 1): 
-                 current_slot_classes = [slot_map[day][time_index][r_id] for r_id in slot_map[day][time_index] if slot_map[day][time_index][r_id]]
-                 next_slot_classes = [slot_map[day][time_index + 1][r_id] for r_id in slot_map[day][time_index + 1] if slot_map[day][time_index + 1][r_id]]
-
-                 for current_cc in current_slot_classes:
-                      if current_cc.IsLabRequired() or current_cc.GetDuration() != 1: 
-                           continue
-                          
-                      current_group_id = current_cc.GetGroup().GetId()
-                      current_course_id = current_cc.GetCourse().GetId()
-                          
-                      for next_cc in next_slot_classes:
-                           if next_cc.IsLabRequired() or next_cc.GetDuration() != 1:
-                               continue
-                               
-                           if (next_cc.GetGroup().GetId() == current_group_id and 
-                               next_cc.GetCourse().GetId() == current_course_id):
-                               self.same_subject_consecutive_penalty += 1
-
         # --- FINAL FITNESS CALCULATION ---
         
         MAX_RAW_PENALTY = 10 
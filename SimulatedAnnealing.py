@@ -0,0 +1,178 @@
+# SimulatedAnnealing.py
+
+from Schedule import Schedule
+from GraphSeeding import GraphSeeding
+from Solver import Solver
+import copy
+import math
+import time
+
+
+class SimulatedAnnealing(Solver):
+    """
+    Simulated annealing solver ('sa'). A single Schedule is perturbed with the GA's mutation
+    move (MOVE_SIZE classes, conflict-directed or uniform). Better neighbours are always kept,
+    and worse ones pass with probability exp(delta / T) while the temperature T cools over the
+    budget (MAX_STEPS and/or TIME_LIMIT). After REHEAT_AFTER steps without a new best, the
+    temperature is raised again and cools over the rest of the budget.
+
+    The schedule runs in delta evaluation mode: a step re-scores only the moved classes, and
+    a rejected step is undone the same way.
+    """
+
+    COOLING_SCHEDULES = ("geometric", "linear", "lundy_mees")
+    CALIBRATION_MOVES = 100  # Neighbours sampled to calibrate the initial temperature
+
+    def __init__(self, config, seed=None, params=None):
+        self.MAX_STEPS = 200000          # Neighbours evaluated
+        self.TIME_LIMIT = None           # Wall-clock budget in seconds (None: steps only)
+        self.GOAL_FITNESS = 4.4
+        self.INITIAL_TEMPERATURE = None  # None: calibrated so INITIAL_ACCEPTANCE of sampled worse moves pass
+        self.INITIAL_ACCEPTANCE = 0.5
+        self.FINAL_TEMPERATURE = 0.001
+        self.COOLING = "geometric"       # 'geometric', 'linear' or 'lundy_mees'
+        self.REHEAT_AFTER = 20000        # Steps without a new best before reheating (0: never)
+        self.REHEAT_TEMPERATURE = 0.5    # Share of the initial temperature a reheat restores
+        self.MOVE_SIZE = 1               # Classes moved per step
+        self.UNIFORM_MUTATION_PROB = 0.2 # Otherwise moves relocate clashing classes into free slots
+        self.SEEDING = "random"          # Start schedule: 'random' or 'dsatur'
+        self.REPORT_INTERVAL = 1000      # Steps between status lines / progress callbacks
+
+        self._apply_params(params)
+
+        if self.COOLING not in self.COOLING_SCHEDULES:
+            raise ValueError(f"Unknown cooling schedule: {self.COOLING}")
+        if self.SEEDING not in ("random", "dsatur"):
+            raise ValueError(f"Unknown seeding mode: {self.SEEDING}")
+
+        super().__init__(config, seed)
+        self.temperature = None
+        self.initial_temperature = None
+        self.accepted = 0
+        self.reheats = 0
+
+        prototype = Schedule(0, self.MOVE_SIZE, 0.0, 1.0, True, self.UNIFORM_MUTATION_PROB,
+                             config=self.config, rng=self.rng)
+        if self.SEEDING == "dsatur":
+            self.current = prototype.MakeSeededFromPrototype(GraphSeeding(self.config, prototype.GetFitnessTables()))
+        else:
+            self.current = prototype.MakeNewFromPrototype()
+        self.current.CalculateFitness()
+        self.evaluations += 1
+        self.bestSchedule = copy.deepcopy(self.current)
+
+    def GetIterationLimit(self):
+        return self.MAX_STEPS
+
+    def _step(self):
+        """
+        Applies one random move to the current schedule and scores it. Returns the fitness
+        change and the moved class ids, or None if the move left the genes unchanged.
+        """
+        current = self.current
+        fitness = current.fitness
+
+        current.Mutation()
+        if not current.IsDirty():
+            return None
+        moved = current.GetPendingMoves()
+
+        current.CalculateFitness()
+        self.evaluations += 1
+        return current.fitness - fitness, moved
+
+    def _undo(self, moved):
+        for class_id, pos in moved:
+            self.current.MoveClass(class_id, pos)
+        self.current.CalculateFitness()
+
+    def _calibrate(self):
+        """Initial temperature at which a typical worsening move is accepted with INITIAL_ACCEPTANCE."""
+        worse = []
+        for _ in range(self.CALIBRATION_MOVES):
+            result = self._step()
+            if result is None:
+                continue
+            delta, moved = result
+            if delta < 0:
+                worse.append(-delta)
+            self._undo(moved)
+
+        if not worse:
+            return 1.0
+        return max(sum(worse) / len(worse) / -math.log(self.INITIAL_ACCEPTANCE), self.FINAL_TEMPERATURE)
+
+    def _cooled(self, start_temperature, fraction):
+        """Temperature after cooling the given fraction (0..1) of the way from start_temperature."""
+        final = min(self.FINAL_TEMPERATURE, start_temperature)
+        if self.COOLING == "geometric":
+            return start_temperature * (final / start_temperature) ** fraction
+        if self.COOLING == "linear":
+            return start_temperature + (final - start_temperature) * fraction
+        # Lundy-Mees: T / (1 + beta * T) per step, written in closed form over the remaining budget
+        return start_temperature / (1.0 + (start_temperature / final - 1.0) * fraction)
+
+    def Run(self, progress=None):
+        """
+        Anneals until GOAL_FITNESS, the step/time budget or RequestStop(). If given,
+        progress(step, bestSchedule) is called every REPORT_INTERVAL steps.
+        """
+        print("--- Starting Simulated Annealing ---")
+        start_time = time.time()
+
+        if self.INITIAL_TEMPERATURE is not None:
+            self.initial_temperature = self.INITIAL_TEMPERATURE
+        else:
+            self.initial_temperature = self._calibrate()
+        phase_temperature = self.initial_temperature
+        phase_start = 0.0                # Budget fraction at which the current cooling phase started
+        last_improvement = 0
+
+        for step in range(1, self.MAX_STEPS + 1):
+            used = (step - 1) / self.MAX_STEPS
+            if self.TIME_LIMIT is not None:
+                elapsed = time.time() - start_time
+                if elapsed >= self.TIME_LIMIT:
+                    print("\n--- Annealing Finished (Time Limit Reached) ---")
+                    return self._finish()
+                used = max(used, elapsed / self.TIME_LIMIT)
+
+            if self.REHEAT_AFTER and step - last_improvement >= self.REHEAT_AFTER:
+                phase_temperature = self.initial_temperature * self.REHEAT_TEMPERATURE
+                phase_start = used
+                last_improvement = step
+                self.reheats += 1
+            self.temperature = self._cooled(phase_temperature, (used - phase_start) / max(1.0 - phase_start, 1e-9))
+
+            result = self._step()
+            if result is not None:
+                delta, moved = result
+                if delta >= 0 or self.rng.random() < math.exp(delta / self.temperature):
+                    self.accepted += 1
+                    if self.current.fitness > self.bestSchedule.fitness:
+                        self.bestSchedule = copy.deepcopy(self.current)
+                        last_improvement = step
+                else:
+                    self._undo(moved)
+
+            if step % self.REPORT_INTERVAL == 0:
+                print(f"Step {step}: Fittest Score = {self.bestSchedule.fitness:.4f} (T = {self.temperature:.5f})")
+                if progress is not None:
+                    progress(step, self.bestSchedule)
+
+            if self.bestSchedule.fitness >= self.GOAL_FITNESS:
+                print("\n--- Goal Schedule Found! ---")
+                return self._finish()
+
+            if self._stop_requested:
+                self._stop_requested = False
+                print("\n--- Annealing Stopped (Stop Requested) ---")
+                return self._finish()
+
+        print("\n--- Annealing Finished (Max Steps Reached) ---")
+        return self._finish()
+
+    def _print_statistics(self):
+        super()._print_statistics()
+        print(f"Annealing: {self.accepted} moves accepted, {self.reheats} reheats, "
+              f"initial T = {self.initial_temperature:.5f}, final T = {self.temperature:.5f}")
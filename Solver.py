@@ -0,0 +1,135 @@
+# Solver.py
+
+from Schedule import Schedule
+from Parameters import ApplyParams
+import random
+import copy
+
+# Registered search engines: CLI/GUI name -> display name (see CreateSolver)
+SOLVERS = {
+    "ga": "Genetic Algorithm",
+    "sa": "Simulated Annealing",
+    "exact": "Exact Search",
+    "islands": "Island Model",
+}
+
+
+def CreateSolver(name, config, seed=None, params=None):
+    """Builds the solver registered under name ('ga', 'sa', 'exact', 'islands') for the configuration."""
+    if name == "ga":
+        from Algorithm import Algorithm
+        return Algorithm(config, seed=seed, params=params)
+    if name == "sa":
+        from SimulatedAnnealing import SimulatedAnnealing
+        return SimulatedAnnealing(config, seed=seed, params=params)
+    if name == "exact":
+        from BacktrackingSolver import BacktrackingSolver
+        return BacktrackingSolver(config, seed=seed, params=params)
+    if name == "islands":
+        from IslandModel import IslandModel
+        return IslandModel(config, seed=seed, params=params)
+    raise ValueError(f"Unknown solver: {name}")
+
+
+class Solver:
+    """
+    Common interface of the search engines. A solver owns its configuration and RNG,
+    takes UPPERCASE parameter overrides, and Run(progress) returns the best Schedule found
+    (progress(iteration, bestSchedule) is called periodically; RequestStop() makes Run return
+    early with the best so far). Subclasses define their parameters before calling _apply_params.
+    """
+
+    def __init__(self, config, seed=None):
+        self.config = config
+        self.bestSchedule = None
+        self.evaluations = 0             # Schedules actually scored
+        self._stop_requested = False
+        
+        # Each solve has its own RNG, so concurrent solves stay independent and reproducible
+        self.rng = random.Random(seed)
+
+    def _apply_params(self, params):
+        """Overrides for the UPPERCASE parameters defined so far."""
+        ApplyParams(self, params)
+
+    def RequestStop(self):
+        """Asks Run() to return the best schedule so far at the next iteration (thread-safe)."""
+        self._stop_requested = True
+
+    def GetIterationLimit(self):
+        """Largest iteration number Run() passes to its progress callback."""
+        raise NotImplementedError
+
+    def Run(self, progress=None):
+        raise NotImplementedError
+
+    def Shutdown(self):
+        """Releases helper processes or pools, if the solver uses any."""
+        pass
+
+    def _finish(self):
+        """Prints the best schedule and returns a copy of it."""
+        self.Shutdown()
+        self._print_best_schedule()
+        return copy.deepcopy(self.bestSchedule)
+
+    def _print_statistics(self):
+        print(f"Evaluations: {self.evaluations}")
+
+    def _print_best_schedule(self):
+        if self.bestSchedule is None:
+            print("No schedule found.")
+            return
+
+        # bestSchedule is a scored copy; its fitness and hard_ratio are already stored
+        print(f"\n--- Final Best Timetable (Fitness: {self.bestSchedule.fitness:.4f}) ---")
+        
+        # PRINT THE FINAL HARD CONSTRAINT SCORE
+        print(f"Hard Constraint Score (Ratio): {self.bestSchedule.hard_ratio:.4f} ({self.bestSchedule.total_hard_score:.1f}/{self.bestSchedule.max_hard_score:.1f})")
+        self._print_statistics()
+        print("------------------------------------------------------------------")
+        
+        rooms = list(self.config.GetRooms().values()) 
+        num_rooms = self.config.GetNumberOfRooms()
+        
+        DAY_HOURS = Schedule.DAY_HOURS
+        START_HOUR = Schedule.START_CLOCK_HOUR 
+        DAYS_PER_WEEK = Schedule.DAYS_PER_WEEK
+        
+        daySize = num_rooms * DAY_HOURS
+        
+        if num_rooms == 0 or daySize == 0:
+            print("Cannot print schedule: No rooms or time slots available.")
+            return
+            
+        sorted_classes = sorted(self.bestSchedule.classes.items(), key=lambda item: item[1])
+        
+        for class_id, pos in sorted_classes:
+            cc = self.config.GetCourseClasses().get(class_id)
+            if not cc: continue
+            
+            day = pos // daySize
+            time_room = pos % daySize
+            
+            if DAY_HOURS == 0: continue
+            room_index = time_room // DAY_HOURS
+            time = time_room % DAY_HOURS
+            
+            if room_index < len(rooms):
+                room = rooms[room_index]
+            else:
+                continue 
+            
+            day_name = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"][day % DAYS_PER_WEEK]
+            start_clock_hour = START_HOUR + time
+            
+            if start_clock_hour >= 12 and start_clock_hour < 13:
+                time_display = "12:00 PM"
+            elif start_clock_hour >= 13:
+                time_display = f"{start_clock_hour - 12}:00 PM"
+            else:
+                time_display = f"{start_clock_hour}:00 AM"
+
+            class_type = " (Lab)" if cc.IsLabRequired() else " (Theory)"
+            
+            print(f"[{day_name}, {time_display}] R:{room.GetName()} | {cc.GetCourse().GetName()}{class_type} for {cc.GetGroup().GetName()} (Prof: {cc.GetProfessor().GetName()}, Duration: {cc.GetDuration()})")
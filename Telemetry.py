@@ -0,0 +1,113 @@
+# Telemetry.py
+
+import csv
+import json
+import operator
+import os
+
+# Fields of a per-generation record, in CSV column order
+FIELDS = (
+    "generation", "elapsed", "evaluations", "evals_per_sec",
+    "best_fitness", "mean_fitness", "worst_fitness", "hard_ratio",
+    "prof_penalty", "gap_penalty", "consecutive_penalty", "lunch_penalty",
+    "late_long_penalty", "same_subject_penalty", "diversity",
+    "mutation_size", "mutation_prob", "crossover_prob", "success_rate",
+)
+
+
+def Diversity(population, best):
+    """Mean share of genes (class positions) in which an individual differs from best (0: converged)."""
+    if not population:
+        return 0.0
+    reference = best.classes.genes
+    differing = sum(sum(map(operator.ne, s.classes.genes, reference)) for s in population)
+    return differing / (len(population) * max(1, len(reference)))
+
+
+def _drop_records_after(filename, generation, record_generation, header_lines=0):
+    """
+    Removes the records of generations after generation from an existing file: a resumed run
+    writes them again from its checkpoint. Lines record_generation cannot parse (cut short by
+    the crash) are dropped too.
+    """
+    if not os.path.exists(filename):
+        return
+    with open(filename, newline="") as f:
+        lines = f.readlines()
+
+    kept = lines[:header_lines]
+    for line in lines[header_lines:]:
+        try:
+            if record_generation(line) <= generation:
+                kept.append(line)
+        except (ValueError, KeyError):
+            pass
+    if len(kept) != len(lines):
+        with open(filename, "w", newline="") as f:
+            f.writelines(kept)
+
+
+class TelemetrySink:
+    """Receives one record (a dict with FIELDS) per sampled generation."""
+
+    def Write(self, record):
+        raise NotImplementedError
+
+    def Close(self):
+        pass
+
+
+class ConsoleSink(TelemetrySink):
+    """The classic 'Generation N: Fittest Score = ...' status line."""
+
+    def Write(self, record):
+        print(f"Generation {record['generation']}: Fittest Score = {record['best_fitness']:.4f}")
+
+
+class JsonlSink(TelemetrySink):
+    """One JSON object per line. With resume_after, the file is continued after that generation."""
+
+    def __init__(self, filename, resume_after=None):
+        if resume_after is not None:
+            _drop_records_after(filename, resume_after, lambda line: json.loads(line)["generation"])
+        self.file = open(filename, "w" if resume_after is None else "a")
+
+    def Write(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def Close(self):
+        self.file.close()
+
+
+class CsvSink(TelemetrySink):
+    """A header row with FIELDS, then one row per record. With resume_after, the file is continued after that generation."""
+
+    def __init__(self, filename, resume_after=None):
+        if resume_after is not None:
+            # generation is the first column
+            _drop_records_after(filename, resume_after, lambda line: int(line.split(",", 1)[0]), header_lines=1)
+        new_file = resume_after is None or not os.path.exists(filename) or os.path.getsize(filename) == 0
+        self.file = open(filename, "w" if resume_after is None else "a", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=FIELDS)
+        if new_file:
+            self.writer.writeheader()
+
+    def Write(self, record):
+        self.writer.writerow(record)
+        self.file.flush()
+
+    def Close(self):
+        self.file.close()
+
+
+def OpenFileSink(filename, resume_after=None):
+    """
+    JsonlSink or CsvSink, chosen by the file extension (.jsonl / .csv). A new file unless
+    resume_after is given: then the records up to that generation are kept and new ones appended.
+    """
+    if filename.endswith(".csv"):
+        return CsvSink(filename, resume_after)
+    if filename.endswith(".jsonl"):
+        return JsonlSink(filename, resume_after)
+    raise ValueError(f"Unknown telemetry file type (use .jsonl or .csv): {filename}")
@@ -0,0 +1,90 @@
+# Termination.py
+
+import time
+
+from Schedule import Schedule
+
+
+class TerminationPolicy:
+    """
+    Decides when a run should stop early. Start() is called when the run begins; Check() after
+    every iteration with the best schedule so far, returning the reason to stop or None.
+    """
+
+    def Start(self):
+        pass
+
+    def Check(self, iteration, best):
+        raise NotImplementedError
+
+
+class Deadline(TerminationPolicy):
+    """Stops once `seconds` of wall-clock time have passed since the run started."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.started = None
+
+    def Start(self):
+        self.started = time.monotonic()
+
+    def Check(self, iteration, best):
+        if time.monotonic() - self.started >= self.seconds:
+            return "Time Limit Reached"
+        return None
+
+
+class Stagnation(TerminationPolicy):
+    """Stops after `limit` iterations in a row without a better best fitness."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.best_fitness = None
+        self.since = 0
+
+    def Start(self):
+        self.best_fitness = None
+        self.since = 0
+
+    def Check(self, iteration, best):
+        if self.best_fitness is None or best.fitness > self.best_fitness:
+            self.best_fitness = best.fitness
+            self.since = iteration
+            return None
+        if iteration - self.since >= self.limit:
+            return f"No Improvement in {self.limit} Generations"
+        return None
+
+
+class TargetQuality(TerminationPolicy):
+    """
+    Stops once the best schedule reaches hard_ratio and its soft score (fitness minus hard ratio)
+    is within soft_tolerance of the maximum soft score.
+    """
+
+    # Highest soft score: every soft constraint fully satisfied
+    MAX_SOFT_SCORE = (Schedule.PROF_LOAD_WEIGHT + Schedule.GROUP_GAP_WEIGHT + Schedule.PROF_CONSECUTIVE_WEIGHT
+                      + Schedule.LUNCH_BREAK_WEIGHT + Schedule.LATE_LONG_CLASS_WEIGHT
+                      + Schedule.SAME_SUBJECT_CONSECUTIVE_WEIGHT)
+
+    def __init__(self, hard_ratio, soft_tolerance):
+        self.hard_ratio = hard_ratio
+        self.soft_tolerance = soft_tolerance
+
+    def Check(self, iteration, best):
+        soft_score = best.fitness - best.hard_ratio
+        if best.hard_ratio >= self.hard_ratio and soft_score >= self.MAX_SOFT_SCORE - self.soft_tolerance - 1e-9:
+            return "Target Quality Reached"
+        return None
+
+
+class CancelToken(TerminationPolicy):
+    """Stops when an external token (anything with is_set(), e.g. threading.Event) is set."""
+
+    def __init__(self, token):
+        self.token = token
+
+    def Check(self, iteration, best):
+        if self.token.is_set():
+            return "Cancelled"
+        return None
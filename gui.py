@@ -2,18 +2,19 @@
 
 import sys
 import copy 
+import time
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTableWidget, QTableWidgetItem, 
-    QAction, QFileDialog, QMessageBox, QVBoxLayout, QAbstractItemView,
-    QLabel, QTabWidget, QHBoxLayout, QHeaderView
+    QAction, QActionGroup, QFileDialog, QMessageBox, QVBoxLayout, QAbstractItemView,
+    QLabel, QTabWidget, QHBoxLayout, QHeaderView, QProgressBar, QPushButton
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QColor
 
 # Import core logic
 try:
     from Configuration import Configuration
-    from Algorithm import Algorithm 
+    from Solver import SOLVERS, CreateSolver
     from Schedule import Schedule 
 except ImportError as e:
     # A standard Python environment may not have these modules.
@@ -23,6 +24,64 @@ except ImportError as e:
     sys.exit(1)
 
 
+class SolverThread(QThread):
+    """
+    Runs a solver (see Solver.SOLVERS) off the GUI thread. Progress is reported through signals (delivered
+    to the window on its own thread); copies of the current best schedule are sent at most
+    once per REDRAW_INTERVAL seconds, and only when it improved.
+    """
+
+    REDRAW_INTERVAL = 1.0
+
+    progress = pyqtSignal(int, int, float, float)   # iteration, iteration limit, best fitness, hard ratio
+    bestChanged = pyqtSignal(object)                # copy of the current best Schedule
+    solved = pyqtSignal(object, bool)               # final best Schedule (None if cancelled), stopped early
+    failed = pyqtSignal(str)
+
+    def __init__(self, config, solver_name="ga", parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.solver_name = solver_name
+        self.algorithm = None
+        self._cancelled = False
+        self._stop_requested = False
+        self._last_redraw = 0.0
+        self._last_fitness = None
+
+    def cancel(self):
+        """Stops the solve and discards its result."""
+        self._cancelled = True
+        self.stopAndKeepBest()
+
+    def stopAndKeepBest(self):
+        """Stops the solve after the current iteration and reports the best schedule so far."""
+        self._stop_requested = True
+        if self.algorithm is not None:
+            self.algorithm.RequestStop()
+
+    def run(self):
+        try:
+            self.algorithm = CreateSolver(self.solver_name, self.config)
+            # A stop requested while the solver was being built
+            if self._stop_requested:
+                self.algorithm.RequestStop()
+            best_result = self.algorithm.Run(progress=self._on_iteration)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+
+        self.solved.emit(None if self._cancelled else best_result, self._stop_requested)
+
+    def _on_iteration(self, iteration, best):
+        self.progress.emit(iteration, self.algorithm.GetIterationLimit(), best.fitness, best.hard_ratio)
+
+        now = time.monotonic()
+        if now - self._last_redraw >= self.REDRAW_INTERVAL and best.fitness != self._last_fitness:
+            self._last_redraw = now
+            self._last_fitness = best.fitness
+            self.bestChanged.emit(copy.deepcopy(best))
+
+
 class Example(QMainWindow):
     PROF_COLORS = [
         QColor(255, 153, 153), QColor(153, 255, 153), QColor(153, 153, 255), 
@@ -37,11 +96,18 @@ class Example(QMainWindow):
         'YELLOW': QColor(255, 255, 150)
     }
 
+    # Progress bar text per solver (iterations are generations for the GA, moves for SA,
+    # placements for exact search)
+    PROGRESS_FORMATS = {"ga": "Generation %v/%m", "sa": "Step %v/%m", "exact": "Node %v/%m", "islands": "Generation %v/%m"}
+
     def __init__(self, config_instance):
         super().__init__()
         self.config = config_instance
         self.best_chromosome = None
         self.is_solved = False
+        self.solver = None
+        self.solver_name = "ga"
+        self._previous_solution = None
         
         self.START_HOUR = 8  
         self.DAY_HOURS = 10 
@@ -54,7 +120,7 @@ class Example(QMainWindow):
         self.initUI()
 
     def initUI(self):
-        self.setWindowTitle('Simplified Timetable - Genetic Algorithm')
+        self.setWindowTitle('Simplified Timetable')
         self.setGeometry(100, 100, 1400, 700) 
 
         self.central_widget = QWidget()
@@ -78,7 +144,24 @@ class Example(QMainWindow):
         self.validation_layout.addWidget(self.validationTable)
         self.tab_widget.addTab(self.validation_widget, "Session Tally & Validation")
 
+        # Solver progress row (only active while a solve is running)
+        self.progress_layout = QHBoxLayout()
+        self.progressBar = QProgressBar()
+        self.progressBar.setFormat("Generation %v/%m")
+        self.progressBar.setValue(0)
+        self.progressLabel = QLabel("Idle")
+        self.stopButton = QPushButton("Stop && Keep Best")
+        self.stopButton.clicked.connect(self.stopSolve)
+        self.cancelButton = QPushButton("Cancel")
+        self.cancelButton.clicked.connect(self.cancelSolve)
+        self.progress_layout.addWidget(self.progressBar, 1)
+        self.progress_layout.addWidget(self.progressLabel)
+        self.progress_layout.addWidget(self.stopButton)
+        self.progress_layout.addWidget(self.cancelButton)
+        self.main_layout.addLayout(self.progress_layout)
+
         self.createMenus()
+        self.setSolving(False)
         # Ensure validation data is initialized before drawing
         self.validation_data = self.config.GenerateCourseRequirementsTable()
         self.drawValidationTable()
@@ -88,18 +171,31 @@ class Example(QMainWindow):
     def createMenus(self):
         fileMenu = self.menuBar().addMenu('File')
         
-        loadAction = QAction('Load Config...', self)
-        loadAction.triggered.connect(self.showDialog)
-        fileMenu.addAction(loadAction)
+        self.loadAction = QAction('Load Config...', self)
+        self.loadAction.triggered.connect(self.showDialog)
+        fileMenu.addAction(self.loadAction)
         
         exitAction = QAction('Exit', self)
         exitAction.triggered.connect(self.close)
         fileMenu.addAction(exitAction)
 
         viewMenu = self.menuBar().addMenu('View')
-        solveAction = QAction('Generate Timetable', self)
-        solveAction.triggered.connect(self.solveSchedule)
-        viewMenu.addAction(solveAction)
+        self.solveAction = QAction('Generate Timetable', self)
+        self.solveAction.triggered.connect(self.solveSchedule)
+        viewMenu.addAction(self.solveAction)
+
+        # One checkable entry per registered solver; the choice applies to the next solve
+        self.solverMenu = self.menuBar().addMenu('Solver')
+        self.solverGroup = QActionGroup(self)
+        for name, title in SOLVERS.items():
+            action = QAction(title, self, checkable=True)
+            action.setChecked(name == self.solver_name)
+            action.triggered.connect(lambda checked, name=name: self.setSolverName(name))
+            self.solverGroup.addAction(action)
+            self.solverMenu.addAction(action)
+
+    def setSolverName(self, name):
+        self.solver_name = name
 
     def drawTimetable(self):
         times = []
@@ -291,7 +387,7 @@ class Example(QMainWindow):
         
         if fname:
             try:
-                config_instance = Configuration.getInstance()
+                config_instance = self.config
                 config_instance.ReadConfiguration(fname) 
                 
                 self.config = config_instance
@@ -315,32 +411,95 @@ class Example(QMainWindow):
         if not self.config or len(self.config.GetCourseClasses()) == 0: 
             QMessageBox.warning(self, "Warning", "Configuration not loaded or has no classes.")
             return
+        if self.solver is not None:
+            return
             
-        try:
-            # Use consistent parameters for Algorithm initialization if needed,
-            # but for simplicity, we rely on the default constructor here.
-            algorithm = Algorithm(self.config) 
-            best_result = algorithm.Run() 
-                    
-            final_fitness = getattr(best_result, 'fitness', 0.0)
-            
-            if best_result is not None and final_fitness >= 1.5: # Use a reasonable threshold
-                self.best_chromosome = copy.deepcopy(best_result)
-                self.is_solved = True
-                QMessageBox.information(self, "Success", f"Timetable generated! Fittest Score: {final_fitness:.4f}")
-            else:
-                self.best_chromosome = None
-                self.is_solved = False
-                QMessageBox.warning(self, "Failure", f"Genetic Algorithm failed. Fittest Score: {final_fitness:.4f}. Check constraints/input.cfg.")
-            
-            self.updateScheduledTally(self.best_chromosome)
+        # The solve runs on a worker thread; the window stays responsive and shows live progress.
+        # The shown timetable is restored if the solve is cancelled.
+        self._previous_solution = (self.best_chromosome, self.is_solved)
+        self.solver = SolverThread(self.config, self.solver_name, self)
+        self.solver.progress.connect(self.onSolveProgress)
+        self.solver.bestChanged.connect(self.onBestChanged)
+        self.solver.solved.connect(self.onSolveFinished)
+        self.solver.failed.connect(self.onSolveFailed)
+        self.solver.finished.connect(self.onSolverThreadFinished)
+        
+        self.progressBar.setFormat(self.PROGRESS_FORMATS.get(self.solver_name, "%v/%m"))
+        self.progressBar.setValue(0)
+        self.progressLabel.setText(f"Starting {SOLVERS[self.solver_name]}...")
+        self.setSolving(True)
+        self.solver.start()
+
+    def stopSolve(self):
+        if self.solver is not None:
+            self.progressLabel.setText("Stopping...")
+            self.solver.stopAndKeepBest()
+
+    def cancelSolve(self):
+        if self.solver is not None:
+            self.progressLabel.setText("Cancelling...")
+            self.solver.cancel()
+
+    def setSolving(self, solving):
+        self.solveAction.setEnabled(not solving)
+        self.loadAction.setEnabled(not solving)
+        self.solverMenu.setEnabled(not solving)
+        self.stopButton.setEnabled(solving)
+        self.cancelButton.setEnabled(solving)
+
+    def onSolveProgress(self, iteration, max_iterations, fitness, hard_ratio):
+        self.progressBar.setMaximum(max_iterations)
+        self.progressBar.setValue(iteration)
+        self.progressLabel.setText(f"Fittest Score: {fitness:.4f} | Hard Ratio: {hard_ratio:.4f}")
+
+    def onBestChanged(self, schedule):
+        # Throttled by SolverThread; the validation tally is only updated with the final result
+        self.best_chromosome = schedule
+        self.is_solved = True
+        self.drawTimetable()
+
+    def onSolveFinished(self, best_result, stopped):
+        if best_result is None:
+            self.best_chromosome, self.is_solved = self._previous_solution
+            self.progressLabel.setText("Cancelled")
             self.drawTimetable()
-            self.drawValidationTable()
+            return
             
-        except Exception as e:
-            QMessageBox.critical(self, "Algorithm Error", f"An error occurred during algorithm execution:\n{e}")
-            # Do not re-raise the exception if running in a GUI context unless necessary
-            # raise 
+        final_fitness = getattr(best_result, 'fitness', 0.0)
+        outcome = "stopped early" if stopped else "generated"
+        
+        if final_fitness >= 1.5: # Use a reasonable threshold
+            self.best_chromosome = best_result
+            self.is_solved = True
+            self.progressLabel.setText(f"Done. Fittest Score: {final_fitness:.4f}")
+            QMessageBox.information(self, "Success", f"Timetable {outcome}! Fittest Score: {final_fitness:.4f}")
+        else:
+            self.best_chromosome = None
+            self.is_solved = False
+            self.progressLabel.setText(f"Failed. Fittest Score: {final_fitness:.4f}")
+            QMessageBox.warning(self, "Failure", f"{SOLVERS[self.solver_name]} failed ({outcome}). Fittest Score: {final_fitness:.4f}. Check constraints/input.cfg.")
+        
+        self.updateScheduledTally(self.best_chromosome)
+        self.drawTimetable()
+        self.drawValidationTable()
+
+    def onSolveFailed(self, message):
+        self.best_chromosome, self.is_solved = self._previous_solution
+        self.progressLabel.setText("Error")
+        self.drawTimetable()
+        QMessageBox.critical(self, "Algorithm Error", f"An error occurred during algorithm execution:\n{message}")
+
+    def onSolverThreadFinished(self):
+        self.solver.deleteLater()
+        self.solver = None
+        self.setSolving(False)
+
+    def closeEvent(self, event):
+        # Do not destroy the window under a running solve
+        if self.solver is not None:
+            self.solver.cancel()
+            self.solver.wait()
+        super().closeEvent(event)
 
     def updateScheduledTally(self, schedule):
         if schedule is None:
@@ -394,7 +553,7 @@ if __name__ == '__main__':
     config_instance = None
     
     try:
-        # Configuration is initialized as a Singleton
+        # The startup configuration also becomes the default instance
         config_instance = Configuration(default_file) 
         
         # Manually trigger the initial read for display at startup, 
@@ -0,0 +1,70 @@
+# test_annealing.py
+
+import contextlib
+import io
+import os
+import random
+import unittest
+
+from Configuration import Configuration
+from Schedule import Schedule
+from SimulatedAnnealing import SimulatedAnnealing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class SimulatedAnnealingTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        filename = os.path.join(ROOT, "input.cfg")
+        cls.config = Configuration(filename)
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.config.ReadConfiguration(filename, use_snapshot=False)
+
+    def _solver(self, **params):
+        params.setdefault("MAX_STEPS", 2000)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return SimulatedAnnealing(self.config, seed=3, params=params)
+
+    def _full_record(self, schedule):
+        full = Schedule(0, 1, 0.0, 1.0, config=self.config, rng=random.Random(0))
+        full.classes = schedule.classes.copy()
+        full.CalculateFitness()
+        return full.GetFitnessRecord()
+
+    def test_undo_restores_genes_and_score(self):
+        solver = self._solver()
+        for _ in range(300):
+            genes = solver.current.classes.genes[:]
+            record = solver.current.GetFitnessRecord()
+            result = solver._step()
+            if result is None:
+                continue
+            delta, moved = result
+            self.assertEqual(len(moved), sum(a != b for a, b in zip(genes, solver.current.classes.genes)))
+            self.assertEqual(solver.current.GetFitnessRecord(), self._full_record(solver.current))
+            solver._undo(moved)
+            self.assertEqual(solver.current.classes.genes, genes)
+            self.assertEqual(solver.current.GetFitnessRecord(), record)
+
+    def test_run_reaches_goal_reproducibly(self):
+        results = []
+        for _ in range(2):
+            solver = self._solver(MAX_STEPS=5000)
+            with contextlib.redirect_stdout(io.StringIO()):
+                best = solver.Run()
+            self.assertEqual(solver.current.GetFitnessRecord(), self._full_record(solver.current))
+            results.append((best.fitness, best.classes.genes.tobytes(), solver.accepted, solver.evaluations))
+        self.assertEqual(results[0], results[1])
+        self.assertGreaterEqual(results[0][0], solver.GOAL_FITNESS)
+
+    def test_pending_moves_need_delta_evaluation(self):
+        schedule = Schedule(0, 1, 0.0, 1.0, config=self.config, rng=random.Random(0)).MakeNewFromPrototype()
+        schedule.CalculateFitness()
+        with self.assertRaises(ValueError):
+            schedule.GetPendingMoves()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# test_checkpoint.py
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+from Algorithm import Algorithm
+from Checkpoint import Checkpoint
+from Configuration import Configuration
+from InstanceGenerator import InstanceGenerator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ResumeTest(unittest.TestCase):
+    """A run stopped at a checkpoint and resumed must end exactly where an uninterrupted run ends."""
+
+    GENERATIONS = 30
+    STOP_AFTER = 17 # Not a multiple of CHECKPOINT_INTERVAL: the final generation is saved too
+
+    @classmethod
+    def setUpClass(cls):
+        cls._directory = tempfile.TemporaryDirectory()
+        filename = os.path.join(cls._directory.name, "generated.cfg")
+        InstanceGenerator(7, {"CLASSES": 80, "TIGHTNESS": 0.7}).Write(filename)
+        cls.config = cls._load(filename)
+        cls.small_config = cls._load(os.path.join(ROOT, "input.cfg"))
+
+    @staticmethod
+    def _load(filename):
+        config = Configuration(filename)
+        with contextlib.redirect_stdout(io.StringIO()):
+            config.ReadConfiguration(filename, use_snapshot=False)
+        return config
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._directory.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self._directory.name, name)
+
+    def _runs(self, params, telemetry=(None, None), config=None):
+        """
+        Returns (uninterrupted run, stopped-and-resumed run) for the same seed and parameters.
+        telemetry names the TELEMETRY_FILE of each run; config defaults to the generated instance.
+        """
+        config = config or self.config
+        params = dict(params, POP_SIZE=40, GOAL_FITNESS=99, TELEMETRY_CONSOLE=False)
+        checkpoint = self._path("run.ckpt")
+        with contextlib.redirect_stdout(io.StringIO()):
+            full = Algorithm(config, seed=5, params=dict(params, MAX_GENERATIONS=self.GENERATIONS,
+                                                         TELEMETRY_FILE=telemetry[0]))
+            full.Run()
+            Algorithm(config, seed=5, params=dict(params, MAX_GENERATIONS=self.STOP_AFTER,
+                                                  TELEMETRY_FILE=telemetry[1],
+                                                  CHECKPOINT_FILE=checkpoint, CHECKPOINT_INTERVAL=5)).Run()
+            resumed = Algorithm.Resume(config, checkpoint, {"MAX_GENERATIONS": self.GENERATIONS})
+            self.assertEqual(resumed.generation, self.STOP_AFTER)
+            resumed.Run()
+        self.assertFalse(os.path.exists(checkpoint + ".tmp"))
+        return full, resumed
+
+    @staticmethod
+    def _state(algorithm):
+        return ([s.classes.genes.tobytes() for s in algorithm.population],
+                [s.fitness for s in algorithm.population],
+                algorithm.bestSchedule.fitness, algorithm.evaluations, algorithm.rng.random())
+
+    def test_resume_is_exact(self):
+        for params in ({}, {"DELTA_EVALUATION": True}, {"DELTA_EVALUATION": True, "ADAPTIVE_RATES": True}):
+            with self.subTest(**params):
+                full, resumed = self._runs(params)
+                self.assertEqual(self._state(resumed), self._state(full))
+
+    def test_resume_restores_fitness_cache(self):
+        # One-class uniform mutations on a small instance recreate seen chromosomes, so the cache hits
+        params = {"FITNESS_CACHE_SIZE": 1000, "MUTATION_SIZE": 1, "UNIFORM_MUTATION_PROB": 1.0}
+        full, resumed = self._runs(params, config=self.small_config)
+        self.assertGreater(full.fitness_cache.hits, 0)
+        self.assertEqual(self._state(resumed), self._state(full))
+        self.assertEqual(resumed.fitness_cache.Stats(), full.fitness_cache.Stats())
+
+    def test_resume_continues_telemetry(self):
+        full_log, resumed_log = self._path("full.csv"), self._path("resumed.csv")
+        self._runs({"DELTA_EVALUATION": True}, (full_log, resumed_log))
+
+        def records(filename):
+            with open(filename, newline="") as f:
+                return [(row["generation"], row["best_fitness"]) for row in csv.DictReader(f)]
+
+        self.assertEqual([int(g) for g, _ in records(resumed_log)], list(range(1, self.GENERATIONS + 1)))
+        with open(resumed_log) as f:
+            self.assertEqual(f.read().count("generation"), 1) # One header, no restart
+        self.assertEqual(records(resumed_log), records(full_log))
+
+
+class CheckpointFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.filename = os.path.join(self._directory.name, "state.ckpt")
+
+    def test_round_trip(self):
+        state = {"generation": 3, "genes": [1, 2, 3]}
+        Checkpoint.Write(state, self.filename)
+        self.assertEqual(Checkpoint.Read(self.filename), state)
+
+    def test_rejects_foreign_and_newer_files(self):
+        with open(self.filename, "wb") as f:
+            f.write(b"not a checkpoint")
+        with self.assertRaisesRegex(ValueError, "Not a checkpoint file"):
+            Checkpoint.Read(self.filename)
+        with open(self.filename, "wb") as f:
+            f.write(Checkpoint.MAGIC + bytes([Checkpoint.VERSION + 1]) + b"x")
+        with self.assertRaisesRegex(ValueError, "Unsupported checkpoint version"):
+            Checkpoint.Read(self.filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+# test_configuration.py
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Configuration import Configuration, ConfigurationError
+
+VALID = """\
+# Forward references are allowed: the class comes first
+#class
+    professor = 1
+    course = 1
+    duration = 2
+    group = 1
+    lab = yes
+#end
+#prof
+    id = 1
+    name = Bailke
+#end
+#course
+    id = 1
+    name = DAA
+#end
+#room
+    name = Lab-1
+    size = 60
+    lab = true
+#end
+#group
+    name = SE-A
+    size = 30
+#end
+"""
+APPENDED = VALID.count("\n") + 1 # First line of text added after VALID
+
+
+class ConfigurationParserTest(unittest.TestCase):
+    """Malformed files must raise ConfigurationError at the offending line and keep the loaded data."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _read(self, text, config=None):
+        filename = os.path.join(self._directory.name, "instance.cfg")
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(text)
+        config = config or Configuration(filename)
+        with contextlib.redirect_stdout(io.StringIO()):
+            config.ReadConfiguration(filename, use_snapshot=False)
+        return config
+
+    def _assert_error(self, text, line, fragment):
+        with self.assertRaises(ConfigurationError) as raised:
+            self._read(text)
+        self.assertEqual(raised.exception.line, line)
+        self.assertTrue(raised.exception.filename.endswith("instance.cfg"))
+        self.assertIn(fragment, str(raised.exception))
+        self.assertIn(f"instance.cfg:{line}: ", str(raised.exception))
+
+    def test_valid_file(self):
+        config = self._read(VALID)
+        self.assertEqual(len(config.GetCourseClasses()), 1)
+        course_class = config.GetCourseClasses()[1]
+        self.assertEqual(course_class.GetDuration(), 2)
+        self.assertTrue(course_class.IsLabRequired())
+        group = config.GetGroups()[1]
+        self.assertEqual((group.GetAvailableStartTime(), group.GetAvailableEndTime()), (8, 18))
+
+    def test_block_errors(self):
+        self._assert_error(VALID + "#end\n", APPENDED, "'#end' without an open block")
+        self._assert_error(VALID + "#teacher\n", APPENDED, "unknown block type '#teacher'")
+        self._assert_error(VALID.replace("#end\n#prof", "#prof", 1), 8, "'#prof' opened before '#end' of #class (line 2)")
+        self._assert_error(VALID + "#prof\n    id = 2\n", APPENDED, "#prof block is not closed with '#end'")
+        self._assert_error(VALID + "stray\n", APPENDED, "'stray' is outside of a block")
+
+    def test_field_errors(self):
+        self._assert_error(VALID.replace("duration = 2", "duration 2"), 5, "expected 'key = value'")
+        self._assert_error(VALID.replace("duration = 2", "length = 2"), 5, "unknown field 'length' in #class block")
+        self._assert_error(VALID.replace("group = 1", "group = 1\n    group = 2"), 7, "duplicate field 'group'")
+        self._assert_error(VALID.replace("duration = 2", "duration = two"), 5, "invalid value for 'duration'")
+        self._assert_error(VALID.replace("lab = yes", "lab = maybe"), 7, "expected true/false, got 'maybe'")
+        self._assert_error(VALID.replace("    name = Bailke\n", ""), 9, "#prof block is missing 'name'")
+
+    def test_value_errors(self):
+        self._assert_error(VALID + "#prof\n    id = 1\n    name = Joshi\n#end\n", APPENDED, "duplicate professor id 1")
+        self._assert_error(VALID.replace("size = 60", "size = 0"), 17, "room size must be positive")
+        self._assert_error(VALID.replace("size = 30", "size = 30\n    start = 18"), 22, "start must be before end")
+        self._assert_error(VALID.replace("duration = 2", "duration = 0"), 2, "class duration must be positive")
+
+    def test_reference_errors(self):
+        self._assert_error(VALID.replace("professor = 1", "professor = 9"), 2, "unknown professor 9")
+        self._assert_error(VALID.replace("course = 1", "course = 9"), 2, "unknown course 9")
+        self._assert_error(VALID.replace("group = 1", "group = 9"), 2, "unknown group 9")
+        self._assert_error(VALID + VALID.split("#prof")[0].replace("#class", "#class\n    id = 1", 1), APPENDED + 1,
+                           "duplicate class id 1")
+
+    def test_failed_load_keeps_previous_data(self):
+        config = self._read(VALID)
+        classes = config.GetCourseClasses()
+        with self.assertRaises(ConfigurationError):
+            self._read(VALID.replace("course = 1", "course = 9"), config)
+        self.assertIs(config.GetCourseClasses(), classes)
+        self.assertEqual(len(config.GetProfessors()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+# test_exact.py
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from BacktrackingSolver import BacktrackingSolver
+from Configuration import Configuration
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _single_group(classes, start, end, duration, rooms=1, lab_classes=0):
+    """One professor and one group (window start-end) with identical classes, in .cfg format."""
+    blocks = ["#prof\n id = 1\n name = P1\n#end", "#course\n id = 1\n name = C1\n#end",
+              f"#group\n id = 1\n name = G1\n size = 30\n start = {start}\n end = {end}\n#end",
+              "#room\n name = L1\n size = 60\n lab = true\n#end"]
+    blocks += [f"#room\n name = R{r}\n size = 60\n#end" for r in range(rooms)]
+    blocks += [f"#class\n professor = 1\n course = 1\n duration = {duration}\n group = 1\n lab = {i < lab_classes}\n#end"
+               for i in range(classes)]
+    return "\n".join(blocks) + "\n"
+
+
+class BacktrackingSolverTest(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+
+    def _solve(self, text=None, filename=None, **params):
+        if filename is None:
+            filename = os.path.join(self._directory.name, "instance.cfg")
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(text)
+        config = Configuration(filename)
+        with contextlib.redirect_stdout(io.StringIO()):
+            config.ReadConfiguration(filename, use_snapshot=False)
+            solver = BacktrackingSolver(config, seed=1, params=params)
+            best = solver.Run()
+        return solver, best
+
+    def test_feasible_instance(self):
+        solver, best = self._solve(filename=os.path.join(ROOT, "input.cfg"))
+        self.assertFalse(solver.infeasible)
+        self.assertEqual(best.hard_ratio, 1.0)
+
+    def test_overbooked_group_is_rejected_before_search(self):
+        # 11 one-hour classes, 2 hours a day for 5 days
+        solver, best = self._solve(_single_group(11, 8, 10, 1, rooms=2))
+        self.assertTrue(solver.infeasible)
+        self.assertIn("needs 11 hours a week, its classes fit in 10", solver.infeasible_reason)
+        self.assertEqual(solver.nodes, 0)
+        self.assertLess(best.hard_ratio, 1.0)
+
+    def test_overbooked_rooms_are_rejected_before_search(self):
+        # A second group keeps the groups within their windows; the single lab is over-booked
+        text = _single_group(6, 8, 10, 1, lab_classes=6) + "\n".join([
+            "#prof\n id = 2\n name = P2\n#end",
+            "#group\n id = 2\n name = G2\n size = 30\n start = 8\n end = 10\n#end"] +
+            ["#class\n professor = 2\n course = 1\n duration = 1\n group = 2\n lab = true\n#end"] * 5) + "\n"
+        solver, _ = self._solve(text)
+        self.assertTrue(solver.infeasible)
+        self.assertIn("rooms L1 are needed for 11 hours", solver.infeasible_reason)
+
+    def test_infeasible_instance_is_proven_by_search(self):
+        # 7 two-hour classes need 14 of the 15 window hours, but only one fits per 3-hour day
+        solver, _ = self._solve(_single_group(7, 8, 11, 2, rooms=3))
+        self.assertTrue(solver.infeasible)
+        self.assertIsNone(solver.infeasible_reason)
+        self.assertLess(solver.nodes, 10000)
+
+    def test_symmetry_breaking_keeps_solutions(self):
+        for rooms in (1, 3):
+            for symmetry_breaking in (True, False):
+                with self.subTest(rooms=rooms, symmetry_breaking=symmetry_breaking):
+                    solver, best = self._solve(_single_group(5, 8, 11, 2, rooms=rooms),
+                                               SYMMETRY_BREAKING=symmetry_breaking)
+                    self.assertFalse(solver.infeasible)
+                    self.assertEqual(best.hard_ratio, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
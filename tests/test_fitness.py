@@ -0,0 +1,121 @@
+# test_fitness.py
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from Configuration import Configuration
+from InstanceGenerator import InstanceGenerator
+from ParallelFitness import ParallelFitness
+from Schedule import Schedule
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load(filename):
+    config = Configuration(filename)
+    with contextlib.redirect_stdout(io.StringIO()):
+        config.ReadConfiguration(filename, use_snapshot=False)
+    return config
+
+
+class FitnessEquivalenceTest(unittest.TestCase):
+    """
+    Delta evaluation, a full re-evaluation and the batch/parallel evaluators must agree on
+    every fitness record after arbitrary Crossover, Mutation and MoveClass sequences.
+    """
+
+    STEPS = 150
+
+    @classmethod
+    def setUpClass(cls):
+        cls.configs = [_load(os.path.join(ROOT, "input.cfg"))]
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "generated.cfg")
+            InstanceGenerator(3, {"CLASSES": 60, "TIGHTNESS": 0.8}).Write(filename)
+            cls.configs.append(_load(filename))
+
+    def _random_offspring(self, config, rng):
+        """Yields delta-evaluated schedules produced by a seeded random operator sequence."""
+        prototype = Schedule(2, 4, 0.8, 0.8, True, 0.3, config=config, rng=rng)
+        tables = prototype.GetFitnessTables()
+        population = [prototype.MakeNewFromPrototype() for _ in range(6)]
+        for schedule in population:
+            schedule.CalculateFitness()
+
+        for _ in range(self.STEPS):
+            first, second = rng.sample(population, 2)
+            offspring = first.Crossover(second) if rng.random() < 0.5 else first.copy()
+            for _ in range(rng.randrange(4)):
+                if rng.random() < 0.5:
+                    offspring.Mutation()
+                else:
+                    # Positions past the last day are legal genes (unscheduled, hard-penalised)
+                    class_id = rng.choice(list(offspring.classes.keys()))
+                    offspring.MoveClass(class_id, rng.randrange(tables.days * tables.day_slots + 3))
+            offspring.CalculateFitness()
+            population[rng.randrange(len(population))] = offspring
+            yield offspring
+
+    def _full(self, schedule):
+        """A non-delta copy of the schedule's genes, evaluated from scratch."""
+        full = Schedule(2, 4, 0.8, 0.8, False, 0.3, config=schedule.config, rng=random.Random(0))
+        full.classes = schedule.classes.copy()
+        full.CalculateFitness()
+        return full
+
+    def test_delta_matches_full(self):
+        for config in self.configs:
+            for offspring in self._random_offspring(config, random.Random(11)):
+                full = self._full(offspring)
+                self.assertEqual(offspring.GetFitnessRecord(), full.GetFitnessRecord())
+                self.assertEqual(offspring.fitness, full.fitness)
+
+    def test_derived_occupancy_matches_rebuild(self):
+        rng = random.Random(5)
+        for config in self.configs:
+            for offspring in self._random_offspring(config, rng):
+                tables = offspring.GetFitnessTables()
+                offspring.Mutation()
+                state = offspring._fitness_state
+                if state is None:
+                    continue
+                skip = set(rng.sample(range(len(tables.class_ids)), 3))
+                self.assertEqual(state.GetOccupancy(offspring.classes.genes, offspring._changed, skip),
+                                 tables.GetOccupancy(offspring.classes.genes, skip))
+
+    def test_parallel_matches_serial(self):
+        for config in self.configs:
+            schedules = list(self._random_offspring(config, random.Random(13)))[::10]
+            expected = [s.GetFitnessRecord() for s in schedules]
+            copies = [s.copy() for s in schedules]
+            for schedule in copies:
+                schedule.MarkDirty()
+            evaluator = ParallelFitness(schedules[0].GetFitnessTables(), 2)
+            try:
+                evaluator.Evaluate(copies)
+            finally:
+                evaluator.Shutdown()
+            self.assertEqual([s.GetFitnessRecord() for s in copies], expected)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_batch_matches_serial(self):
+        from BatchFitness import BatchFitness
+        for config in self.configs:
+            schedules = list(self._random_offspring(config, random.Random(17)))[::10]
+            expected = [s.GetFitnessRecord() for s in schedules]
+            copies = [s.copy() for s in schedules]
+            BatchFitness(schedules[0].GetFitnessTables()).Evaluate(copies)
+            self.assertEqual([s.GetFitnessRecord() for s in copies], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+# test_islands.py
+
+import contextlib
+import io
+import os
+import unittest
+
+from Configuration import Configuration
+from Solver import CreateSolver
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class IslandModelTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        filename = os.path.join(ROOT, "input.cfg")
+        cls.config = Configuration(filename)
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.config.ReadConfiguration(filename, use_snapshot=False)
+
+    def _run(self, topology):
+        params = {"ISLANDS": 2, "MAX_GENERATIONS": 20, "MIGRATION_INTERVAL": 5, "TOPOLOGY": topology,
+                  "ISLAND_PARAMS": {"POP_SIZE": 20, "GOAL_FITNESS": 99, "TELEMETRY_CONSOLE": False}}
+        solver = CreateSolver("islands", self.config, seed=4, params=params)
+        with contextlib.redirect_stdout(io.StringIO()):
+            best = solver.Run()
+        return best.fitness, dict(best.classes), solver.evaluations
+
+    def test_seeded_runs_with_migration_are_reproducible(self):
+        for topology in ("ring", "full"):
+            with self.subTest(topology=topology):
+                self.assertEqual(self._run(topology), self._run(topology))
+
+
+if __name__ == "__main__":
+    unittest.main()